@@ -24,7 +24,7 @@ async def main():
         events = session.collect_domain_events()
         if events:
             print(f"Persisting {len(events)} events...")
-            await store.append(session.id, events, 0)
+            await store.append(session.id, events, await store.get_version(session.id))
 
     session.start()
     await persist()
@@ -0,0 +1,82 @@
+"""Tests for the prioritized, preemptible audio dispatcher."""
+import asyncio
+import time
+from src.application.audio_service.audio_dispatcher import AudioDispatcher
+from src.application.audio_service.dtos import SpeakResponse
+
+
+class SlowAudioService:
+    """Records what was started, finished and prefetched; every phrase takes `duration` to play."""
+    
+    def __init__(self, duration: float):
+        self.duration = duration
+        self.started = []
+        self.finished = []
+        self.prefetched = []
+    
+    async def speak(self, request):
+        self.started.append(request.text)
+        await asyncio.sleep(self.duration)
+        self.finished.append(request.text)
+        return SpeakResponse(success=True)
+    
+    async def prefetch(self, request):
+        self.prefetched.append(request.text)
+        return SpeakResponse(success=True)
+
+
+def test_submit_does_not_block_and_plays_by_priority():
+    audio = SlowAudioService(duration=0.05)
+    dispatcher = AudioDispatcher(audio, default_ttl=5.0)
+    
+    # Queued before the loop runs, so ordering is purely by priority
+    begin = time.monotonic()
+    dispatcher.submit("Jab - Cross", priority=3)
+    dispatcher.submit("Rest", priority=5)
+    dispatcher.submit("3", priority=10)
+    dispatcher.submit("3", priority=10)  # duplicate
+    assert time.monotonic() - begin < 0.05
+    
+    dispatcher.start()
+    assert dispatcher.wait_idle(2)
+    dispatcher.stop()
+    
+    assert audio.finished == ["3", "Rest", "Jab - Cross"]
+    assert dispatcher.dropped == 1
+    # The next phrase was synthesized while the previous one played
+    assert "Rest" in audio.prefetched
+
+
+def test_countdown_preempts_coaching_and_stale_phrases_are_dropped():
+    audio = SlowAudioService(duration=0.3)
+    dispatcher = AudioDispatcher(audio, default_ttl=0.1)
+    dispatcher.start()
+    
+    dispatcher.submit("Jab - Cross - Hook", priority=3)
+    time.sleep(0.05)
+    dispatcher.submit("Crossovers", priority=3)  # goes stale behind the countdown
+    dispatcher.submit("2", priority=10)
+    assert dispatcher.wait_idle(2)
+    dispatcher.stop()
+    
+    assert audio.started == ["Jab - Cross - Hook", "2"]
+    assert audio.finished == ["2"]
+    assert dispatcher.preempted == 1
+    assert dispatcher.dropped == 1
+
+
+def test_queue_is_bounded():
+    audio = SlowAudioService(duration=0)
+    dispatcher = AudioDispatcher(audio, max_queue=2, default_ttl=5.0)
+    
+    dispatcher.submit("a", priority=3)
+    dispatcher.submit("b", priority=3)
+    dispatcher.submit("c", priority=3)   # full of equally important phrases: dropped
+    dispatcher.submit("1", priority=10)  # evicts the least important, most recent ("b")
+    
+    dispatcher.start()
+    assert dispatcher.wait_idle(2)
+    dispatcher.stop()
+    
+    assert audio.finished == ["1", "a"]
+    assert dispatcher.dropped == 2
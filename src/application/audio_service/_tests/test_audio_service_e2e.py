@@ -5,7 +5,8 @@ from src.application.audio_service.dtos import (
     SpeakRequest,
     ConfigureAudioRequest,
     SpeakResponse,
-    AudioStatusResponse
+    AudioStatusResponse,
+    PrefetchBatchRequest
 )
 from src.infrastructure.audio.console_audio_service import ConsoleAudioService
 
@@ -137,3 +138,66 @@ class TestAudioServiceE2E:
         # Assert
         assert isinstance(response, SpeakResponse)
         assert response.success is True
+
+
+class _WarmingUpProvider(ConsoleAudioService):
+    """Console provider whose model is still loading."""
+    def __init__(self):
+        super().__init__()
+        self.ready = False
+
+    @property
+    def is_ready(self) -> bool:
+        return self.ready
+
+
+@pytest.mark.anyio
+async def test_status_reports_provider_readiness():
+    provider = _WarmingUpProvider()
+    service = AudioService(audio_provider=provider)
+
+    assert (await service.get_status()).ready is False
+    provider.ready = True
+    assert (await service.get_status()).ready is True
+    assert (await AudioService(audio_provider=ConsoleAudioService()).get_status()).ready is True
+    assert (await AudioService(audio_provider=None).get_status()).ready is False
+
+
+@pytest.mark.anyio
+async def test_prefetch_batch_with_console_provider():
+    service = AudioService(audio_provider=ConsoleAudioService())
+    response = await service.prefetch_batch(PrefetchBatchRequest(texts=["Jab", "Cross", "Jab"], language="fr"))
+    assert response.success is True
+    assert response.failed == []
+
+    disabled = await AudioService(audio_provider=None).prefetch_batch(PrefetchBatchRequest(texts=["Jab"]))
+    assert disabled.success is False
+    assert disabled.failed == ["Jab"]
+
+
+class _VoiceRecordingProvider(ConsoleAudioService):
+    def __init__(self):
+        super().__init__()
+        self.voice, self.speed, self.profile = "ff_siwis", 1.0, None
+        self.calls = []
+
+    def configure_voice(self, profile=None, voice=None, speed=None):
+        self.calls.append((profile, voice, speed))
+        self.profile = profile or self.profile
+        self.voice = voice or self.voice
+        self.speed = self.speed if speed is None else speed
+
+
+@pytest.mark.anyio
+async def test_configure_switches_voice_profile_and_speed():
+    from src.domain.training.value_objects import VoiceProfile
+    provider = _VoiceRecordingProvider()
+    service = AudioService(audio_provider=provider)
+
+    status = await service.configure(ConfigureAudioRequest(profile=VoiceProfile.ROCKY, speed=1.1))
+    assert provider.calls == [(VoiceProfile.ROCKY, None, 1.1)]
+    assert status.profile == "rocky" and status.speed == 1.1
+
+    # Only toggling audio leaves the voice alone
+    await service.configure(ConfigureAudioRequest(enabled=True))
+    assert len(provider.calls) == 1
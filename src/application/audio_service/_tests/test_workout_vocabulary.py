@@ -0,0 +1,33 @@
+"""Tests for the workout vocabulary used to pre-synthesize speech."""
+import pytest
+from src.application.audio_service.workout_vocabulary import WorkoutVocabulary
+from src.application.coaching_service.coaching_service import CoachingService, JUMP_ROPE_VARIATIONS
+from src.domain.training.content import TECHNIQUES
+from src.domain.training.value_objects import Block, BlockType, TechniqueCategory
+
+
+@pytest.mark.anyio
+async def test_vocabulary_covers_announcements_and_coaching_in_first_use_order():
+    blocks = [
+        Block(type=BlockType.JUMP_ROPE, work_time=20, rest_time=10, rounds=2),
+        Block(type=BlockType.HEAVY_BAG, work_time=30, rest_time=10, rounds=1,
+              techniques=[TechniqueCategory.KICKS]),
+        Block(type=BlockType.STRENGTH, rest_time=5, rounds=2, exercises={"pushups": 10}),
+    ]
+    
+    vocabulary = await WorkoutVocabulary(CoachingService()).build(blocks, "en")
+    first_use = dict((text, elapsed) for elapsed, text in vocabulary)
+    
+    # Every phrase appears once, earliest first
+    assert len(first_use) == len(vocabulary)
+    assert [elapsed for elapsed, _ in vocabulary] == sorted(elapsed for elapsed, _ in vocabulary)
+    
+    # Session announcements, at the time the session first emits them
+    assert first_use["10"] == 10
+    assert first_use["Round 2"] == 30
+    assert "Set 2: pushups" in first_use
+    # Coaching instructions, from the start of their block
+    assert all(first_use[text] == 0 for text in JUMP_ROPE_VARIATIONS["en"])
+    assert all(first_use[text] == 60 for text in TECHNIQUES["en"]["kicks"])
+    assert "Jab" not in first_use
+    assert first_use["pushups: 10 reps"] == 100
@@ -0,0 +1,232 @@
+"""
+Audio Dispatcher - plays speech off the tick path.
+Listeners submit phrases with a priority; a background loop speaks them in priority order.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from src.application.audio_service.i_api_audio_service import IApiAudioService
+from src.application.audio_service.dtos import SpeakRequest
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(order=True)
+class _QueuedPhrase:
+    sort_key: tuple
+    text: str = field(compare=False)
+    language: str = field(compare=False)
+    priority: int = field(compare=False)
+    expires_at: float = field(compare=False)
+    prefetched: bool = field(default=False, compare=False)
+
+
+class AudioDispatcher:
+    """
+    Bounded priority queue of phrases to speak, drained by a background loop.
+
+    - submit() never blocks: publishers (and so the ticker) don't wait for audio.
+    - Higher priority first (InstructionResponse.priority: countdown 10, rest 5, coaching 3).
+      A phrase with a higher priority than the one playing preempts it.
+    - Phrases are dropped once stale (not started within their ttl, one tick by default),
+      when the same text is already queued, or when the queue is full of more important ones.
+    - While a phrase plays, the next one is synthesized (audio_service.prefetch).
+
+    The loop runs on its own thread so playback continues between the UI's
+    short-lived event loops (Streamlit runs each action in its own asyncio.run).
+    """
+
+    def __init__(
+        self,
+        audio_service: IApiAudioService,
+        max_queue: int = 8,
+        default_ttl: float = 1.0
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            audio_service: AudioService used to synthesize and play phrases
+            max_queue: Maximum number of phrases waiting to be spoken
+            default_ttl: Seconds after which an unstarted phrase is dropped
+        """
+        self.audio_service = audio_service
+        self.max_queue = max_queue
+        self.default_ttl = default_ttl
+        self.played = 0
+        self.dropped = 0
+        self.preempted = 0
+        self._queue: List[_QueuedPhrase] = []
+        self._seq = itertools.count()
+        self._current: Optional[_QueuedPhrase] = None
+        self._current_task: Optional[asyncio.Task] = None
+        self._prefetch_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def submit(self, text: str, language: str = "en", priority: int = 0, ttl: Optional[float] = None):
+        """Queue a phrase for playback. Thread-safe and non-blocking."""
+        if not text:
+            return
+        phrase = _QueuedPhrase(
+            sort_key=(-priority, next(self._seq)),
+            text=text,
+            language=language,
+            priority=priority,
+            expires_at=time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        )
+        self._idle.clear()
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._enqueue, phrase)
+        else:
+            self._enqueue(phrase)
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._thread_main, args=(ready,), name="audio-dispatcher", daemon=True)
+        self._thread.start()
+        ready.wait()
+        logger.info("Audio dispatcher started")
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the loop, interrupting the phrase being played."""
+        if not self._running:
+            return
+        self._running = False
+        self._loop.call_soon_threadsafe(self._shutdown)
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("Audio dispatcher stopped")
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until nothing is queued or playing. Returns False on timeout."""
+        return self._idle.wait(timeout)
+
+    def _thread_main(self, ready: threading.Event):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._wakeup = asyncio.Event()
+        ready.set()
+        try:
+            self._loop.run_until_complete(self._run())
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    def _shutdown(self):
+        self._wakeup.set()
+        if self._current_task:
+            self._current_task.cancel()
+        if self._prefetch_task:
+            self._prefetch_task.cancel()
+
+    def _enqueue(self, phrase: _QueuedPhrase):
+        # Same text already playing or waiting: keep a single copy, at the highest priority
+        if self._current is not None and self._current.text == phrase.text:
+            self._drop(phrase)
+            return
+        for queued in self._queue:
+            if queued.text == phrase.text:
+                if phrase.priority > queued.priority:
+                    queued.priority, queued.sort_key = phrase.priority, phrase.sort_key
+                    heapq.heapify(self._queue)
+                queued.expires_at = max(queued.expires_at, phrase.expires_at)
+                self._drop(phrase)
+                return
+
+        if len(self._queue) >= self.max_queue:
+            # max() of the sort keys is the least important, most recent phrase
+            least = max(self._queue)
+            if phrase.priority <= least.priority:
+                self._drop(phrase)
+                return
+            self._queue.remove(least)
+            heapq.heapify(self._queue)
+            self._drop(least)
+
+        heapq.heappush(self._queue, phrase)
+
+        if self._current is not None and phrase.priority > self._current.priority and self._current_task:
+            logger.debug(f"Preempting '{self._current.text}' for '{phrase.text}'")
+            self.preempted += 1
+            self._current_task.cancel()
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+            self._prefetch_next()
+
+    def _drop(self, phrase: _QueuedPhrase):
+        self.dropped += 1
+        logger.debug(f"Dropped phrase '{phrase.text}'")
+        self._update_idle()
+
+    def _update_idle(self):
+        if not self._queue and self._current is None:
+            self._idle.set()
+
+    def _pop_fresh(self) -> Optional[_QueuedPhrase]:
+        now = time.monotonic()
+        while self._queue:
+            phrase = heapq.heappop(self._queue)
+            if phrase.expires_at >= now:
+                return phrase
+            self.dropped += 1
+            logger.debug(f"Dropped stale phrase '{phrase.text}'")
+        return None
+
+    def _prefetch_next(self):
+        """Synthesize the next phrase while the current one plays."""
+        if self._current is None or not self._queue:
+            return
+        if self._prefetch_task and not self._prefetch_task.done():
+            return
+        head = self._queue[0]
+        if head.prefetched:
+            return
+        head.prefetched = True
+        self._prefetch_task = asyncio.ensure_future(
+            self.audio_service.prefetch(SpeakRequest(text=head.text, language=head.language))
+        )
+        self._prefetch_task.add_done_callback(lambda _: self._prefetch_next())
+
+    async def _run(self):
+        while self._running:
+            phrase = self._pop_fresh()
+            if phrase is None:
+                self._update_idle()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            self._current = phrase
+            self._prefetch_next()
+            self._current_task = asyncio.ensure_future(
+                self.audio_service.speak(SpeakRequest(text=phrase.text, language=phrase.language))
+            )
+            try:
+                await asyncio.wait([self._current_task])
+                if self._current_task.cancelled():
+                    pass  # preempted or stopping
+                elif self._current_task.exception():
+                    logger.error(f"Audio dispatcher error: {self._current_task.exception()}")
+                else:
+                    self.played += 1
+            except Exception as e:
+                logger.error(f"Audio dispatcher error: {e}")
+            finally:
+                self._current = None
+                self._current_task = None
+        self._update_idle()
@@ -6,6 +6,7 @@ import logging
 from src.application.audio_service.i_api_audio_service import IApiAudioService
 from src.application.audio_service.dtos import (
     SpeakRequest, SpeakResponse,
+    PrefetchBatchRequest, PrefetchBatchResponse,
     ConfigureAudioRequest, AudioStatusResponse
 )
 from src.application.ports.i_audio_service import IAudioService
@@ -52,21 +53,66 @@ class AudioService(IApiAudioService):
                 message=str(e)
             )
     
+    async def prefetch(self, request: SpeakRequest) -> SpeakResponse:
+        """Prepare text for playback using the configured provider."""
+        if not self._enabled or not self._provider:
+            return SpeakResponse(
+                success=False,
+                message="Audio is disabled"
+            )
+        
+        try:
+            await self._provider.prefetch(request.text, request.language)
+            return SpeakResponse(success=True)
+        except Exception as e:
+            logger.error(f"Failed to prefetch: {e}")
+            return SpeakResponse(
+                success=False,
+                message=str(e)
+            )
+    
+    async def prefetch_batch(self, request: PrefetchBatchRequest) -> PrefetchBatchResponse:
+        """Prepare several phrases for playback in one pass of the provider."""
+        if not self._enabled or not self._provider:
+            return PrefetchBatchResponse(
+                success=False,
+                failed=list(request.texts),
+                message="Audio is disabled"
+            )
+        
+        try:
+            results = await self._provider.synthesize_batch(list(request.texts))
+            failed = [text for text, audio in zip(request.texts, results) if audio is None]
+            return PrefetchBatchResponse(success=not failed, failed=failed)
+        except Exception as e:
+            logger.error(f"Failed to prefetch batch: {e}")
+            return PrefetchBatchResponse(
+                success=False,
+                failed=list(request.texts),
+                message=str(e)
+            )
+    
     async def configure(self, request: ConfigureAudioRequest) -> AudioStatusResponse:
         """Configure audio settings."""
         self._enabled = request.enabled
-        # Note: Voice/speed configuration would require extending IAudioService
-        # For now, we just track enabled state
+        if self._provider and (request.profile or request.voice or request.speed is not None):
+            self._provider.configure_voice(
+                profile=request.profile,
+                voice=request.voice,
+                speed=request.speed
+            )
         return await self.get_status()
     
     async def get_status(self) -> AudioStatusResponse:
         """Get current audio status."""
-        voice = None
-        if hasattr(self._provider, 'voice'):
-            voice = self._provider.voice
+        voice = getattr(self._provider, 'voice', None)
+        profile = getattr(self._provider, 'profile', None)
             
         return AudioStatusResponse(
             enabled=self._enabled,
             provider=self._provider_name,
-            voice=voice
+            voice=voice,
+            profile=profile.value if profile else None,
+            speed=getattr(self._provider, 'speed', None),
+            ready=self._provider.is_ready if self._provider else False
         )
@@ -1,10 +1,12 @@
 """DTOs for audio service."""
-from .audio_request_dtos import SpeakRequest, ConfigureAudioRequest
-from .audio_response_dtos import SpeakResponse, AudioStatusResponse
+from .audio_request_dtos import SpeakRequest, PrefetchBatchRequest, ConfigureAudioRequest
+from .audio_response_dtos import SpeakResponse, PrefetchBatchResponse, AudioStatusResponse
 
 __all__ = [
     "SpeakRequest",
+    "PrefetchBatchRequest",
     "ConfigureAudioRequest",
     "SpeakResponse",
+    "PrefetchBatchResponse",
     "AudioStatusResponse",
 ]
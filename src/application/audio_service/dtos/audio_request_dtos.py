@@ -1,5 +1,7 @@
 """DTOs for audio service requests."""
+from typing import List
 from pydantic import BaseModel
+from src.domain.training.value_objects import VoiceProfile
 
 
 class SpeakRequest(BaseModel):
@@ -11,10 +13,20 @@ class SpeakRequest(BaseModel):
         frozen = True
 
 
+class PrefetchBatchRequest(BaseModel):
+    """Request to synthesize several phrases ahead of time in one pass."""
+    texts: List[str]
+    language: str = "en"
+    
+    class Config:
+        frozen = True
+
+
 class ConfigureAudioRequest(BaseModel):
-    """Request to configure audio settings."""
+    """Request to configure audio settings. Unset voice settings are left unchanged."""
+    profile: VoiceProfile | None = None
     voice: str | None = None
-    speed: float = 1.0
+    speed: float | None = None
     enabled: bool = True
     
     class Config:
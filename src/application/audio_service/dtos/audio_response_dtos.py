@@ -1,4 +1,5 @@
 """DTOs for audio service responses."""
+from typing import List
 from pydantic import BaseModel
 
 
@@ -11,11 +12,24 @@ class SpeakResponse(BaseModel):
         frozen = True
 
 
+class PrefetchBatchResponse(BaseModel):
+    """Response after synthesizing a batch of phrases."""
+    success: bool
+    failed: List[str] = []  # Phrases that produced no audio
+    message: str | None = None
+    
+    class Config:
+        frozen = True
+
+
 class AudioStatusResponse(BaseModel):
     """Current status of the audio service."""
     enabled: bool
     provider: str  # e.g., "kokoro", "console", "none"
     voice: str | None = None
+    profile: str | None = None
+    speed: float | None = None
+    ready: bool = True  # False while the provider is still warming up
     
     class Config:
         frozen = True
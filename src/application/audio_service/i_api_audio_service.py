@@ -5,6 +5,7 @@ Defines the contract for audio-related operations.
 from abc import ABC, abstractmethod
 from src.application.audio_service.dtos import (
     SpeakRequest, SpeakResponse,
+    PrefetchBatchRequest, PrefetchBatchResponse,
     ConfigureAudioRequest, AudioStatusResponse
 )
 
@@ -50,3 +51,29 @@ class IApiAudioService(ABC):
             AudioStatusResponse with current configuration
         """
         pass
+    
+    @abstractmethod
+    async def prefetch(self, request: SpeakRequest) -> SpeakResponse:
+        """
+        Prepare text for playback ahead of time, without speaking it.
+        
+        Args:
+            request: SpeakRequest with text and language
+            
+        Returns:
+            SpeakResponse indicating success/failure
+        """
+        pass
+    
+    @abstractmethod
+    async def prefetch_batch(self, request: PrefetchBatchRequest) -> PrefetchBatchResponse:
+        """
+        Prepare several phrases for playback in one synthesis pass.
+        
+        Args:
+            request: PrefetchBatchRequest with the texts and language
+            
+        Returns:
+            PrefetchBatchResponse listing the phrases that could not be prepared
+        """
+        pass
@@ -0,0 +1,55 @@
+"""
+Workout Vocabulary - enumerates every phrase a session can speak.
+Used to synthesize speech before it is first needed.
+"""
+from typing import Dict, List, Sequence, Tuple
+from src.application.coaching_service.i_api_coaching_service import IApiCoachingService
+from src.application.coaching_service.dtos import GetVocabularyRequest
+from src.domain.training.timeline import WorkoutTimeline
+from src.domain.training.value_objects import Block
+
+
+class WorkoutVocabulary:
+    """
+    Builds the vocabulary of a workout: the session announcements (countdowns,
+    "Rest", "Round N", strength sets) plus every coaching instruction of each block.
+    """
+    
+    def __init__(self, coaching_service: IApiCoachingService):
+        """
+        Initialize the vocabulary builder.
+        
+        Args:
+            coaching_service: Source of the coaching instruction texts
+        """
+        self.coaching_service = coaching_service
+    
+    async def build(self, blocks: Sequence[Block], language: str) -> List[Tuple[int, str]]:
+        """
+        List (first_use, text) for every phrase, earliest first.
+        first_use is the elapsed session time in seconds at which the phrase may first be spoken.
+        """
+        timeline = WorkoutTimeline.from_blocks(blocks)
+        first_use: Dict[str, int] = {}
+        
+        for elapsed, text in timeline.announcements():
+            first_use.setdefault(text, elapsed)
+        
+        # Coaching instructions can be spoken from the start of their block
+        block_starts: Dict[int, int] = {}
+        for phase in timeline.phases:
+            block_starts.setdefault(phase.block_index, phase.start)
+        
+        for index, start in block_starts.items():
+            block = blocks[index]
+            response = await self.coaching_service.get_vocabulary(GetVocabularyRequest(
+                block_type=block.type,
+                language=language,
+                techniques=block.techniques or None,
+                exercises=block.exercises or None
+            ))
+            for text in response.phrases:
+                if text and start < first_use.get(text, start + 1):
+                    first_use[text] = start
+        
+        return sorted(((elapsed, text) for text, elapsed in first_use.items()), key=lambda item: item[0])
@@ -5,18 +5,39 @@ Generates contextual instructions for training sessions.
 import logging
 import random
 import time
-from typing import Dict
+from typing import Callable, Dict
 from src.application.coaching_service.i_api_coaching_service import IApiCoachingService
 from src.application.coaching_service.dtos import (
     GetInstructionRequest,
     InstructionResponse,
-    InstructionType
+    InstructionType,
+    GetVocabularyRequest,
+    VocabularyResponse
 )
 from src.domain.training.value_objects import BlockType, TechniqueCategory
 from src.domain.training.content import TECHNIQUES
 
 logger = logging.getLogger(__name__)
 
+JUMP_ROPE_VARIATIONS = {
+    'fr': ["Sauts simples", "Sauts alternés", "Double saut", "Croisés"],
+    'en': ["Single jumps", "Alternate jumps", "Double unders", "Crossovers"],
+    'es': ["Saltos simples", "Saltos alternados", "Doble salto", "Cruzados"]
+}
+
+REST_TEXTS = {
+    'fr': 'Repos',
+    'en': 'Rest',
+    'es': 'Descanso'
+}
+
+TECHNIQUE_BLOCK_TYPES = [
+    BlockType.HEAVY_BAG,
+    BlockType.SHADOW_BOXING,
+    BlockType.WARMUP,
+    BlockType.SPARRING
+]
+
 
 class CoachingService(IApiCoachingService):
     """
@@ -24,8 +45,14 @@ class CoachingService(IApiCoachingService):
     Provides contextual guidance based on session state.
     """
     
-    def __init__(self):
-        """Initialize the coaching service."""
+    def __init__(self, clock: Callable[[], float] = time.time):
+        """
+        Initialize the coaching service.
+        
+        Args:
+            clock: Source of the current time in seconds (simulated when rendering offline)
+        """
+        self._clock = clock
         # Track last instruction time per session to avoid spam
         self._last_instruction_time: Dict[str, float] = {}
     
@@ -54,7 +81,7 @@ class CoachingService(IApiCoachingService):
         
         # Priority 3: Work phase instructions
         # Check if enough time has passed since last instruction
-        now = time.time()
+        now = self._clock()
         last_time = self._last_instruction_time.get(request.session_id, 0)
         
         # Frequency based on block type
@@ -92,12 +119,7 @@ class CoachingService(IApiCoachingService):
         """Generate work phase instruction based on block type."""
         
         # Technique-based blocks
-        if request.block_type in [
-            BlockType.HEAVY_BAG, 
-            BlockType.SHADOW_BOXING, 
-            BlockType.WARMUP,
-            BlockType.SPARRING
-        ]:
+        if request.block_type in TECHNIQUE_BLOCK_TYPES:
             return self._get_technique_instruction(
                 request.techniques,
                 request.language
@@ -121,6 +143,42 @@ class CoachingService(IApiCoachingService):
             priority=1
         )
     
+    async def get_vocabulary(
+        self,
+        request: GetVocabularyRequest
+    ) -> VocabularyResponse:
+        """List every text get_instruction can return for a block."""
+        phrases = ["3", "2", "1", self._get_rest_text(request.language)]
+        
+        if request.block_type in TECHNIQUE_BLOCK_TYPES:
+            for moves in self._get_technique_pool(request.techniques, request.language).values():
+                phrases.extend(moves)
+        elif request.block_type == BlockType.JUMP_ROPE:
+            phrases.extend(JUMP_ROPE_VARIATIONS.get(request.language, JUMP_ROPE_VARIATIONS['en']))
+        elif request.block_type == BlockType.STRENGTH:
+            for exercise_name, reps in (request.exercises or {}).items():
+                phrases.append(self._format_exercise(exercise_name, reps, request.language))
+        
+        return VocabularyResponse(phrases=list(dict.fromkeys(phrases)))
+    
+    def _get_technique_pool(
+        self,
+        techniques: list[TechniqueCategory] | None,
+        language: str
+    ) -> Dict[str, list]:
+        """Technique categories an instruction can be drawn from."""
+        lang_techniques = TECHNIQUES.get(language, TECHNIQUES.get('en', {}))
+        if techniques:
+            # Convert enum to string keys
+            technique_keys = [t.value if hasattr(t, 'value') else str(t).lower() 
+                            for t in techniques]
+            available = {k: v for k, v in lang_techniques.items() 
+                        if k in technique_keys}
+            if available:
+                return available
+        # Fallback to all techniques
+        return lang_techniques
+    
     def _get_technique_instruction(
         self,
         techniques: list[TechniqueCategory] | None,
@@ -128,35 +186,18 @@ class CoachingService(IApiCoachingService):
     ) -> InstructionResponse:
         """Get a random technique instruction."""
         
-        # Get techniques for language
-        lang_techniques = TECHNIQUES.get(language, TECHNIQUES.get('en', {}))
+        # Specific techniques if provided, otherwise all techniques for the language
+        available = self._get_technique_pool(techniques, language)
         
-        if not lang_techniques:
+        if not available:
             return InstructionResponse(
                 text="",
                 type=InstructionType.TECHNIQUE,
                 priority=3
             )
         
-        # If specific techniques are provided, use those
-        if techniques:
-            # Convert enum to string keys
-            technique_keys = [t.value if hasattr(t, 'value') else str(t).lower() 
-                            for t in techniques]
-            available = {k: v for k, v in lang_techniques.items() 
-                        if k in technique_keys}
-            
-            if available:
-                category = random.choice(list(available.keys()))
-                moves = available[category]
-            else:
-                # Fallback to all techniques
-                category = random.choice(list(lang_techniques.keys()))
-                moves = lang_techniques[category]
-        else:
-            # Use all available techniques
-            category = random.choice(list(lang_techniques.keys()))
-            moves = lang_techniques[category]
+        category = random.choice(list(available.keys()))
+        moves = available[category]
         
         if moves:
             technique = random.choice(moves)
@@ -175,13 +216,7 @@ class CoachingService(IApiCoachingService):
     def _get_jump_rope_instruction(self, language: str) -> InstructionResponse:
         """Get a jump rope variation instruction."""
         
-        variations = {
-            'fr': ["Sauts simples", "Sauts alternés", "Double saut", "Croisés"],
-            'en': ["Single jumps", "Alternate jumps", "Double unders", "Crossovers"],
-            'es': ["Saltos simples", "Saltos alternados", "Doble salto", "Cruzados"]
-        }
-        
-        lang_variations = variations.get(language, variations['en'])
+        lang_variations = JUMP_ROPE_VARIATIONS.get(language, JUMP_ROPE_VARIATIONS['en'])
         variation = random.choice(lang_variations)
         
         return InstructionResponse(
@@ -207,14 +242,7 @@ class CoachingService(IApiCoachingService):
         # Pick a random exercise
         exercise_name = random.choice(list(exercises.keys()))
         reps = exercises[exercise_name]
-        
-        reps_text = {
-            'fr': 'reps',
-            'en': 'reps',
-            'es': 'reps'
-        }
-        
-        text = f"{exercise_name}: {reps} {reps_text.get(language, 'reps')}"
+        text = self._format_exercise(exercise_name, reps, language)
         
         return InstructionResponse(
             text=text,
@@ -222,11 +250,15 @@ class CoachingService(IApiCoachingService):
             priority=3
         )
     
+    def _format_exercise(self, exercise_name: str, reps: int, language: str) -> str:
+        """Format a strength exercise instruction."""
+        reps_text = {
+            'fr': 'reps',
+            'en': 'reps',
+            'es': 'reps'
+        }
+        return f"{exercise_name}: {reps} {reps_text.get(language, 'reps')}"
+    
     def _get_rest_text(self, language: str) -> str:
         """Get rest phase text."""
-        rest_texts = {
-            'fr': 'Repos',
-            'en': 'Rest',
-            'es': 'Descanso'
-        }
-        return rest_texts.get(language, 'Rest')
+        return REST_TEXTS.get(language, 'Rest')
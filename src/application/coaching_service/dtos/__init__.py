@@ -1,9 +1,11 @@
 """DTOs for coaching service."""
-from .coaching_request_dtos import GetInstructionRequest
-from .coaching_response_dtos import InstructionResponse, InstructionType
+from .coaching_request_dtos import GetInstructionRequest, GetVocabularyRequest
+from .coaching_response_dtos import InstructionResponse, InstructionType, VocabularyResponse
 
 __all__ = [
     "GetInstructionRequest",
+    "GetVocabularyRequest",
     "InstructionResponse",
     "InstructionType",
+    "VocabularyResponse",
 ]
@@ -16,3 +16,14 @@ class GetInstructionRequest(BaseModel):
     
     class Config:
         frozen = True
+
+
+class GetVocabularyRequest(BaseModel):
+    """Request for every instruction text a block can produce."""
+    block_type: BlockType
+    language: str = "en"
+    techniques: List[TechniqueCategory] | None = None
+    exercises: Dict[str, int] | None = None
+    
+    class Config:
+        frozen = True
@@ -1,6 +1,7 @@
 """DTOs for coaching service responses."""
 from pydantic import BaseModel
 from enum import Enum
+from typing import List
 
 
 class InstructionType(str, Enum):
@@ -20,3 +21,11 @@ class InstructionResponse(BaseModel):
     
     class Config:
         frozen = True
+
+
+class VocabularyResponse(BaseModel):
+    """Every instruction text a block can produce, without duplicates."""
+    phrases: List[str]
+    
+    class Config:
+        frozen = True
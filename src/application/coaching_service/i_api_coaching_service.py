@@ -5,7 +5,9 @@ Defines the contract for coaching-related operations.
 from abc import ABC, abstractmethod
 from src.application.coaching_service.dtos import (
     GetInstructionRequest,
-    InstructionResponse
+    InstructionResponse,
+    GetVocabularyRequest,
+    VocabularyResponse
 )
 
 
@@ -30,3 +32,20 @@ class IApiCoachingService(ABC):
             InstructionResponse with instruction text and metadata
         """
         pass
+    
+    @abstractmethod
+    async def get_vocabulary(
+        self,
+        request: GetVocabularyRequest
+    ) -> VocabularyResponse:
+        """
+        List every instruction text a block can produce.
+        Used to synthesize speech ahead of time.
+        
+        Args:
+            request: GetVocabularyRequest with block configuration
+            
+        Returns:
+            VocabularyResponse with the phrases
+        """
+        pass
@@ -0,0 +1,31 @@
+from src.domain._base.domain_event import DomainEvent
+from src.application.events.event_handler_registry import EventHandlerRegistry
+
+class SessionEvent(DomainEvent):
+    session_id: str = "s"
+
+class RoundStarted(SessionEvent):
+    pass
+
+def test_handlers_of_base_classes_are_resolved_along_the_mro():
+    registry = EventHandlerRegistry()
+    audit, session, specific = (lambda e: None), (lambda e: None), (lambda e: None)
+    registry.subscribe(DomainEvent, audit)
+    registry.subscribe(SessionEvent, session)
+    registry.subscribe(RoundStarted, specific)
+
+    assert registry.get_handlers(RoundStarted) == (specific, session, audit)
+    assert registry.get_handlers(SessionEvent) == (session, audit)
+    # Resolved once and cached
+    assert registry.get_handlers(RoundStarted) is registry.get_handlers(RoundStarted)
+
+def test_unsubscribe_invalidates_the_dispatch_table():
+    registry = EventHandlerRegistry()
+    audit, specific = (lambda e: None), (lambda e: None)
+    registry.subscribe(DomainEvent, audit)
+    registry.subscribe(RoundStarted, specific)
+    assert registry.get_handlers(RoundStarted) == (specific, audit)
+
+    assert registry.unsubscribe(DomainEvent, audit) is True
+    assert registry.get_handlers(RoundStarted) == (specific,)
+    assert registry.unsubscribe(DomainEvent, audit) is False
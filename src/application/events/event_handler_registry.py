@@ -1,18 +1,53 @@
-from typing import Dict, Type, List, Callable
+from typing import Dict, Type, List, Callable, Tuple
 from src.domain._base.domain_event import DomainEvent
 from collections import defaultdict
 
 class EventHandlerRegistry:
     """
     Registry for mapping Domain Events to multiple handlers (subscribers).
+
+    A handler subscribed to a base class (e.g. DomainEvent) also receives every
+    subclass. The handlers of each concrete event type are resolved once, along
+    its MRO (most specific class first), and cached until the next (un)subscribe.
     """
     def __init__(self):
         self._handlers: Dict[Type[DomainEvent], List[Callable]] = defaultdict(list)
+        self._dispatch: Dict[Type[DomainEvent], Tuple[Callable, ...]] = {}
+        self._listeners: List[Callable[[], None]] = []
+
+    def on_change(self, listener: Callable[[], None]):
+        """Call `listener()` after every (un)subscribe, e.g. to drop dispatch tables built from the registry."""
+        self._listeners.append(listener)
 
     def subscribe(self, event_type: Type[DomainEvent], handler: Callable):
-        """Register a handler for a specific event type."""
+        """Register a handler for an event type and its subclasses."""
         self._handlers[event_type].append(handler)
+        self._changed()
+
+    def unsubscribe(self, event_type: Type[DomainEvent], handler: Callable) -> bool:
+        """Remove a handler registered for an event type. Returns False if it was not registered."""
+        handlers = self._handlers.get(event_type)
+        if not handlers or handler not in handlers:
+            return False
+        handlers.remove(handler)
+        self._changed()
+        return True
+
+    def registered(self, event_type: Type[DomainEvent]) -> Tuple[Callable, ...]:
+        """Handlers registered for exactly this event type (not its base classes)."""
+        return tuple(self._handlers.get(event_type, ()))
+
+    def get_handlers(self, event_type: Type[DomainEvent]) -> Tuple[Callable, ...]:
+        """Retrieve all handlers for a specific event type, including those of its base classes."""
+        handlers = self._dispatch.get(event_type)
+        if handlers is None:
+            handlers = tuple(
+                handler for cls in event_type.__mro__ for handler in self._handlers.get(cls, ())
+            )
+            self._dispatch[event_type] = handlers
+        return handlers
 
-    def get_handlers(self, event_type: Type[DomainEvent]) -> List[Callable]:
-        """Retrieve all handlers for a specific event type."""
-        return self._handlers[event_type]
+    def _changed(self):
+        self._dispatch.clear()
+        for listener in self._listeners:
+            listener()
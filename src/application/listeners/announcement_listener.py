@@ -16,14 +16,17 @@ class AnnouncementListener:
     Translates domain events into audio service calls.
     """
     
-    def __init__(self, audio_service: AudioService):
+    def __init__(self, audio_service: AudioService, dispatcher=None):
         """
         Initialize the listener.
         
         Args:
             audio_service: AudioService instance to handle speech
+            dispatcher: Optional AudioDispatcher; when set, announcements are queued
+                        instead of spoken inline
         """
         self.audio_service = audio_service
+        self.dispatcher = dispatcher
     
     async def handle(self, event: AnnouncementTriggered):
         """
@@ -32,8 +35,17 @@ class AnnouncementListener:
         Args:
             event: AnnouncementTriggered domain event
         """
+        if self.dispatcher:
+            self.dispatcher.submit(event.text, "en", priority=self._priority(event.text))
+            return
+        
         request = SpeakRequest(text=event.text, language="en")
         response = await self.audio_service.speak(request)
         
         if not response.success:
             logger.warning(f"Failed to announce: {event.text} - {response.message}")
+    
+    @staticmethod
+    def _priority(text: str) -> int:
+        """Same scale as InstructionResponse.priority: countdown 10, phase changes 5."""
+        return 10 if text.isdigit() else 5
@@ -9,6 +9,7 @@ from src.application.coaching_service.i_api_coaching_service import IApiCoaching
 from src.application.audio_service.audio_service import AudioService
 from src.application.coaching_service.dtos import GetInstructionRequest
 from src.application.audio_service.dtos import SpeakRequest
+from src.application.audio_service.workout_vocabulary import WorkoutVocabulary
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,9 @@ class CoachingListener:
         self, 
         coaching_service: IApiCoachingService,
         audio_service: AudioService,
-        language: str = "fr"
+        language: str = "fr",
+        prerender_worker=None,
+        dispatcher=None
     ):
         """
         Initialize the listener.
@@ -32,10 +35,17 @@ class CoachingListener:
             coaching_service: CoachingService instance to generate instructions
             audio_service: AudioService instance to handle speech
             language: Default language for instructions
+            prerender_worker: Optional PhrasePrerenderWorker that synthesizes
+                              the session vocabulary ahead of time
+            dispatcher: Optional AudioDispatcher; when set, instructions are queued
+                        by priority instead of spoken inline
         """
         self.coaching_service = coaching_service
         self.audio_service = audio_service
         self.language = language
+        self.prerender_worker = prerender_worker
+        self.dispatcher = dispatcher
+        self._vocabulary = WorkoutVocabulary(coaching_service)
         
         # Track last spoken instruction per session to avoid repetition
         self._last_instructions: Dict[str, str] = {}
@@ -56,6 +66,21 @@ class CoachingListener:
             'workout_detail': workout_detail
         }
     
+    async def prepare_session(self, session_id: str, workout_detail):
+        """
+        Set the session context and queue its vocabulary for pre-synthesis.
+        This should be called when a session starts.
+        
+        Args:
+            session_id: Session identifier
+            workout_detail: WorkoutDetailResponse with blocks info
+        """
+        self.set_session_context(session_id, workout_detail)
+        if self.prerender_worker:
+            vocabulary = await self._vocabulary.build(workout_detail.blocks, self.language)
+            queued = self.prerender_worker.submit(vocabulary, self.language)
+            logger.info(f"Queued {queued} phrases for pre-synthesis (session {session_id})")
+    
     async def handle(self, event: SessionTicked):
         """
         Handle a session tick event by generating and speaking instruction.
@@ -93,7 +118,10 @@ class CoachingListener:
         
         # Speak if instruction changed
         if response.text and response.text != self._last_instructions.get(event.session_id, ""):
-            await self._speak_instruction(response.text)
+            if self.dispatcher:
+                self.dispatcher.submit(response.text, self.language, priority=response.priority)
+            else:
+                await self._speak_instruction(response.text)
             self._last_instructions[event.session_id] = response.text
     
     async def _speak_instruction(self, text: str):
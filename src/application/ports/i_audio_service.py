@@ -4,6 +4,15 @@ The application layer defines this interface,
 and the infrastructure layer provides concrete implementations.
 """
 from abc import ABC, abstractmethod
+from typing import Any, List, NamedTuple, Optional
+
+from src.domain.training.value_objects import VoiceProfile
+
+
+class SynthesizedAudio(NamedTuple):
+    """A synthesized phrase: mono float samples (any buffer, e.g. a numpy array) and their rate."""
+    samples: Any
+    sample_rate: int
 
 
 class IAudioService(ABC):
@@ -22,3 +31,58 @@ class IAudioService(ABC):
             language: Language code (e.g., 'en', 'fr', 'es')
         """
         pass
+    
+    @abstractmethod
+    async def synthesize_batch(
+        self,
+        texts: List[str],
+        voice: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> List[Optional[SynthesizedAudio]]:
+        """
+        Synthesize several phrases in one pass, without playing them.
+        
+        Args:
+            texts: The phrases to synthesize
+            voice: Voice to use (defaults to the service's voice)
+            speed: Speech speed multiplier (defaults to the service's speed)
+            
+        Returns:
+            One entry per text, in order; None for a phrase that produced no audio
+        """
+        pass
+    
+    async def prefetch(self, text: str, language: str = "en") -> None:
+        """
+        Prepare the given text for playback without speaking it
+        (e.g. synthesize it into a cache). No-op by default.
+        
+        Args:
+            text: The text that will be spoken later
+            language: Language code (e.g., 'en', 'fr', 'es')
+        """
+        pass
+    
+    def configure_voice(
+        self,
+        profile: Optional[VoiceProfile] = None,
+        voice: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> None:
+        """
+        Change the voice used by the following phrases. No-op by default.
+        
+        Args:
+            profile: Voice profile (sets voice, speed and pitch together)
+            voice: Provider-specific voice identifier, overriding the profile's
+            speed: Speech speed multiplier, overriding the profile's
+        """
+        pass
+    
+    @property
+    def is_ready(self) -> bool:
+        """
+        Whether speak() can play synthesized speech right away
+        (e.g. the TTS model is loaded). Always True by default.
+        """
+        return True
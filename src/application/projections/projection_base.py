@@ -6,6 +6,11 @@ class Projection(ABC):
     Base class for Projections (Read Models).
     Projections listen to events and update read-optimized models.
     """
+
+    @property
+    def name(self) -> str:
+        """Stable identifier, used as the checkpoint key by subscriptions."""
+        return self.__class__.__name__
     
     @abstractmethod
     def handle(self, event: DomainEvent):
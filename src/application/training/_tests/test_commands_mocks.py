@@ -53,11 +53,15 @@ async def test_commands_with_mocks():
     assert stored_session.status == SessionStatus.RUNNING
     assert stored_session.time_left == 10
 
-    # 5. Tick Session
-    await tick_session(TickSession(session_id=session_id))
+    # 5. Tick Session (the handler returns the status after the tick)
+    assert await tick_session(TickSession(session_id=session_id)) == SessionStatus.RUNNING
     
     stored_session = await session_repo.get_by_id(session_id)
     assert stored_session.time_left == 9
+
+    # Catching up several seconds at once
+    assert await tick_session(TickSession(session_id=session_id, seconds=3)) == SessionStatus.RUNNING
+    assert (await session_repo.get_by_id(session_id)).time_left == 6
     
     # 6. Skip Block
     await skip_block(SkipBlock(session_id=session_id))
@@ -2,7 +2,7 @@ from uuid import UUID
 from pydantic import Field
 from src.application._base.command import Command
 from src.domain.training.repositories import ISessionRepository, IWorkoutRepository
-from src.domain.training.session import TrainingSession
+from src.domain.training.session import TrainingSession, SessionStatus
 
 # --- Commands ---
 
@@ -12,6 +12,7 @@ class StartSession(Command):
 
 class TickSession(Command):
     session_id: str
+    seconds: int = 1
 
 class PauseSession(Command):
     session_id: str
@@ -53,15 +54,20 @@ class TickSessionHandler:
     def __init__(self, session_repo: ISessionRepository):
         self.session_repo = session_repo
 
-    async def __call__(self, command: TickSession) -> None:
+    async def __call__(self, command: TickSession) -> SessionStatus:
+        """Tick the session (advance it by `seconds` at once when catching up) and return its status."""
         session = await self.session_repo.get_by_id(command.session_id)
         if not session:
              # If session not found, maybe it finished or invalid ID. Silent fail or error?
              # For a "Tick" loop, error might spam. But strict logic says error.
              raise ValueError(f"Session {command.session_id} not found")
         
-        session.tick()
+        if command.seconds > 1:
+            session.advance_to(session.elapsed_seconds + command.seconds)
+        else:
+            session.tick()
         await self.session_repo.save(session)
+        return session.status
 
 
 class PauseSessionHandler:
@@ -15,6 +15,7 @@ class StartSessionRequest:
 @dataclass(frozen=True)
 class TickSessionRequest:
     session_id: str
+    seconds: int = 1  # More than 1 catches up missed ticks in one step
 
 @dataclass(frozen=True)
 class PauseSessionRequest:
@@ -17,6 +17,11 @@ class ActionResponse:
     success: bool = True
     message: Optional[str] = None
 
+@dataclass(frozen=True)
+class TickSessionResponse(ActionResponse):
+    """Result of a tick, with the session's status after it (None if the tick failed)."""
+    status: Optional[SessionStatus] = None
+
 @dataclass(frozen=True)
 class SessionStateResponse:
     id: str
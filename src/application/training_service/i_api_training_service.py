@@ -7,7 +7,7 @@ from src.application.training_service.dtos.training_request_dtos import (
     MoveBlockRequest
 )
 from src.application.training_service.dtos.training_response_dtos import (
-    CreateWorkoutResponse, StartSessionResponse, ActionResponse,
+    CreateWorkoutResponse, StartSessionResponse, ActionResponse, TickSessionResponse,
     SessionStateResponse, WorkoutSummaryResponse, WorkoutDetailResponse
 )
 
@@ -33,7 +33,7 @@ class ITrainingService(ABC):
         pass
 
     @abstractmethod
-    async def tick_session(self, request: TickSessionRequest) -> ActionResponse:
+    async def tick_session(self, request: TickSessionRequest) -> TickSessionResponse:
         pass
 
     @abstractmethod
@@ -11,13 +11,18 @@ from src.application.training_service.dtos.training_request_dtos import (
     MoveBlockRequest
 )
 from src.application.training_service.dtos.training_response_dtos import (
-    CreateWorkoutResponse, StartSessionResponse, ActionResponse,
+    CreateWorkoutResponse, StartSessionResponse, ActionResponse, TickSessionResponse,
     SessionStateResponse, WorkoutSummaryResponse, WorkoutDetailResponse
 )
 # Handlers & Repos
 from src.infrastructure.training.repositories.osu_workout_repository import OsuWorkoutRepository
 from src.infrastructure.training.repositories.osu_session_repository import OsuSessionRepository
 from src.infrastructure.events.store.osu_event_store import OsuFileEventStore
+from src.infrastructure.events.store.sqlite_event_store import SQLiteEventStore
+from src.infrastructure.events.outbox.event_log_outbox import EventLogOutbox
+from src.infrastructure.events.outbox.sqlite_outbox import SQLiteOutbox
+from src.infrastructure.events.outbox.outbox_relay import OutboxRelay, shared_relay
+from src.infrastructure._common.storage.fsync_policy import FsyncPolicy
 from src.application.training.commands.workout_commands import CreateWorkout, CreateWorkoutHandler
 from src.application.training.commands.session_commands import (
     StartSession, StartSessionHandler,
@@ -41,13 +46,24 @@ class TrainingService(ITrainingService):
         workout_repo = None,
         session_repo = None,
         event_store = None,
-        event_bus = None
+        event_bus = None,
+        snapshot_store = None,
+        fsync_policy = None,
+        use_outbox: bool = False
     ):
         # wiring
-        self.workout_repo = workout_repo or OsuWorkoutRepository(base_path=os.path.join(base_path, "persistence", "workouts"))
+        # One policy for every file store, so concurrent writers share group commits
+        self.fsync_policy = fsync_policy or FsyncPolicy()
+        self.workout_repo = workout_repo or OsuWorkoutRepository(
+            base_path=os.path.join(base_path, "persistence", "workouts"),
+            fsync_policy=self.fsync_policy
+        )
         
         if not event_store:
-            self.event_store = OsuFileEventStore(base_path=os.path.join(base_path, "persistence", "events"))
+            self.event_store = OsuFileEventStore(
+                base_path=os.path.join(base_path, "persistence", "events"),
+                fsync_policy=self.fsync_policy
+            )
         else:
             self.event_store = event_store
             
@@ -56,6 +72,22 @@ class TrainingService(ITrainingService):
         from src.infrastructure.events.bus.in_memory_event_bus import InMemoryEventBus
         self.event_bus = event_bus or InMemoryEventBus()
 
+        # Outbox: stored events are published from what the store committed, by one relay
+        # per store in the process (services on the same base_path share it; each gets the
+        # events of its own sessions). Call start() to publish them from the relay's thread.
+        self.outbox_relay = None
+        self._relay_started = False
+        if use_outbox:
+            if isinstance(self.event_store, SQLiteEventStore):
+                # Every store on the database must add outbox rows, not only the relay's
+                self.event_store.enable_outbox()
+                key = self.event_store.db_path
+                make_outbox = lambda: SQLiteOutbox(self.event_store)
+            else:
+                key = os.path.join(base_path, "persistence", "outbox.checkpoint")
+                make_outbox = lambda: EventLogOutbox(self.event_store, checkpoint_path=key)
+            self.outbox_relay = shared_relay(key, lambda: OutboxRelay(make_outbox(), self.event_bus))
+
         if not session_repo:
             # We need to inject event_bus into SessionRepo if we want it to publish?
             # Or we publish manually here?
@@ -64,7 +96,10 @@ class TrainingService(ITrainingService):
             self.session_repo = OsuSessionRepository(
                 event_store=self.event_store, 
                 base_path=os.path.join(base_path, "persistence", "sessions"),
-                event_bus=self.event_bus
+                event_bus=self.event_bus,
+                snapshot_store=snapshot_store,
+                fsync_policy=self.fsync_policy,
+                outbox_relay=self.outbox_relay
             )
         else:
             self.session_repo = session_repo
@@ -85,6 +120,22 @@ class TrainingService(ITrainingService):
         self._skip_block = SkipBlockHandler(self.session_repo)
         self._move_block = MoveBlockHandler(self.workout_repo)
 
+    def start(self) -> None:
+        """Publish stored events from the outbox relay's background thread, off the save path."""
+        if self.outbox_relay and not self._relay_started:
+            self.outbox_relay.start()
+            self._relay_started = True
+
+    async def close(self) -> None:
+        """Flush write-behind state (pending events, session snapshots) before shutdown."""
+        if self._relay_started:
+            self.outbox_relay.stop()
+            self._relay_started = False
+        elif self.outbox_relay:
+            await self.outbox_relay.publish_pending()
+        await self.session_repo.close()
+        await self.fsync_policy.flush()
+
     async def create_workout(self, request: CreateWorkoutRequest) -> CreateWorkoutResponse:
         cmd = CreateWorkout(name=request.name, blocks=request.blocks)
         workout_id = await self._create_workout(cmd)
@@ -119,12 +170,12 @@ class TrainingService(ITrainingService):
             is_work_phase=dto.is_work_phase
         )
 
-    async def tick_session(self, request: TickSessionRequest) -> ActionResponse:
+    async def tick_session(self, request: TickSessionRequest) -> TickSessionResponse:
         try:
-            await self._tick_session(TickSession(session_id=request.session_id))
-            return ActionResponse(success=True)
+            status = await self._tick_session(TickSession(session_id=request.session_id, seconds=request.seconds))
+            return TickSessionResponse(success=True, status=status)
         except ValueError as e:
-            return ActionResponse(success=False, message=str(e))
+            return TickSessionResponse(success=False, message=str(e))
 
     async def pause_session(self, request: PauseSessionRequest) -> ActionResponse:
         try:
@@ -4,7 +4,10 @@ Wires up all dependencies for the application.
 """
 import os
 import sys
+import atexit
+import asyncio
 from src.application.training_service.training_service import TrainingService
+from src.infrastructure._common.storage.fsync_policy import FsyncPolicy, FsyncMode
 from src.interface.presenters.training_presenter import TrainingPresenter
 
 
@@ -15,7 +18,7 @@ class CompositionRoot:
     """
     
     @staticmethod
-    def create_presenter(language='fr', base_path='.osu', use_audio=True):
+    def create_presenter(language='fr', base_path='.osu', use_audio=True, event_store_backend='osu', fsync_mode='never', tts_workers=0):
         """
         Create a fully configured TrainingPresenter with all dependencies.
         
@@ -23,6 +26,9 @@ class CompositionRoot:
             language: Initial language for the presenter
             base_path: Path for file-based persistence
             use_audio: Whether to enable audio announcements
+            event_store_backend: 'osu' (one JSONL file per session) or 'sqlite' (single WAL database)
+            fsync_mode: durability of the file stores: 'never' (the OS flushes), 'batched' (group commit) or 'always'
+            tts_workers: number of speech synthesis processes (0 synthesizes in-process)
             
         Returns:
             TrainingPresenter: Fully configured presenter
@@ -32,13 +38,25 @@ class CompositionRoot:
         coaching_listener = None
         
         if use_audio:
-            event_bus, audio_service, coaching_listener = CompositionRoot._setup_audio_infrastructure_with_service()
+            event_bus, audio_service, coaching_listener = CompositionRoot._setup_audio_infrastructure_with_service(tts_workers)
             # Set language on coaching listener
             if coaching_listener:
                 coaching_listener.language = language
         
         # Create training service with optional event bus
-        training_service = TrainingService(base_path=base_path, event_bus=event_bus)
+        event_store, snapshot_store = CompositionRoot._create_event_store(base_path, event_store_backend)
+        training_service = TrainingService(
+            base_path=base_path,
+            event_store=event_store,
+            event_bus=event_bus,
+            snapshot_store=snapshot_store,
+            fsync_policy=FsyncPolicy(FsyncMode(fsync_mode)),
+            # Side effects of stored events survive a crash between append and publish
+            use_outbox=True
+        )
+        training_service.start()
+        # Write-behind state (session snapshots, outbox deliveries) is flushed when the process exits
+        atexit.register(CompositionRoot._close_training_service, training_service)
         
         # Create coaching service (for presenter to get instructions for UI display)
         from src.application.coaching_service.coaching_service import CoachingService
@@ -54,6 +72,30 @@ class CompositionRoot:
         return presenter
     
     
+    @staticmethod
+    def _close_training_service(training_service):
+        """Flush a training service at exit (the UI has no long-lived event loop to do it on)."""
+        try:
+            asyncio.run(training_service.close())
+        except Exception as e:
+            print(f"⚠ Failed to flush training state: {e}")
+    
+    @staticmethod
+    def _create_event_store(base_path, backend='osu'):
+        """
+        Create the event and snapshot stores for the requested backend.
+        Returns (None, None) for 'osu' so TrainingService builds its default file stores.
+        """
+        if backend == 'osu':
+            return None, None
+        if backend == 'sqlite':
+            from src.infrastructure.events.store.sqlite_event_store import SQLiteEventStore
+            from src.infrastructure.events.store.sqlite_snapshot_store import SQLiteSnapshotStore
+            from src.domain.training.session import TrainingSession
+            db_path = os.path.join(base_path, "persistence", "events.db")
+            return SQLiteEventStore(db_path=db_path), SQLiteSnapshotStore(TrainingSession, db_path=db_path)
+        raise ValueError(f"Unknown event store backend: {backend}")
+    
     @staticmethod
     def _setup_audio_infrastructure():
         """
@@ -64,12 +106,15 @@ class CompositionRoot:
         return event_bus
     
     @staticmethod
-    def _setup_audio_infrastructure_with_service():
+    def _setup_audio_infrastructure_with_service(tts_workers=0):
         """
         Setup audio infrastructure.
         Returns tuple of (event_bus, audio_service, coaching_listener).
+        
+        Args:
+            tts_workers: number of speech synthesis processes (0 synthesizes in-process)
         """
-        from src.infrastructure.events.bus.in_memory_event_bus import InMemoryEventBus
+        from src.infrastructure.events.bus.in_memory_event_bus import InMemoryEventBus, DispatchMode
         from src.application.listeners.announcement_listener import AnnouncementListener
         from src.application.listeners.coaching_listener import CoachingListener
         from src.application.audio_service.audio_service import AudioService
@@ -80,18 +125,26 @@ class CompositionRoot:
         if sys.platform == "darwin":
             os.environ["PHONEMIZER_ESPEAK_LIBRARY"] = "/opt/homebrew/lib/libespeak-ng.dylib"
         
-        # Create event bus
-        event_bus = InMemoryEventBus()
+        # Create event bus: listeners run side by side, and a failing one doesn't fail the tick command
+        event_bus = InMemoryEventBus(mode=DispatchMode.CONCURRENT)
         
         # Try to create Kokoro audio provider, fallback to console
         audio_provider = None
         try:
             from src.infrastructure.audio.kokoro_audio_service import KokoroAudioService
+            from src.infrastructure.audio.console_audio_service import ConsoleAudioService
+            from src.infrastructure.audio.tts_process_pool import TtsProcessPool
+            repo_id = "prince-canuma/Kokoro-82M"
             audio_provider = KokoroAudioService(
-                repo_id="prince-canuma/Kokoro-82M", 
-                voice="ff_siwis"  # French female voice
+                repo_id=repo_id, 
+                voice="ff_siwis",  # French female voice
+                fallback=ConsoleAudioService(),  # Until the model is warmed up
+                # Several processes, each with its own model, when coaching several rooms
+                worker_pool=TtsProcessPool(repo_id, workers=tts_workers) if tts_workers > 0 else None
             )
-            print("✓ Using Kokoro TTS (MLX) - French voice")
+            # Load the weights now rather than on the first announcement
+            audio_provider.start_warm_up()
+            print("✓ Using Kokoro TTS (MLX) - French voice (warming up)")
         except Exception as e:
             print(f"⚠ Failed to load Kokoro: {e}")
             try:
@@ -108,15 +161,27 @@ class CompositionRoot:
         # Create coaching service
         coaching_service = CoachingService()
         
+        # Speech is queued by priority and played off the tick path
+        from src.application.audio_service.audio_dispatcher import AudioDispatcher
+        audio_dispatcher = AudioDispatcher(audio_service)
+        audio_dispatcher.start()
+        
         # Wire up announcement listener for domain events (e.g., "Rest", "10 seconds")
-        announcement_listener = AnnouncementListener(audio_service)
+        announcement_listener = AnnouncementListener(audio_service, dispatcher=audio_dispatcher)
         event_bus.subscribe(AnnouncementTriggered, announcement_listener.handle)
         
+        # Synthesize each session's vocabulary in the background before it is spoken
+        from src.infrastructure.workers.phrase_prerender_worker import PhrasePrerenderWorker
+        prerender_worker = PhrasePrerenderWorker(audio_service)
+        prerender_worker.start()
+        
         # Wire up coaching listener for session ticks (instructions)
         coaching_listener = CoachingListener(
             coaching_service=coaching_service,
             audio_service=audio_service,
-            language="fr"  # Default, can be changed later
+            language="fr",  # Default, can be changed later
+            prerender_worker=prerender_worker,
+            dispatcher=audio_dispatcher
         )
         event_bus.subscribe(SessionTicked, coaching_listener.handle)
         
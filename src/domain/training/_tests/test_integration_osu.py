@@ -29,9 +29,8 @@ async def test_domain_events_persisted_to_osu():
     async def persist_events():
         events = session.collect_domain_events()
         if events:
-            # In a real app, we'd read current version first. Here we assume 0 or append-only.
-            # Using 0 as expected version for simplicity in this test loop (stateless append for log)
-            await store.append(session.id, events, 0)
+            # The store enforces optimistic concurrency, so read the current version first.
+            await store.append(session.id, events, await store.get_version(session.id))
     
     # 4. Simulation
     
@@ -64,3 +64,89 @@ def test_skip_block():
     block_starts = [e for e in events if e.__class__.__name__ == "BlockStarted"]
     assert len(block_starts) > 0
     assert block_starts[-1].block_type == BlockType.HEAVY_BAG
+
+def test_apply_replays_events_onto_snapshot():
+    workout = Workout(name="Test", id="w1")
+    workout.add_block(Block(type=BlockType.HEAVY_BAG, work_time=3, rest_time=2, rounds=2))
+    workout.add_block(Block(type=BlockType.COOLDOWN, work_time=2, rest_time=1))
+
+    session = TrainingSession(workout=workout, id="s1")
+    session.start()
+    session.tick()
+    session.clear_domain_events()
+    snapshot = session.model_copy(deep=True)
+
+    for _ in range(9):
+        session.tick()
+    session.pause()
+
+    for event in session.collect_domain_events():
+        snapshot.apply(event)
+
+    assert snapshot.status == session.status == SessionStatus.PAUSED
+    assert snapshot.current_block_index == session.current_block_index == 1
+    assert snapshot.current_round == session.current_round
+    assert snapshot.time_left == session.time_left
+    assert snapshot.is_work_phase == session.is_work_phase
+
+def _mixed_workout():
+    workout = Workout(name="Mixed", id="w1")
+    workout.add_block(Block(type=BlockType.WARMUP, work_time=12, rest_time=0, rounds=1))
+    workout.add_block(Block(type=BlockType.HEAVY_BAG, work_time=11, rest_time=4, rounds=3))
+    workout.add_block(Block(type=BlockType.STRENGTH, rest_time=5, rounds=3, exercises={"pushups": 3, "squats": 2}))
+    workout.add_block(Block(type=BlockType.STRENGTH, rest_time=2, rounds=2))
+    workout.add_block(Block(type=BlockType.COOLDOWN, work_time=3, rest_time=1))
+    return workout
+
+def _boundary_events(session):
+    return [
+        (type(e).__name__, e.model_dump(exclude={"event_id", "occurred_on", "started_at", "completed_at"}))
+        for e in session.collect_domain_events() if type(e).__name__ != "SessionTicked"
+    ]
+
+def _state(session):
+    return (session.status, session.current_block_index, session.current_round, session.is_work_phase, session.time_left)
+
+def test_advance_to_matches_ticking():
+    workout = _mixed_workout()
+    ticked = TrainingSession(workout=workout, id="s1")
+    ticked.start()
+    ticked.clear_domain_events()
+    total = ticked.timeline.total_seconds
+
+    for elapsed in range(1, total + 2):
+        ticked.tick()
+        assert ticked.elapsed_seconds == min(elapsed, total)
+
+        jumped = TrainingSession(workout=workout, id="s1")
+        jumped.start()
+        jumped.clear_domain_events()
+        jumped.advance_to(elapsed)
+        assert _state(jumped) == _state(ticked)
+
+    # Replaying the whole workout in one jump emits the same boundary events as ticking it
+    ticked = TrainingSession(workout=workout, id="s1")
+    ticked.start()
+    ticked.clear_domain_events()
+    while ticked.status == SessionStatus.RUNNING:
+        ticked.tick()
+    jumped = TrainingSession(workout=workout, id="s1")
+    jumped.start()
+    jumped.clear_domain_events()
+    assert jumped.advance_to(10_000) == total
+    assert _boundary_events(jumped) == _boundary_events(ticked)
+
+def test_seek_lands_on_phase_and_emits_only_its_events():
+    session = TrainingSession(workout=_mixed_workout(), id="s1")
+    session.start()
+    session.advance_to(40)
+    session.clear_domain_events()
+
+    # Back into the warmup
+    session.seek(5)
+    assert _state(session) == (SessionStatus.RUNNING, 0, 1, True, 7)
+    names = [type(e).__name__ for e in session.collect_domain_events()]
+    assert names == ["BlockStarted", "RoundStarted", "SessionTicked"]
+
+    session.seek(10_000)
+    assert session.status == SessionStatus.COMPLETED
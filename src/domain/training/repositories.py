@@ -28,3 +28,7 @@ class ISessionRepository(ABC):
     @abstractmethod
     async def get_by_id(self, session_id: str) -> Optional[TrainingSession]:
         pass
+
+    async def close(self) -> None:
+        """Flush pending writes and release resources. No-op by default."""
+        pass
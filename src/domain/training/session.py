@@ -7,8 +7,10 @@ import random
 from src.domain._base.aggregate_root import AggregateRoot
 from src.domain.training.workout import Workout
 from src.domain.training.value_objects import Block, BlockType, TechniqueCategory, ExerciseType
+from src.domain._base.domain_event import DomainEvent
+from src.domain.training.timeline import WorkoutTimeline, Phase
 from src.domain.training.events import (
-    SessionStarted, SessionPaused, SessionResumed, SessionCompleted,
+    SessionStarted, SessionPaused, SessionResumed, SessionCompleted, SessionTicked,
     BlockStarted, RoundStarted, RestStarted, AnnouncementTriggered
 )
 
@@ -30,6 +32,7 @@ class TrainingSession(AggregateRoot):
     _last_announcement_time: int = PrivateAttr(default=0)
     _current_exercise_index: int = PrivateAttr(default=0)
     _current_rep_count: int = PrivateAttr(default=1)
+    _timeline: Optional[WorkoutTimeline] = PrivateAttr(default=None)
 
     def start(self):
         if self.status == SessionStatus.IDLE:
@@ -240,6 +243,165 @@ class TrainingSession(AggregateRoot):
         else:
             self._go_to_next_block()
 
+    @property
+    def timeline(self) -> WorkoutTimeline:
+        """Compiled phase boundaries of the workout (built on first use)."""
+        if self._timeline is None:
+            self._timeline = WorkoutTimeline.compile(self.workout)
+        return self._timeline
+
+    @property
+    def elapsed_seconds(self) -> int:
+        """Ticked seconds since start, i.e. the session's position on its timeline."""
+        if self.status == SessionStatus.IDLE:
+            return 0
+        if self.status == SessionStatus.COMPLETED:
+            return self.timeline.total_seconds
+        offset = self.timeline.offset_of(
+            self.current_block_index, self.current_round, self.is_work_phase, self.time_left
+        )
+        return offset if offset is not None else 0
+
+    def advance_to(self, elapsed_seconds: int) -> int:
+        """
+        Move forward to `elapsed_seconds` as if tick() had been called once per second,
+        without stepping through every second: the phase is found by bisection and only
+        the boundary events crossed (and countdown announcements) are emitted, followed
+        by a single SessionTicked for the final position. Returns the seconds advanced.
+        """
+        if self.status != SessionStatus.RUNNING:
+            return 0
+        timeline = self.timeline
+        position = self.elapsed_seconds
+        if elapsed_seconds <= position:
+            return 0
+
+        start = position
+        target = min(elapsed_seconds, timeline.total_seconds)
+        i = timeline.phase_index_at(position)
+        while position < target:
+            phase = timeline.phases[i]
+            stop = min(target, phase.end)
+            self._announce_countdown(phase, phase.duration - (position - phase.start), phase.duration - (stop - phase.start))
+            position = stop
+            if position == phase.end:
+                i += 1
+                if i < len(timeline.phases):
+                    self._enter_phase(timeline.phases[i])
+
+        if i >= len(timeline.phases):
+            self._complete_at_end(timeline)
+        else:
+            self._move_to(timeline.phases[i], target)
+            self._emit_ticked()
+        return target - start
+
+    def seek(self, elapsed_seconds: int):
+        """
+        Jump to any position (forwards or backwards) without replaying what lies between.
+        Emits the events describing the landing phase only.
+        """
+        if self.status not in (SessionStatus.RUNNING, SessionStatus.PAUSED):
+            return
+        timeline = self.timeline
+        target = max(elapsed_seconds, 0)
+        i = timeline.phase_index_at(target)
+        if i >= len(timeline.phases):
+            self._complete_at_end(timeline)
+            return
+
+        phase = timeline.phases[i]
+        started = ("round",) if phase.is_work_phase else ("rest",)
+        if phase.block_index != self.current_block_index:
+            self._enter_phase(phase._replace(entry=(("block",), started)))
+        elif (phase.round, phase.is_work_phase) != (self.current_round, self.is_work_phase):
+            self._enter_phase(phase._replace(entry=(started,)))
+        self._move_to(phase, target)
+        self._emit_ticked()
+
+    def _move_to(self, phase: Phase, elapsed: int):
+        self.current_block_index = phase.block_index
+        self.current_round = phase.round
+        self.is_work_phase = phase.is_work_phase
+        self.time_left = max(phase.duration - (elapsed - phase.start), 0)
+
+    def _enter_phase(self, phase: Phase):
+        block = self.workout.blocks[phase.block_index]
+        for kind, *args in phase.entry:
+            if kind == "block":
+                self.add_domain_event(BlockStarted(
+                    session_id=str(self.id),
+                    block_index=phase.block_index,
+                    block_type=block.type,
+                    block_name=block.type
+                ))
+            elif kind == "round":
+                self.add_domain_event(RoundStarted(
+                    session_id=str(self.id),
+                    round_number=phase.round,
+                    total_rounds=block.rounds,
+                    duration=phase.duration
+                ))
+            elif kind == "rest":
+                self.add_domain_event(RestStarted(session_id=str(self.id), duration=phase.duration))
+            elif kind == "announce":
+                self._announce(args[0])
+
+    def _announce_countdown(self, phase: Phase, from_left: int, to_left: int):
+        # Same announcements as _handle_timer_logic for every time_left in [to_left, from_left)
+        for time_left in (10, 3, 2, 1):
+            if to_left <= time_left < from_left and (time_left <= 3 or phase.is_work_phase):
+                self._announce(str(time_left))
+
+    def _complete_at_end(self, timeline: WorkoutTimeline):
+        if timeline.phases:
+            self._move_to(timeline.phases[-1], timeline.total_seconds)
+        self.current_block_index = len(self.workout.blocks)
+        self.time_left = 0
+        self.status = SessionStatus.COMPLETED
+        self.add_domain_event(SessionCompleted(
+            session_id=str(self.id),
+            completed_at=datetime.now()
+        ))
+
+    def _emit_ticked(self):
+        self.add_domain_event(SessionTicked(
+            session_id=str(self.id),
+            current_block_index=self.current_block_index,
+            block_type=self.workout.blocks[self.current_block_index].type,
+            current_round=self.current_round,
+            time_left=self.time_left,
+            is_work_phase=self.is_work_phase
+        ))
+
+    def apply(self, event: DomainEvent):
+        """
+        Re-apply a stored event on top of a snapshot to rebuild state.
+        Mirrors the state change made when the event was raised; emits nothing.
+        """
+        if isinstance(event, (SessionStarted, SessionResumed)):
+            self.status = SessionStatus.RUNNING
+        elif isinstance(event, SessionPaused):
+            self.status = SessionStatus.PAUSED
+        elif isinstance(event, SessionCompleted):
+            self.status = SessionStatus.COMPLETED
+        elif isinstance(event, BlockStarted):
+            self.current_block_index = event.block_index
+            self.current_round = 1
+            self.is_work_phase = True
+        elif isinstance(event, RoundStarted):
+            self.current_round = event.round_number
+            self.is_work_phase = True
+            self.time_left = event.duration
+        elif isinstance(event, RestStarted):
+            self.is_work_phase = False
+            self.time_left = event.duration
+        elif isinstance(event, SessionTicked):
+            self.current_block_index = event.current_block_index
+            self.current_round = event.current_round
+            self.time_left = event.time_left
+            self.is_work_phase = event.is_work_phase
+
     def _announce(self, text: str):
         self.add_domain_event(AnnouncementTriggered(
             session_id=str(self.id),
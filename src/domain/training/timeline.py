@@ -0,0 +1,111 @@
+from bisect import bisect_right
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.domain.training.workout import Workout
+from src.domain.training.value_objects import Block, BlockType
+
+# Blocks that alternate work and rest for every round
+STANDARD_BLOCK_TYPES = (
+    BlockType.JUMP_ROPE, BlockType.HEAVY_BAG, BlockType.SPARRING,
+    BlockType.SHADOW_BOXING, BlockType.WARMUP, BlockType.COOLDOWN
+)
+
+class Phase(NamedTuple):
+    """
+    One work or rest phase of a compiled workout.
+    `start` is the elapsed (ticked) seconds at which the phase begins and `duration`
+    its countdown; a zero-length phase still takes one tick, like in TrainingSession.tick.
+    `entry` lists what is emitted on entering the phase, in order:
+    ("block",), ("round",), ("rest",) or ("announce", text).
+    """
+    block_index: int
+    round: int
+    is_work_phase: bool
+    duration: int
+    start: int
+    entry: Tuple[Tuple[str, ...], ...]
+
+    @property
+    def length(self) -> int:
+        return max(self.duration, 1)
+
+    @property
+    def end(self) -> int:
+        return self.start + self.length
+
+class WorkoutTimeline:
+    """
+    Precomputed phase boundaries of a workout, as TrainingSession.tick walks them.
+    Lets a session locate any elapsed time in O(log n) instead of ticking there.
+    """
+    def __init__(self, phases: List[Phase]):
+        self.phases = phases
+        self._starts = [phase.start for phase in phases]
+        # (block_index, round, is_work_phase) identifies a phase within a workout
+        self._by_key: Dict[Tuple[int, int, bool], int] = {
+            (p.block_index, p.round, p.is_work_phase): i for i, p in enumerate(phases)
+        }
+
+    @property
+    def total_seconds(self) -> int:
+        return self.phases[-1].end if self.phases else 0
+
+    @classmethod
+    def compile(cls, workout: Workout) -> "WorkoutTimeline":
+        return cls.from_blocks(workout.blocks)
+
+    @classmethod
+    def from_blocks(cls, blocks: Sequence[Block]) -> "WorkoutTimeline":
+        phases: List[Phase] = []
+
+        def add(block_index: int, round: int, is_work: bool, duration: int, entry):
+            start = phases[-1].end if phases else 0
+            phases.append(Phase(block_index, round, is_work, duration, start, tuple(entry)))
+
+        block_start = (("block",), ("round",))
+        rest = (("rest",), ("announce", "Rest"))
+        for b, block in enumerate(blocks):
+            if block.type == BlockType.STRENGTH:
+                exercises = list(block.exercises.items())
+                add(b, 1, True, int(exercises[0][1] * 2) if exercises else 60, block_start)
+                # Strength moves to the next round when entering the rest
+                for r in range(2, block.rounds + 1):
+                    add(b, r, False, block.rest_time, rest)
+                    if exercises:
+                        name, reps = exercises[(r - 1) % len(exercises)]
+                        add(b, r, True, int(reps * 2), (("announce", f"Set {r}: {name}"), ("round",)))
+                    else:
+                        add(b, r, True, 0, ())
+            elif block.type in STANDARD_BLOCK_TYPES:
+                for r in range(1, max(block.rounds, 1) + 1):
+                    entry = block_start if r == 1 else (("round",), ("announce", f"Round {r}"))
+                    add(b, r, True, block.work_time, entry)
+                    add(b, r, False, block.rest_time, rest)
+            else:
+                add(b, 1, True, block.work_time, block_start)
+        return cls(phases)
+
+    def announcements(self) -> Iterator[Tuple[int, str]]:
+        """(elapsed, text) of every AnnouncementTriggered a full run of the workout emits, in order."""
+        for phase in self.phases:
+            for kind, *args in phase.entry:
+                if kind == "announce":
+                    yield phase.start, args[0]
+            # Countdown, as in TrainingSession._handle_timer_logic
+            for time_left in (10, 3, 2, 1):
+                if time_left < phase.duration and (time_left <= 3 or phase.is_work_phase):
+                    yield phase.start + phase.duration - time_left, str(time_left)
+
+    def phase_index_at(self, elapsed: int) -> int:
+        """Index of the phase containing `elapsed`, or len(phases) once the workout is over."""
+        if elapsed >= self.total_seconds:
+            return len(self.phases)
+        return max(bisect_right(self._starts, elapsed) - 1, 0)
+
+    def offset_of(self, block_index: int, round: int, is_work_phase: bool, time_left: int) -> Optional[int]:
+        """Elapsed seconds corresponding to a session state, or None if it is not on the timeline."""
+        i = self._by_key.get((block_index, round, is_work_phase))
+        if i is None:
+            return None
+        phase = self.phases[i]
+        return phase.start + min(max(phase.duration - time_left, 0), phase.length - 1)
@@ -0,0 +1,70 @@
+import pytest
+import os
+import shutil
+import anyio
+from src.infrastructure._common.storage.atomic_file import atomic_write
+from src.infrastructure._common.storage.fsync_policy import FsyncPolicy, FsyncMode
+
+TEST_DIR = ".osu_test_storage"
+
+@pytest.fixture
+def test_dir():
+    if os.path.exists(TEST_DIR):
+        shutil.rmtree(TEST_DIR)
+    os.makedirs(TEST_DIR)
+    yield TEST_DIR
+    shutil.rmtree(TEST_DIR)
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("mode", [FsyncMode.ALWAYS, FsyncMode.BATCHED, FsyncMode.NEVER])
+async def test_atomic_write_replaces_content(test_dir, mode):
+    path = os.path.join(test_dir, "state.json")
+    policy = FsyncPolicy(mode, batch_interval_ms=1)
+
+    await atomic_write(path, '{"v": 1}', policy)
+    await atomic_write(path, b'{"v": 2}', policy)
+
+    with open(path) as f:
+        assert f.read() == '{"v": 2}'
+    # No temp files are left behind
+    assert os.listdir(test_dir) == ["state.json"]
+
+@pytest.mark.anyio
+async def test_atomic_write_keeps_old_content_on_failure(test_dir):
+    path = os.path.join(test_dir, "state.json")
+    await atomic_write(path, "old")
+
+    with pytest.raises(TypeError):
+        await atomic_write(path, 42)
+
+    with open(path) as f:
+        assert f.read() == "old"
+    assert os.listdir(test_dir) == ["state.json"]
+
+@pytest.mark.anyio
+async def test_batched_policy_groups_concurrent_syncs(test_dir):
+    paths = []
+    for i in range(8):
+        path = os.path.join(test_dir, f"stream-{i}.jsonl")
+        with open(path, "w") as f:
+            f.write("{}\n")
+        paths.append(path)
+
+    policy = FsyncPolicy(FsyncMode.BATCHED, batch_interval_ms=5)
+    async with anyio.create_task_group() as tg:
+        for path in paths:
+            tg.start_soon(policy.sync, path)
+    assert policy.commits == 1
+    # A write after the commit opens the next window
+    await policy.sync(paths[0])
+    assert policy.commits == 2
+
+    always = FsyncPolicy(FsyncMode.ALWAYS)
+    async with anyio.create_task_group() as tg:
+        for path in paths:
+            tg.start_soon(always.sync, path)
+    assert always.commits == len(paths)
+
+    never = FsyncPolicy(FsyncMode.NEVER)
+    await never.sync(*paths)
+    assert never.commits == 0
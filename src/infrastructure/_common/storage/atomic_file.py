@@ -0,0 +1,33 @@
+import os
+import tempfile
+from typing import Optional, Union
+
+from src.infrastructure._common.storage.fsync_policy import FsyncPolicy, FsyncMode
+
+_NO_FSYNC = FsyncPolicy(FsyncMode.NEVER)
+
+async def atomic_write(path: str, data: Union[str, bytes], fsync_policy: Optional[FsyncPolicy] = None) -> None:
+    """
+    Replace `path` with `data` atomically: readers see either the old or the new
+    content, never a truncated file. The data is written to a temp file in the
+    same directory, made durable according to `fsync_policy`, then renamed over
+    `path`; the directory is synced afterwards so the rename itself is durable.
+    """
+    policy = fsync_policy or _NO_FSYNC
+    directory = os.path.dirname(path) or "."
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        await policy.sync(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    await policy.sync(directory)
@@ -0,0 +1,103 @@
+import os
+import logging
+from enum import Enum
+from typing import Optional, Set
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+class FsyncMode(str, Enum):
+    ALWAYS = "always"    # fsync on every write, before returning
+    BATCHED = "batched"  # group commit: one fsync pass every batch_interval_ms, shared by all writers
+    NEVER = "never"      # leave flushing to the OS (survives process crashes, not power loss)
+
+def fsync_path(path: str):
+    """fsync a file or directory by path (a directory fsync makes renames in it durable)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+class _Batch:
+    """One group commit: the paths to fsync and the writers waiting for them."""
+    def __init__(self):
+        self.paths: Set[str] = set()
+        self.done = anyio.Event()
+        self.error: Optional[OSError] = None
+
+class FsyncPolicy:
+    """
+    Durability policy shared by the file-based stores.
+    Writers call `await policy.sync(path, ...)` after writing; the call returns once
+    the data is as durable as the mode promises. In BATCHED mode every path
+    requested during a window is fsynced once, so many concurrent sessions
+    writing at the same time share a single commit.
+
+    The first writer of a window commits it (after batch_interval_ms) and the others
+    wait for that commit, so no background task is needed and the policy works on
+    any anyio backend. The commit is one fsync pass per window, run inline like
+    ALWAYS mode's, but shared by every writer of the window.
+
+    Durability is opt-in: the default, NEVER, adds nothing to a write. ALWAYS and
+    BATCHED fsync on the event loop (and BATCHED first waits for its window), so
+    they cost every write some latency.
+    """
+    def __init__(self, mode: FsyncMode = FsyncMode.NEVER, batch_interval_ms: float = 5.0):
+        self.mode = FsyncMode(mode)
+        self.batch_interval_ms = batch_interval_ms
+        self._batch: Optional[_Batch] = None
+        self.commits = 0
+
+    async def sync(self, *paths: str) -> None:
+        if self.mode == FsyncMode.NEVER or not paths:
+            return
+        if self.mode == FsyncMode.ALWAYS:
+            for path in paths:
+                fsync_path(path)
+            self.commits += 1
+            return
+
+        batch = self._batch
+        if batch is None:
+            batch = self._batch = _Batch()
+            batch.paths.update(paths)
+            # Shielded: the writers waiting on this commit are released even if its leader is cancelled
+            with anyio.CancelScope(shield=True):
+                await self._commit(batch)
+        else:
+            batch.paths.update(paths)
+            await batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+
+    async def flush(self) -> None:
+        """Commit everything pending now (e.g. at shutdown)."""
+        if self._batch is not None:
+            await self._batch.done.wait()
+
+    async def _commit(self, batch: _Batch):
+        try:
+            await anyio.sleep(self.batch_interval_ms / 1000)
+            # Writers arriving from now on open the next window
+            self._batch = None
+            try:
+                self._fsync_all(batch.paths)
+                self.commits += 1
+            except OSError as e:
+                logger.error(f"Group commit failed: {e}")
+                batch.error = e
+        finally:
+            if self._batch is batch:
+                self._batch = None
+            batch.done.set()
+
+    @staticmethod
+    def _fsync_all(paths: Set[str]):
+        for path in paths:
+            try:
+                fsync_path(path)
+            except FileNotFoundError:
+                # The file may have been removed since it was written
+                pass
@@ -0,0 +1,69 @@
+import pytest
+import io
+import os
+import shutil
+import wave
+import numpy as np
+from src.infrastructure.audio.sinks import PipePlayerSink, RawPcmSink, NullSink, WavCaptureSink, as_pcm
+
+TEST_DIR = ".osu_test_sinks"
+
+@pytest.fixture
+def test_dir():
+    if os.path.exists(TEST_DIR):
+        shutil.rmtree(TEST_DIR)
+    os.makedirs(TEST_DIR)
+    yield TEST_DIR
+    shutil.rmtree(TEST_DIR)
+
+def _tone(seconds=0.05, sample_rate=24000):
+    t = np.arange(int(seconds * sample_rate), dtype=np.float32) / sample_rate
+    return (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+def test_as_pcm_is_zero_copy_for_float32():
+    audio = _tone()
+    pcm = as_pcm(audio)
+    assert len(pcm) == audio.nbytes
+    assert np.shares_memory(np.frombuffer(pcm, dtype=np.float32), audio)
+
+@pytest.mark.anyio
+async def test_capture_sinks(test_dir):
+    audio = _tone()
+    path = os.path.join(test_dir, "capture.wav")
+    capture = WavCaptureSink(path)
+    await capture.play(audio, 24000)
+    await capture.play(audio, 24000)
+    assert capture.buffers[0][0] is audio
+    await capture.close()
+
+    with wave.open(path) as f:
+        assert f.getframerate() == 24000
+        assert f.getnframes() == 2 * len(audio)
+
+    null = NullSink()
+    await null.play(audio, 24000)
+    assert null.played == 1 and null.seconds == pytest.approx(0.05)
+
+@pytest.mark.anyio
+async def test_raw_pcm_sink_writes_float32():
+    stream = io.BytesIO()
+    sink = RawPcmSink(stream)
+    await sink.play(_tone(), 24000)
+    assert np.array_equal(np.frombuffer(stream.getvalue(), dtype=np.float32), _tone())
+
+@pytest.mark.anyio
+# The player process is driven through asyncio subprocess pipes
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_pipe_player_sink_reuses_one_process(test_dir):
+    out = os.path.join(test_dir, "player.raw")
+    sink = PipePlayerSink(["sh", "-c", f"cat > {out}", "{rate}"])
+
+    await sink.play(_tone(), 24000)
+    process = sink._process
+    await sink.play(_tone(), 24000)
+    assert sink._process is process
+    await sink.close()
+
+    with open(out, "rb") as f:
+        played = np.frombuffer(f.read(), dtype=np.float32)
+    assert np.array_equal(played, np.concatenate([_tone(), _tone()]))
@@ -0,0 +1,31 @@
+import pytest
+from src.domain.training.session import TrainingSession
+from src.domain.training.workout import Workout
+from src.domain.training.value_objects import Block, BlockType
+from src.infrastructure.events.store.event_store import ConcurrencyError
+from src.infrastructure.events.store.in_memory_event_store import InMemoryEventStore
+from src.infrastructure.training.repositories.in_memory_session_repository import InMemorySessionRepository
+
+def _session():
+    workout = Workout(name="Race", id="w1", blocks=[Block(type=BlockType.HEAVY_BAG, work_time=3, rest_time=2, rounds=2)])
+    return TrainingSession(workout=workout, id="s1")
+
+@pytest.mark.anyio
+async def test_concurrent_writers_of_a_session_conflict():
+    store = InMemoryEventStore()
+    first, second = InMemorySessionRepository(store), InMemorySessionRepository(store)
+
+    mine = _session()
+    mine.start()
+    await first.save(mine)
+    mine.pause()
+    await first.save(mine)
+
+    stored = list(await store.get("s1"))
+
+    # The second writer never saw the events the first one stored
+    theirs = _session()
+    theirs.start()
+    with pytest.raises(ConcurrencyError):
+        await second.save(theirs)
+    assert await store.get("s1") == stored
@@ -0,0 +1,188 @@
+import pytest
+import os
+import shutil
+from src.domain.training.session import TrainingSession, SessionStatus
+from src.domain.training.workout import Workout
+from src.domain.training.value_objects import Block, BlockType
+from src.infrastructure.events.store.osu_event_store import OsuFileEventStore
+from src.infrastructure.events.store.event_store import ConcurrencyError
+from src.infrastructure.events.store.snapshot_policy import SnapshotPolicy
+from src.infrastructure.training.repositories.osu_session_repository import OsuSessionRepository
+
+TEST_DIR = ".osu_test_session_repo"
+
+@pytest.fixture
+def test_dir():
+    if os.path.exists(TEST_DIR):
+        shutil.rmtree(TEST_DIR)
+    yield TEST_DIR
+    shutil.rmtree(TEST_DIR)
+
+@pytest.mark.anyio
+async def test_load_restores_snapshot_and_applies_tail(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    repo = OsuSessionRepository(
+        event_store=store,
+        base_path=os.path.join(test_dir, "sessions"),
+        snapshot_policy=SnapshotPolicy(every_events=None, every_seconds=None),
+        cache_sessions=False
+    )
+
+    workout = Workout(name="Tail", id="w1", blocks=[Block(type=BlockType.HEAVY_BAG, work_time=3, rest_time=2, rounds=2)])
+    session = TrainingSession(workout=workout, id="s1")
+    session.start()
+    await repo.save(session)  # first save always snapshots
+
+    for _ in range(3):
+        session.tick()
+        await repo.save(session)
+
+    snapshot = await repo.snapshot_store.get("s1")
+    assert snapshot.aggregate.is_work_phase is True
+    assert snapshot.aggregate.time_left == 3
+
+    # The stored tail (RestStarted, ...) brings the snapshot up to date
+    loaded = await repo.get_by_id("s1")
+    assert loaded.status == SessionStatus.RUNNING
+    assert loaded.is_work_phase is False
+    assert loaded.time_left == 2
+
+@pytest.mark.anyio
+async def test_cached_sessions_write_snapshots_behind(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    repo = OsuSessionRepository(
+        event_store=store,
+        base_path=os.path.join(test_dir, "sessions"),
+        snapshot_policy=SnapshotPolicy(every_events=None, every_seconds=60)
+    )
+
+    workout = Workout(name="Cache", id="w1", blocks=[Block(type=BlockType.HEAVY_BAG, work_time=10, rest_time=5)])
+    session = TrainingSession(workout=workout, id="s1")
+    session.start()
+    await repo.save(session)
+
+    for _ in range(3):
+        cached = await repo.get_by_id("s1")
+        assert cached is session
+        cached.tick()
+        await repo.save(cached)
+
+    # Ticks are coalesced: the snapshot on disk is still the one from start()
+    assert (await repo.snapshot_store.get("s1")).aggregate.time_left == 10
+
+    # Pausing flushes immediately
+    session.pause()
+    await repo.save(session)
+    assert (await repo.snapshot_store.get("s1")).aggregate.time_left == 7
+
+    # Dirty state is flushed at shutdown
+    session.start()
+    session.tick()
+    await repo.save(session)
+    await repo.close()
+    assert (await repo.snapshot_store.get("s1")).aggregate.time_left == 6
+
+@pytest.mark.anyio
+async def test_write_behind_snapshot_is_the_state_saved(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    repo = OsuSessionRepository(
+        event_store=store,
+        base_path=os.path.join(test_dir, "sessions"),
+        snapshot_policy=SnapshotPolicy(every_events=None, every_seconds=60)
+    )
+
+    workout = Workout(name="Copy", id="w1", blocks=[Block(type=BlockType.HEAVY_BAG, work_time=10, rest_time=5)])
+    session = TrainingSession(workout=workout, id="s1")
+    session.start()
+    await repo.save(session)
+    session.tick()
+    await repo.save(session)
+
+    # Changed but not saved yet when the flusher runs: the pause is not in the snapshot's version
+    session.pause()
+    assert await repo.flush() == 1
+    snapshot = await repo.snapshot_store.get("s1")
+    assert snapshot.aggregate.status == SessionStatus.RUNNING and snapshot.aggregate.time_left == 9
+
+    await repo.save(session)
+    reloaded = await OsuSessionRepository(event_store=store, base_path=os.path.join(test_dir, "sessions")).get_by_id("s1")
+    assert reloaded.status == SessionStatus.PAUSED and reloaded.time_left == 9
+
+@pytest.mark.anyio
+async def test_concurrent_writers_of_a_session_conflict(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    def repository():
+        return OsuSessionRepository(event_store=store, base_path=os.path.join(test_dir, "sessions"))
+
+    workout = Workout(name="Race", id="w1", blocks=[Block(type=BlockType.HEAVY_BAG, work_time=3, rest_time=2, rounds=2)])
+    session = TrainingSession(workout=workout, id="s1")
+    session.start()
+    await repository().save(session)
+
+    first, second = repository(), repository()
+    mine, theirs = await first.get_by_id("s1"), await second.get_by_id("s1")
+    mine.pause()
+    await first.save(mine)
+
+    # The second writer loaded the session before the pause was stored
+    theirs.pause()
+    with pytest.raises(ConcurrencyError):
+        await second.save(theirs)
+
+@pytest.mark.anyio
+async def test_uncached_sessions_flush_on_close(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    repo = OsuSessionRepository(
+        event_store=store,
+        base_path=os.path.join(test_dir, "sessions"),
+        snapshot_policy=SnapshotPolicy(every_events=None, every_seconds=60),
+        cache_sessions=False
+    )
+
+    workout = Workout(name="NoCache", id="w1", blocks=[Block(type=BlockType.HEAVY_BAG, work_time=10, rest_time=5)])
+    session = TrainingSession(workout=workout, id="s1")
+    session.start()
+    await repo.save(session)
+    session.tick()
+    await repo.save(session)
+
+    assert await repo.flush() == 1
+    assert (await repo.snapshot_store.get("s1")).aggregate.time_left == 9
+    await repo.close()
+
+@pytest.mark.anyio
+async def test_least_recently_used_and_paused_sessions_are_evicted(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    repo = OsuSessionRepository(
+        event_store=store,
+        base_path=os.path.join(test_dir, "sessions"),
+        snapshot_policy=SnapshotPolicy(every_events=None, every_seconds=60),
+        max_sessions=2
+    )
+
+    workout = Workout(name="Evict", id="w1", blocks=[Block(type=BlockType.HEAVY_BAG, work_time=10, rest_time=5)])
+    sessions = [TrainingSession(workout=workout, id=f"s{i}") for i in range(3)]
+    for session in sessions:
+        session.start()
+        await repo.save(session)
+        session.tick()
+        await repo.save(session)
+
+    # The oldest session was evicted with its dirty snapshot written first
+    assert set(repo._cache) == {"s1", "s2"}
+    assert set(repo._since_snapshot) == {"s1", "s2"}
+    assert (await repo.snapshot_store.get("s0")).aggregate.time_left == 9
+
+    # Saving an evicted session continues from its snapshot's version
+    sessions[0].tick()
+    await repo.save(sessions[0])
+    assert set(repo._cache) == {"s2", "s0"}
+    assert (await repo.get_by_id("s0")) is sessions[0]
+
+    # Paused sessions are dropped once snapshotted, and reloaded on demand
+    sessions[2].pause()
+    await repo.save(sessions[2])
+    assert set(repo._cache) == set(repo._versions) == {"s0"}
+    reloaded = await repo.get_by_id("s2")
+    assert reloaded is not sessions[2]
+    assert reloaded.status == SessionStatus.PAUSED and reloaded.time_left == 9
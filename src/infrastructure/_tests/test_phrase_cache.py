@@ -0,0 +1,70 @@
+import pytest
+import os
+import shutil
+import numpy as np
+from src.infrastructure.audio.phrase_cache import PhraseCache
+
+TEST_DIR = ".osu_test_phrase_cache"
+
+@pytest.fixture
+def cache_dir():
+    if os.path.exists(TEST_DIR):
+        shutil.rmtree(TEST_DIR)
+    yield TEST_DIR
+    shutil.rmtree(TEST_DIR)
+
+def _audio(seconds=0.1, sample_rate=24000):
+    return np.linspace(-1, 1, int(seconds * sample_rate), dtype=np.float32)
+
+def test_phrase_cache_key_depends_on_voice_settings():
+    key = PhraseCache.key("Rest", "ff_siwis", 1.0, "prince-canuma/Kokoro-82M")
+    assert key == PhraseCache.key("Rest", "ff_siwis", 1, "prince-canuma/Kokoro-82M")
+    assert key != PhraseCache.key("Rest", "af_heart", 1.0, "prince-canuma/Kokoro-82M")
+    assert key != PhraseCache.key("Rest", "ff_siwis", 1.2, "prince-canuma/Kokoro-82M")
+    assert key != PhraseCache.key("Repos", "ff_siwis", 1.0, "prince-canuma/Kokoro-82M")
+
+def test_phrase_cache_round_trip_survives_restart(cache_dir):
+    cache = PhraseCache(base_path=cache_dir)
+    key = PhraseCache.key("3", "ff_siwis", 1.0, "repo")
+    assert cache.get(key) is None
+
+    cache.put(key, _audio(), 24000)
+    audio, sample_rate = cache.get(key)
+    assert sample_rate == 24000 and np.array_equal(audio, _audio())
+
+    reopened = PhraseCache(base_path=cache_dir)
+    audio, sample_rate = reopened.get(key)
+    assert sample_rate == 24000 and np.array_equal(audio, _audio())
+    assert [f for f in os.listdir(cache_dir) if f.endswith(".tmp")] == []
+
+def test_phrase_cache_evicts_least_recently_used(cache_dir):
+    entry_size = _audio().nbytes + 128  # npy header
+    cache = PhraseCache(base_path=cache_dir, max_bytes=int(entry_size * 2.5), memory_items=1)
+    keys = [PhraseCache.key(text, "v", 1.0, "repo") for text in ("3", "2", "1")]
+
+    cache.put(keys[0], _audio(), 24000)
+    cache.put(keys[1], _audio(), 24000)
+    cache.get(keys[0])  # "3" is now more recent than "2"
+    cache.put(keys[2], _audio(), 24000)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+    assert cache.size_bytes <= cache.max_bytes
+
+def test_phrase_cache_partitions_have_their_own_budget(cache_dir):
+    entry_size = _audio().nbytes + 128
+    cache = PhraseCache(base_path=cache_dir, max_bytes=int(entry_size * 1.5), memory_items=1)
+    default_key = PhraseCache.key("Rest", "ff_siwis", 1.0, "repo")
+    cache.put(default_key, _audio(), 24000)
+
+    gandalf = cache.partition("gandalf")
+    assert cache.partition("gandalf") is gandalf
+    for text in ("Rest", "Round 2", "Round 3"):
+        gandalf.put(PhraseCache.key(text, "bm_george", 0.85, "repo", pitch=-3.0), _audio(), 24000)
+
+    # Filling a partition never evicts the default profile's phrases
+    assert cache.get(default_key) is not None
+    assert PhraseCache(base_path=cache_dir).size_bytes == cache.size_bytes
+    assert PhraseCache.key("Rest", "v", 1.0, "repo", pitch=0.0) == PhraseCache.key("Rest", "v", 1.0, "repo")
+    assert PhraseCache.key("Rest", "v", 1.0, "repo", pitch=-2.0) != PhraseCache.key("Rest", "v", 1.0, "repo")
@@ -0,0 +1,51 @@
+import threading
+from src.infrastructure.workers.phrase_prerender_worker import PhrasePrerenderWorker
+from src.application.audio_service.dtos import PrefetchBatchResponse
+
+class RecordingAudioService:
+    def __init__(self, failing=()):
+        self.prefetched = []
+        self.batches = []
+        self.failing = set(failing)
+        self.release = threading.Event()
+
+    async def prefetch_batch(self, request):
+        self.release.wait(5)
+        self.batches.append(list(request.texts))
+        self.prefetched.extend(request.texts)
+        failed = [text for text in request.texts if text in self.failing]
+        return PrefetchBatchResponse(success=not failed, failed=failed)
+
+def test_prerender_worker_renders_each_phrase_once_earliest_first():
+    audio = RecordingAudioService()
+    worker = PhrasePrerenderWorker(audio, workers=1)
+
+    assert worker.submit([(30, "Round 2"), (0, "Jab"), (10, "10")], "en") == 3
+    # Already queued phrases are skipped
+    assert worker.submit([(5, "Jab"), (12, "Rest")], "en") == 1
+
+    worker.start()
+    audio.release.set()
+    worker.join()
+    worker.stop()
+
+    assert audio.prefetched == ["Jab", "10", "Rest", "Round 2"]
+    assert worker.rendered == 4
+
+def test_prerender_worker_renders_a_vocabulary_in_one_batch_and_retries_failures():
+    audio = RecordingAudioService(failing={"Round 3"})
+    worker = PhrasePrerenderWorker(audio, workers=1, batch_size=64)
+
+    vocabulary = [(i, f"Round {i}") for i in range(60)]
+    worker.submit(vocabulary, "fr")
+    worker.submit([(0, "Repos")], "en")
+    audio.release.set()
+    worker.start()
+    worker.join()
+    worker.stop()
+
+    # One pass for the French vocabulary, one for the English phrase
+    assert sorted(map(len, audio.batches)) == [1, 60]
+    assert worker.rendered == 60
+    # The failed phrase can be submitted again
+    assert worker.submit([(0, "Round 3"), (0, "Round 4")], "fr") == 1
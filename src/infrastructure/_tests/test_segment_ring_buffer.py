@@ -0,0 +1,56 @@
+import pytest
+import asyncio
+import threading
+from src.infrastructure.audio.segment_ring_buffer import SegmentRingBuffer
+
+@pytest.fixture
+def anyio_backend():
+    # SegmentRingBuffer hands items over through asyncio futures
+    return "asyncio"
+
+def _produce(ring, items, log):
+    try:
+        for item in items:
+            if not ring.put(item):
+                log.append("cancelled")
+                return
+            log.append(item)
+    except Exception as e:
+        ring.close(error=e)
+    else:
+        ring.close()
+
+@pytest.mark.anyio
+async def test_ring_buffer_hands_over_items_in_order_with_backpressure():
+    ring = SegmentRingBuffer(capacity=2)
+    produced = []
+    producer = asyncio.create_task(asyncio.to_thread(_produce, ring, list(range(20)), produced))
+
+    # The producer cannot run more than `capacity` items ahead of the consumer
+    await asyncio.sleep(0.05)
+    assert len(produced) == 2
+
+    received = [item async for item in ring]
+    await producer
+    assert received == list(range(20))
+
+@pytest.mark.anyio
+async def test_ring_buffer_cancel_stops_producer_and_errors_propagate():
+    ring = SegmentRingBuffer(capacity=1)
+    produced = []
+    producer = asyncio.create_task(asyncio.to_thread(_produce, ring, list(range(10)), produced))
+    assert await ring.get() == 0
+    ring.cancel()
+    await producer
+    assert produced[-1] == "cancelled"
+    assert len(produced) <= 3
+
+    def failing():
+        yield 1
+        raise RuntimeError("model crashed")
+
+    ring = SegmentRingBuffer(capacity=4)
+    asyncio.get_running_loop().run_in_executor(None, _produce, ring, failing(), [])
+    assert await ring.get() == 1
+    with pytest.raises(RuntimeError):
+        await ring.get()
@@ -0,0 +1,109 @@
+import pytest
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from src.infrastructure.workers.session_tick_scheduler import SessionTickScheduler
+from src.infrastructure.events.bus.in_memory_event_bus import InMemoryEventBus
+from src.application.training_service.dtos.training_response_dtos import TickSessionResponse
+from src.domain.training.events import SessionCompleted, SessionPaused
+from src.domain.training.session import SessionStatus
+
+@pytest.fixture
+def anyio_backend():
+    # The scheduler loop is an asyncio task
+    return "asyncio"
+
+def _service():
+    service = AsyncMock()
+    service.tick_session.return_value = MagicMock(success=True)
+    return service
+
+def _ticked_ids(service):
+    return [call.args[0].session_id for call in service.tick_session.call_args_list]
+
+@pytest.mark.anyio
+async def test_scheduler_ticks_due_sessions_in_one_batch():
+    service = _service()
+    scheduler = SessionTickScheduler(service, interval=1.0)
+    for i in range(1000):
+        scheduler.register(f"s{i}", first_tick_in=0)
+
+    assert await scheduler.run_due() == 1000
+    # Next deadlines are one interval later: nothing is due yet
+    assert await scheduler.run_due() == 0
+    assert sorted(_ticked_ids(service)) == sorted(f"s{i}" for i in range(1000))
+
+@pytest.mark.anyio
+async def test_scheduler_deadlines_do_not_drift():
+    service = _service()
+    scheduler = SessionTickScheduler(service, interval=1.0)
+    scheduler.register("s", first_tick_in=0)
+    start = scheduler._heap[0][0]
+
+    # Ticking late does not push the following deadlines back
+    await scheduler.run_due(now=start + 0.4)
+    await scheduler.run_due(now=start + 1.3)
+    assert scheduler._heap[0][0] == pytest.approx(start + 2.0)
+
+    # Falling behind replays the missed ticks
+    await scheduler.run_due(now=start + 4.0)
+    assert service.tick_session.call_count == 5
+
+@pytest.mark.anyio
+async def test_scheduler_catches_up_a_long_delay_in_one_tick():
+    service = _service()
+    scheduler = SessionTickScheduler(service, interval=1.0, max_catch_up=5)
+    scheduler.register("s", first_tick_in=0)
+    start = scheduler._heap[0][0]
+    await scheduler.run_due(now=start)
+
+    # Suspended for 20s: the missed ticks are applied at once, none is dropped
+    await scheduler.run_due(now=start + 20.5)
+    assert [call.args[0].seconds for call in service.tick_session.call_args_list] == [1, 20]
+    assert scheduler._heap[0][0] == pytest.approx(start + 21.0)
+
+@pytest.mark.anyio
+async def test_scheduler_without_bus_unregisters_sessions_that_stopped_running():
+    service = _service()
+    scheduler = SessionTickScheduler(service, interval=1.0)
+    statuses = {"done": SessionStatus.COMPLETED, "paused": SessionStatus.PAUSED, "running": SessionStatus.RUNNING}
+    for session_id in statuses:
+        scheduler.register(session_id, first_tick_in=0)
+    service.tick_session.side_effect = lambda request: TickSessionResponse(status=statuses[request.session_id])
+
+    await scheduler.run_due()
+    assert scheduler.session_count == 1
+    assert scheduler.is_registered("running")
+
+@pytest.mark.anyio
+async def test_scheduler_unregisters_completed_paused_and_failing_sessions():
+    bus = InMemoryEventBus()
+    service = _service()
+    scheduler = SessionTickScheduler(service, interval=1.0, event_bus=bus)
+    for session_id in ("done", "paused", "missing", "running"):
+        scheduler.register(session_id, first_tick_in=0)
+
+    async def tick(request):
+        if request.session_id == "done":
+            await bus.publish([SessionCompleted(session_id="done", completed_at=datetime.now())])
+        elif request.session_id == "paused":
+            await bus.publish([SessionPaused(session_id="paused", paused_at=datetime.now())])
+        return MagicMock(success=request.session_id != "missing")
+    service.tick_session.side_effect = tick
+
+    await scheduler.run_due()
+    assert scheduler.session_count == 1
+    assert scheduler.is_registered("running")
+
+@pytest.mark.anyio
+async def test_scheduler_loop_drives_registered_sessions():
+    service = _service()
+    scheduler = SessionTickScheduler(service, interval=0.02)
+    await scheduler.start()
+    scheduler.register("a")
+    scheduler.register("b")
+    await asyncio.sleep(0.11)
+    await scheduler.stop()
+
+    ids = _ticked_ids(service)
+    assert ids.count("a") >= 3 and ids.count("b") >= 3
@@ -0,0 +1,62 @@
+import os
+import time
+import pytest
+import numpy as np
+from src.infrastructure.audio.tts_process_pool import TtsProcessPool
+
+@pytest.fixture
+def anyio_backend():
+    # The pool awaits its workers through the asyncio event loop
+    return "asyncio"
+
+def fake_synthesizer_factory(repo_id):
+    """Top-level so worker processes can unpickle it; 'synthesizes' the worker's pid."""
+    def synthesize(text, voice, speed):
+        time.sleep(0.05)
+        if not text:
+            return None, 16000
+        return np.full(len(text), os.getpid(), dtype=np.float64), 16000
+    return synthesize
+
+def marking_synthesizer_factory(directory):
+    """Marks each process whose model is loaded in `directory` (passed as the repo_id); the first one loads slowly."""
+    try:
+        os.close(os.open(os.path.join(directory, "slow"), os.O_CREAT | os.O_EXCL))
+        time.sleep(1.0)
+    except FileExistsError:
+        pass
+    open(os.path.join(directory, f"loaded-{os.getpid()}"), "w").close()
+    return fake_synthesizer_factory(directory)
+
+def test_pool_is_ready_once_every_process_loaded_its_model(tmp_path):
+    pool = TtsProcessPool(str(tmp_path), workers=3, synthesizer_factory=marking_synthesizer_factory)
+    try:
+        pool.start()
+        # The fast processes may answer every readiness ping before the slow one has loaded
+        assert pool.wait_ready(30)
+        assert len([name for name in os.listdir(tmp_path) if name.startswith("loaded-")]) == 3
+    finally:
+        pool.shutdown()
+
+@pytest.mark.anyio
+async def test_pool_synthesizes_across_processes_in_order():
+    pool = TtsProcessPool("fake/model", workers=2, synthesizer_factory=fake_synthesizer_factory)
+    try:
+        pool.start()
+        assert pool.wait_ready(30)
+        assert pool.is_ready
+
+        texts = [f"phrase {i}" for i in range(12)] + [""]
+        results = await pool.synthesize_many(texts, "ff_siwis", 1.0)
+
+        assert [len(audio) for audio, _ in results[:-1]] == [len(text) for text in texts[:-1]]
+        assert results[-1] == (None, 16000)
+        pids = {int(audio[0]) for audio, _ in results[:-1]}
+        assert os.getpid() not in pids
+        assert len(pids) == 2
+
+        audio, sample_rate = await pool.synthesize("Rest", "ff_siwis", 1.0)
+        assert len(audio) == 4 and sample_rate == 16000
+    finally:
+        pool.shutdown()
+    assert not pool.is_ready
@@ -0,0 +1,19 @@
+import numpy as np
+from src.domain.training.value_objects import VoiceProfile
+from src.infrastructure.audio.voice_profiles import KOKORO_VOICE_PROFILES, pitch_ratio, shift_pitch
+
+def test_every_profile_but_default_has_kokoro_settings():
+    assert set(KOKORO_VOICE_PROFILES) == set(VoiceProfile) - {VoiceProfile.DEFAULT}
+
+def test_shift_pitch_resamples_by_the_semitone_ratio():
+    rate = 24000
+    tone = np.sin(2 * np.pi * 220 * np.arange(rate) / rate).astype(np.float32)
+
+    shifted = shift_pitch(tone, 12.0)
+    assert pitch_ratio(12.0) == 2.0
+    assert shifted.dtype == np.float32
+    assert abs(len(shifted) - rate / 2) <= 1
+    # An octave up: twice as many zero crossings per sample
+    crossings = lambda a: np.count_nonzero(np.diff(np.signbit(a))) / len(a)
+    assert abs(crossings(shifted) / crossings(tone) - 2.0) < 0.05
+    assert shift_pitch(tone, 0.0) is tone
@@ -0,0 +1,76 @@
+import wave
+import pytest
+import numpy as np
+from src.application.ports.i_audio_service import IAudioService, SynthesizedAudio
+from src.domain.training.workout import Workout
+from src.domain.training.value_objects import Block, BlockType
+from src.infrastructure.audio.workout_audio_renderer import WorkoutAudioRenderer
+
+RATE = 100
+
+class ToneAudioService(IAudioService):
+    """Every phrase is 0.5s of a constant level unique to the phrase."""
+    def __init__(self):
+        self.batches = []
+        self.levels = {}
+
+    async def speak(self, text, language="en"):
+        pass
+
+    async def synthesize_batch(self, texts, voice=None, speed=None):
+        self.batches.append(list(texts))
+        for text in texts:
+            self.levels.setdefault(text, (len(self.levels) + 1) / 1000)
+        return [SynthesizedAudio(np.full(RATE // 2, self.levels[text], dtype=np.float32), RATE) for text in texts]
+
+def _workout():
+    return Workout(name="Offline", id="w1", blocks=[
+        Block(type=BlockType.JUMP_ROPE, work_time=12, rest_time=5, rounds=2)
+    ])
+
+@pytest.mark.anyio
+async def test_renderer_places_each_cue_at_its_second_in_one_synthesis_pass(tmp_path):
+    audio = ToneAudioService()
+    renderer = WorkoutAudioRenderer(audio, language="en")
+    workout = _workout()
+
+    cues = await renderer.cues(workout)
+    texts = [cue.text for cue in cues]
+    assert "Rest" in texts and "Round 2" in texts
+    assert [cue.at for cue in cues] == sorted(cue.at for cue in cues)
+    # "10" of the first work phase: 12s of work, announced 2s in
+    assert any(cue.text == "10" and cue.at == 2 for cue in cues)
+
+    track, sample_rate = await renderer.render(workout)
+    assert len(audio.batches) == 1
+    assert sample_rate == RATE
+    assert len(track) == (12 + 5) * 2 * RATE
+
+    ten = track[2 * RATE:2 * RATE + RATE // 2]
+    assert np.all(ten == audio.levels["10"])
+
+    path = tmp_path / "workout.wav"
+    duration = await renderer.render_to_file(workout, str(path))
+    assert duration == pytest.approx(34)
+    with wave.open(str(path)) as f:
+        assert f.getframerate() == RATE
+        assert f.getnframes() == len(track)
+
+@pytest.mark.anyio
+async def test_renderer_resolves_overlaps_by_priority():
+    renderer = WorkoutAudioRenderer(ToneAudioService(), max_delay=0.2)
+    Cue = type((await renderer.cues(_workout()))[0])
+    phrases = {text: np.ones(RATE, dtype=np.float32) for text in ("Coach", "3", "Later")}
+    phrases["Rest"] = np.ones(2 * RATE, dtype=np.float32)
+    placements = renderer._place([
+        Cue(0, "Coach", 3),
+        Cue(0, "Rest", 5),       # same second, more important: goes first
+        Cue(0, "Later", 1),      # would wait two seconds: dropped
+        Cue(1, "Rest", 5),       # repeat of the phrase playing: dropped
+    ], phrases, RATE)
+    assert [(p.cue.text, p.start, p.length) for p in placements] == [("Rest", 0, 2 * RATE)]
+
+    placements = renderer._place([Cue(0, "Coach", 3), Cue(0, "3", 10)], {**phrases, "Coach": np.ones(3 * RATE)}, RATE)
+    assert [p.cue.text for p in placements] == ["3"]
+    placements = renderer._place([Cue(0, "Coach", 3), Cue(1, "3", 10)], {**phrases, "Coach": np.ones(3 * RATE)}, RATE)
+    assert [(p.cue.text, p.start, p.length) for p in placements] == [("Coach", 0, RATE), ("3", RATE, RATE)]
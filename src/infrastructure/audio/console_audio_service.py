@@ -3,7 +3,9 @@ Console Audio Service - Infrastructure implementation.
 Prints text to console instead of speaking (fallback/testing).
 """
 import logging
-from src.application.ports.i_audio_service import IAudioService
+from array import array
+from typing import List, Optional
+from src.application.ports.i_audio_service import IAudioService, SynthesizedAudio
 
 logger = logging.getLogger(__name__)
 
@@ -28,3 +30,20 @@ class ConsoleAudioService(IAudioService):
         """
         print(f"🔊 [{language.upper()}] {text}")
         logger.debug(f"Console speak: {text}")
+
+    async def synthesize_batch(
+        self,
+        texts: List[str],
+        voice: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> List[Optional[SynthesizedAudio]]:
+        """
+        Stand-in for synthesis: an empty (silent) buffer per text.
+        
+        Args:
+            texts: Phrases to "synthesize"
+            voice: Ignored
+            speed: Ignored
+        """
+        logger.debug(f"Console synthesize_batch: {len(texts)} phrases")
+        return [SynthesizedAudio(array("f"), 24000) for _ in texts]
@@ -3,14 +3,18 @@ Kokoro TTS Audio Service - Infrastructure implementation.
 Uses MLX-optimized Kokoro model for high-quality speech synthesis.
 """
 import asyncio
-import os
-import tempfile
 import logging
-import mlx.core as mx
+import threading
 import numpy as np
-import soundfile as sf
+from typing import Dict, List, Optional
 from mlx_audio.tts import load
-from src.application.ports.i_audio_service import IAudioService
+from src.application.ports.i_audio_service import IAudioService, SynthesizedAudio
+from src.infrastructure.audio.phrase_cache import PhraseCache
+from src.infrastructure.audio.sinks import AudioSink, default_audio_sink
+from src.infrastructure.audio.segment_ring_buffer import SegmentRingBuffer
+from src.infrastructure.audio.tts_process_pool import TtsProcessPool
+from src.infrastructure.audio.voice_profiles import KOKORO_VOICE_PROFILES, KokoroVoice, pitch_ratio, shift_pitch
+from src.domain.training.value_objects import VoiceProfile
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +29,13 @@ class KokoroAudioService(IAudioService):
         self, 
         repo_id: str = "prince-canuma/Kokoro-82M", 
         voice: str = "ff_siwis",  # French female voice
-        speed: float = 1.0
+        speed: float = 1.0,
+        phrase_cache: Optional[PhraseCache] = None,
+        sink: Optional[AudioSink] = None,
+        streaming: bool = True,
+        stream_buffer_segments: int = 4,
+        fallback: Optional[IAudioService] = None,
+        worker_pool: Optional[TtsProcessPool] = None
     ):
         """
         Initialize Kokoro audio service.
@@ -34,22 +44,122 @@ class KokoroAudioService(IAudioService):
             repo_id: HuggingFace model repository ID
             voice: Voice identifier (e.g., 'ff_siwis' for French Female)
             speed: Speech speed multiplier (1.0 = normal)
+            phrase_cache: Cache of synthesized phrases (defaults to an on-disk cache under .osu/cache/tts);
+                          the default profile uses it directly, other profiles a partition of it
+            sink: Where audio is played (defaults to the best player found on this machine)
+            streaming: Start playing uncached phrases on their first generated segment
+            stream_buffer_segments: How many segments synthesis may run ahead of playback
+            fallback: Service speaking uncached phrases until the model is warmed up
+                      (e.g. ConsoleAudioService). Without one, speak() waits for the model.
+            worker_pool: Synthesize on these processes instead of a thread of this one
+                         (phrases are then played once fully generated, not streamed)
         """
         self.repo_id = repo_id
         self.voice = voice
         self.speed = speed
+        self.pitch = 0.0
+        self.profile = VoiceProfile.DEFAULT
+        self._default_voice = KokoroVoice(voice, speed)
+        self._partitions: Dict[VoiceProfile, PhraseCache] = {VoiceProfile.DEFAULT: phrase_cache or PhraseCache()}
+        self.sink = sink or default_audio_sink()
+        self.streaming = streaming
+        self.stream_buffer_segments = stream_buffer_segments
+        self.fallback = fallback
+        self.worker_pool = worker_pool
+        self.warm_up_error: Optional[Exception] = None
         self._model = None
+        self._model_lock = threading.Lock()
+        # The model is not re-entrant: one synthesis step at a time, whichever thread runs it
+        # (playback, prefetch, prerendering, warm-up). Parallel synthesis is the worker_pool's job.
+        self._generate_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._warm_up_thread: Optional[threading.Thread] = None
         logger.info(f"Initialized Kokoro Audio Service (repo={repo_id}, voice={voice})")
 
     @property
     def model(self):
         """Lazy-load the Kokoro model on first use."""
         if self._model is None:
-            logger.info("Loading Kokoro model... this may take a moment.")
-            self._model = load(self.repo_id)
-            logger.info("Kokoro model loaded successfully.")
+            # The warm-up thread and synthesis threads may race to load it
+            with self._model_lock:
+                if self._model is None:
+                    logger.info("Loading Kokoro model... this may take a moment.")
+                    self._model = load(self.repo_id)
+                    logger.info("Kokoro model loaded successfully.")
         return self._model
 
+    @property
+    def phrase_cache(self) -> PhraseCache:
+        """Cache partition of the current voice profile."""
+        cache = self._partitions.get(self.profile)
+        if cache is None:
+            cache = self._partitions[VoiceProfile.DEFAULT].partition(self.profile.value)
+            self._partitions[self.profile] = cache
+        return cache
+
+    def configure_voice(
+        self,
+        profile: Optional[VoiceProfile] = None,
+        voice: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> None:
+        """
+        Switch voice settings for the following phrases.
+        A profile sets voice, speed and pitch (see KOKORO_VOICE_PROFILES) and selects
+        its own cache partition; voice and speed then override the profile's.
+        """
+        if profile is not None:
+            self.profile = VoiceProfile(profile)
+            self.voice, self.speed, self.pitch = KOKORO_VOICE_PROFILES.get(self.profile, self._default_voice)
+        if voice:
+            self.voice = voice
+        if speed is not None:
+            self.speed = speed
+        logger.info(f"Voice set to {self.voice} (profile={self.profile.value}, speed={self.speed}, pitch={self.pitch})")
+
+    def _key(self, text: str, voice: Optional[str] = None, speed: Optional[float] = None) -> str:
+        return PhraseCache.key(
+            text, voice or self.voice, self.speed if speed is None else speed, self.repo_id, self.pitch
+        )
+
+    @property
+    def is_ready(self) -> bool:
+        """True once the model is loaded and has synthesized a first phrase."""
+        if self.worker_pool is not None:
+            return self.worker_pool.is_ready
+        return self._ready.is_set()
+
+    def start_warm_up(self) -> None:
+        """Load the model and run a dummy synthesis in a background thread."""
+        if self.worker_pool is not None:
+            self.worker_pool.start()
+            return
+        if self._ready.is_set() or self._warm_up_thread is not None:
+            return
+        self._warm_up_thread = threading.Thread(target=self.warm_up, name="kokoro-warm-up", daemon=True)
+        self._warm_up_thread.start()
+
+    def warm_up(self) -> None:
+        """
+        Blocking warm-up: load the weights and synthesize a short phrase, so the first
+        real announcement doesn't pay for loading and the model's first-call setup.
+        """
+        try:
+            for _ in self._iter_segments("Ok"):
+                pass
+            logger.info("Kokoro model warmed up.")
+        except Exception as e:
+            self.warm_up_error = e
+            logger.error(f"Kokoro warm-up failed: {e}")
+        finally:
+            self._warm_up_thread = None
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the model is warmed up. Returns False on timeout."""
+        if self.worker_pool is not None:
+            return self.worker_pool.wait_ready(timeout)
+        return self._ready.wait(timeout)
+
     async def speak(self, text: str, language: str = "en") -> None:
         """
         Synthesize and play speech using Kokoro TTS.
@@ -64,65 +174,205 @@ class KokoroAudioService(IAudioService):
         logger.info(f"Speaking: {text}")
         
         try:
-            # Generate audio in a thread to avoid blocking
-            audio_data, sample_rate = await asyncio.to_thread(
-                self._generate, text
-            )
+            key = self._key(text)
+            cache = self.phrase_cache
+            cached = cache.get(key)
+            if cached is None and self.fallback is not None and not self.is_ready:
+                # Don't stall the announcement while the model loads
+                await self.fallback.speak(text, language)
+                return
+            if self.streaming and cached is None and self.worker_pool is None:
+                await self._speak_streaming(text, key, cache)
+                return
+            
+            audio_data, sample_rate = cached or await self._synthesize(text)
             
             if audio_data is None:
                 logger.warning("No audio generated.")
                 return
 
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tf:
-                tmp_path = tf.name
-                
-            sf.write(tmp_path, audio_data, sample_rate)
-            
-            # Play using afplay (macOS)
-            process = await asyncio.create_subprocess_shell(
-                f"afplay {tmp_path}",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode != 0:
-                logger.error(f"Error playing audio: {stderr.decode()}")
-            
-            # Cleanup
-            try:
-                os.remove(tmp_path)
-            except OSError:
-                pass
+            # Hand the buffer to the sink as-is (cancelling this stops playback)
+            await self.sink.play(audio_data, sample_rate)
                 
         except Exception as e:
             logger.error(f"Error in Kokoro speak: {e}")
             import traceback
             traceback.print_exc()
 
-    def _generate(self, text: str):
+    async def prefetch(self, text: str, language: str = "en") -> None:
+        """
+        Synthesize text into the phrase cache without playing it.
+        
+        Args:
+            text: Text that will be spoken later
+            language: Language code (the voice determines pronunciation)
+        """
+        if text:
+            await self._synthesize(text)
+
+    async def synthesize_batch(
+        self,
+        texts: List[str],
+        voice: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> List[Optional[SynthesizedAudio]]:
+        """
+        Synthesize several phrases in a single worker-thread pass
+        (or spread over the worker pool's processes when there is one; in-process,
+        synthesis is serialized on the model, see _iter_segments).
+        
+        The model is loaded once for the whole batch, duplicates are rendered once,
+        cached phrases skip the model, and each new phrase is cached as soon as it is
+        generated (so earlier phrases of a long batch become playable early).
+        
+        Args:
+            texts: Phrases to synthesize
+            voice: Voice identifier (defaults to this service's voice)
+            speed: Speech speed multiplier (defaults to this service's speed)
+        """
+        voice = voice or self.voice
+        speed = self.speed if speed is None else speed
+        if self.worker_pool is not None:
+            return await self._synthesize_batch_on_pool(list(texts), voice, speed)
+        return await asyncio.to_thread(self._synthesize_batch, list(texts), voice, speed)
+
+    async def _synthesize_batch_on_pool(self, texts: List[str], voice: str, speed: float) -> List[Optional[SynthesizedAudio]]:
+        rendered: Dict[str, Optional[SynthesizedAudio]] = {}
+        missing: Dict[str, str] = {}
+        cache = self.phrase_cache
+        for text in dict.fromkeys(texts):
+            key = self._key(text, voice, speed)
+            cached = cache.get(key)
+            if cached is None:
+                missing[text] = key
+            rendered[text] = SynthesizedAudio(*cached) if cached else None
+
+        async def generate(text: str, key: str):
+            audio_data, sample_rate = await self._synthesize_on_pool(text, voice, speed)
+            if audio_data is not None:
+                cache.put(key, audio_data, sample_rate)
+                rendered[text] = SynthesizedAudio(audio_data, sample_rate)
+
+        await asyncio.gather(*(generate(text, key) for text, key in missing.items()))
+        return [rendered[text] for text in texts]
+
+    def _synthesize_batch(self, texts: List[str], voice: str, speed: float) -> List[Optional[SynthesizedAudio]]:
+        rendered: Dict[str, Optional[SynthesizedAudio]] = {}
+        cache = self.phrase_cache
+        for text in dict.fromkeys(texts):
+            key = self._key(text, voice, speed)
+            cached = cache.get(key)
+            if cached is None:
+                audio_data, sample_rate = self._generate(text, voice, speed)
+                if audio_data is not None:
+                    cache.put(key, audio_data, sample_rate)
+                    cached = (audio_data, sample_rate)
+            rendered[text] = SynthesizedAudio(*cached) if cached else None
+        return [rendered[text] for text in texts]
+
+    async def _synthesize(self, text: str):
+        """
+        Return (numpy_audio, sample_rate) for the text, from the phrase cache when possible.
+        A cache hit skips the model entirely.
+        """
+        key = self._key(text)
+        cache = self.phrase_cache
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self.worker_pool is not None:
+            audio_data, sample_rate = await self._synthesize_on_pool(text, self.voice, self.speed)
+        else:
+            # Generate audio in a thread to avoid blocking
+            audio_data, sample_rate = await asyncio.to_thread(
+                self._generate, text
+            )
+        if audio_data is not None:
+            cache.put(key, audio_data, sample_rate)
+        return audio_data, sample_rate
+
+    async def _synthesize_on_pool(self, text: str, voice: str, speed: float):
+        pitch = self.pitch
+        audio_data, sample_rate = await self.worker_pool.synthesize(text, voice, speed / pitch_ratio(pitch))
+        if audio_data is not None:
+            audio_data = shift_pitch(audio_data, pitch)
+        return audio_data, sample_rate
+
+    async def _speak_streaming(self, text: str, key: str, cache: PhraseCache):
+        """
+        Play each segment as soon as the model produces it.
+        Synthesis runs in a thread and hands segments over through a ring buffer;
+        the full phrase is cached once it has been generated and played completely.
+        """
+        ring = SegmentRingBuffer(capacity=self.stream_buffer_segments)
+        producer = asyncio.create_task(asyncio.to_thread(self._generate_into, text, ring))
+        segments = []
+        sample_rate = 24000
+        try:
+            async for audio, sample_rate in ring:
+                segments.append(audio)
+                await self.sink.play(audio, sample_rate)
+        finally:
+            # Stops the synthesis thread if playback was interrupted
+            ring.cancel()
+        await producer
+        
+        if segments:
+            cache.put(key, np.concatenate(segments), sample_rate)
+        else:
+            logger.warning("No audio generated.")
+
+    def _generate_into(self, text: str, ring: SegmentRingBuffer):
+        """Synchronous producer: push (numpy_segment, sample_rate) items until done or cancelled."""
+        try:
+            for segment in self._iter_segments(text):
+                if not ring.put(segment):
+                    break
+        except Exception as e:
+            ring.close(error=e)
+        else:
+            ring.close()
+
+    def _iter_segments(self, text: str, voice: Optional[str] = None, speed: Optional[float] = None):
+        """
+        Yield (numpy_audio, sample_rate) for each segment the model generates.
+        Each segment is generated under the generate lock, released between segments so
+        a streamed phrase waiting for playback doesn't hold up other phrases.
+        """
+        pitch = self.pitch
+        speed = self.speed if speed is None else speed
+        model = self.model
+        with self._generate_lock:
+            # Pitch is shifted by resampling, which speeds speech up by the same ratio
+            generator = model.generate(
+                text, 
+                voice=voice or self.voice, 
+                speed=speed / pitch_ratio(pitch)
+            )
+        while True:
+            with self._generate_lock:
+                result = next(generator, None)
+            if result is None:
+                break
+            yield shift_pitch(np.array(result.audio), pitch), result.sample_rate
+        # A completed synthesis means the model is warm
+        self._ready.set()
+
+    def _generate(self, text: str, voice: Optional[str] = None, speed: Optional[float] = None):
         """
         Synchronous generation helper.
         
         Returns:
             Tuple of (numpy_audio, sample_rate)
         """
-        generator = self.model.generate(
-            text, 
-            voice=self.voice, 
-            speed=self.speed
-        )
-        
         all_audio = []
         sample_rate = 24000
         
-        for result in generator:
-            all_audio.append(result.audio)
-            sample_rate = result.sample_rate
+        for audio, sample_rate in self._iter_segments(text, voice, speed):
+            all_audio.append(audio)
             
         if not all_audio:
             return None, sample_rate
             
-        full_audio = mx.concatenate(all_audio, axis=0)
-        return np.array(full_audio), sample_rate
+        return np.concatenate(all_audio, axis=0), sample_rate
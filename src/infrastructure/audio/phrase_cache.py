@@ -0,0 +1,189 @@
+"""
+Phrase Cache - Infrastructure implementation.
+Content-addressed on-disk cache of synthesized speech, with an in-memory LRU on top.
+"""
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PhraseCache:
+    """
+    Cache of synthesized phrases, keyed by (text, voice, speed, model repo_id, pitch).
+
+    Each entry is a raw .npy array named `<key>-<sample_rate>.npy` under base_path.
+    The most recently used entries are also kept in memory. Disk usage is capped
+    at max_bytes by evicting the least recently used files (recency survives
+    restarts through the files' mtime). Safe to share between threads.
+
+    partition() returns a cache in a subdirectory with its own size budget,
+    so filling one partition (e.g. one voice profile) never evicts another's entries.
+    """
+
+    def __init__(
+        self,
+        base_path: str = ".osu/cache/tts",
+        max_bytes: int = 256 * 1024 * 1024,
+        memory_items: int = 128
+    ):
+        """
+        Initialize the phrase cache.
+
+        Args:
+            base_path: Directory holding the cached .npy files
+            max_bytes: Maximum total size of the cache on disk
+            memory_items: Number of phrases kept decoded in memory
+        """
+        self.base_path = base_path
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Tuple[np.ndarray, int]]" = OrderedDict()
+        # key -> (path, sample_rate, size), least recently used first
+        self._disk: "OrderedDict[str, Tuple[str, int, int]]" = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.RLock()
+        self._partitions: Dict[str, "PhraseCache"] = {}
+        os.makedirs(self.base_path, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def key(text: str, voice: str, speed: float, repo_id: str, pitch: float = 0.0) -> str:
+        """Content address of a phrase rendered with the given voice settings."""
+        settings = [text, voice, float(speed), repo_id]
+        if pitch:
+            # Unshifted phrases keep the keys they had before pitch existed
+            settings.append(float(pitch))
+        payload = json.dumps(settings, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, int]]:
+        """Return (audio, sample_rate) for a cached phrase, or None."""
+        with self._lock:
+            return self._get(key)
+
+    def put(self, key: str, audio: np.ndarray, sample_rate: int) -> None:
+        """Store a synthesized phrase, evicting old entries if the cache is full."""
+        with self._lock:
+            self._put(key, audio, sample_rate)
+
+    def partition(self, name: str) -> "PhraseCache":
+        """The cache stored under base_path/name, with the same limits as this one."""
+        with self._lock:
+            cache = self._partitions.get(name)
+            if cache is None:
+                cache = PhraseCache(os.path.join(self.base_path, name), self.max_bytes, self.memory_items)
+                self._partitions[name] = cache
+            return cache
+
+    def clear(self) -> None:
+        """Remove every cached phrase."""
+        with self._lock:
+            for key in list(self._disk):
+                self._remove(key)
+            self._memory.clear()
+            for cache in self._partitions.values():
+                cache.clear()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._disk_bytes
+
+    def _get(self, key: str) -> Optional[Tuple[np.ndarray, int]]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self._touch(key)
+            self.hits += 1
+            return entry
+
+        disk_entry = self._disk.get(key)
+        if disk_entry is None:
+            self.misses += 1
+            return None
+
+        path, sample_rate, _ = disk_entry
+        try:
+            audio = np.load(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable cache entry {path}: {e}")
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._touch(key)
+        self._remember(key, audio, sample_rate)
+        self.hits += 1
+        return audio, sample_rate
+
+    def _put(self, key: str, audio: np.ndarray, sample_rate: int):
+        if key in self._disk:
+            self._remove(key)
+
+        path = os.path.join(self.base_path, f"{key}-{sample_rate}.npy")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, audio)
+        os.replace(tmp_path, path)
+
+        size = os.path.getsize(path)
+        self._disk[key] = (path, sample_rate, size)
+        self._disk_bytes += size
+        self._remember(key, audio, sample_rate)
+        self._evict()
+
+    def _load_index(self):
+        entries = []
+        for entry in os.scandir(self.base_path):
+            name = entry.name
+            if not name.endswith(".npy"):
+                continue
+            key, _, rate = name[:-len(".npy")].rpartition("-")
+            if not key or not rate.isdigit():
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, key, entry.path, int(rate), stat.st_size))
+
+        for _, key, path, sample_rate, size in sorted(entries):
+            self._disk[key] = (path, sample_rate, size)
+            self._disk_bytes += size
+        self._evict()
+
+    def _remember(self, key: str, audio: np.ndarray, sample_rate: int):
+        self._memory[key] = (audio, sample_rate)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _touch(self, key: str):
+        if key not in self._disk:
+            return
+        self._disk.move_to_end(key)
+        try:
+            os.utime(self._disk[key][0])
+        except OSError:
+            pass
+
+    def _remove(self, key: str):
+        path, _, size = self._disk.pop(key)
+        self._disk_bytes -= size
+        self._memory.pop(key, None)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        while self._disk_bytes > self.max_bytes and len(self._disk) > 1:
+            key = next(iter(self._disk))
+            logger.debug(f"Evicting cached phrase {key}")
+            self._remove(key)
@@ -0,0 +1,83 @@
+"""
+Segment Ring Buffer - hands synthesized audio segments from a synthesis thread to the event loop.
+"""
+import asyncio
+import threading
+from typing import Any, List, Optional
+
+
+class SegmentRingBuffer:
+    """
+    Fixed-capacity single-producer / single-consumer ring buffer.
+
+    The producer (a synthesis thread) blocks in put() while the buffer is full,
+    which bounds how far synthesis runs ahead of playback. The consumer awaits
+    get() (or iterates with `async for`) on the event loop that created the buffer.
+    cancel() lets the consumer stop the producer, e.g. when playback is preempted.
+    """
+
+    def __init__(self, capacity: int = 8):
+        self.capacity = capacity
+        self._slots: List[Any] = [None] * capacity
+        self._head = 0
+        self._count = 0
+        self._closed = False
+        self._cancelled = False
+        self._error: Optional[BaseException] = None
+        self._cond = threading.Condition()
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+
+    def put(self, item: Any) -> bool:
+        """Producer side: append an item, waiting for room. Returns False once cancelled."""
+        with self._cond:
+            while self._count == self.capacity and not self._cancelled:
+                self._cond.wait()
+            if self._cancelled:
+                return False
+            self._slots[(self._head + self._count) % self.capacity] = item
+            self._count += 1
+        self._loop.call_soon_threadsafe(self._ready.set)
+        return True
+
+    def close(self, error: Optional[BaseException] = None):
+        """Producer side: no more items. An error is re-raised to the consumer."""
+        with self._cond:
+            self._closed = True
+            self._error = error
+        self._loop.call_soon_threadsafe(self._ready.set)
+
+    def cancel(self):
+        """Consumer side: stop the producer and discard what is buffered."""
+        with self._cond:
+            self._cancelled = True
+            self._slots = [None] * self.capacity
+            self._count = 0
+            self._cond.notify_all()
+
+    async def get(self) -> Optional[Any]:
+        """Consumer side: next item, or None once the producer closed the buffer."""
+        while True:
+            self._ready.clear()
+            with self._cond:
+                if self._count:
+                    item = self._slots[self._head]
+                    self._slots[self._head] = None
+                    self._head = (self._head + 1) % self.capacity
+                    self._count -= 1
+                    self._cond.notify()
+                    return item
+                if self._closed:
+                    if self._error is not None:
+                        raise self._error
+                    return None
+            await self._ready.wait()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self.get()
+        if item is None:
+            raise StopAsyncIteration
+        return item
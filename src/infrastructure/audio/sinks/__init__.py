@@ -0,0 +1,35 @@
+"""Audio sinks: where synthesized speech buffers are played."""
+import shutil
+import sys
+
+from .audio_sink import AudioSink, as_pcm, write_wav
+from .pipe_player_sink import PipePlayerSink, APLAY_COMMAND, SOX_PLAY_COMMAND, FFPLAY_COMMAND
+from .raw_pcm_sink import RawPcmSink
+from .capture_sinks import NullSink, WavCaptureSink
+from .afplay_sink import AfplaySink
+
+
+def default_audio_sink() -> AudioSink:
+    """
+    Best sink available on this machine: a long-lived raw-PCM player (aplay, sox, ffplay),
+    then afplay on macOS, then a NullSink (headless Linux, CI).
+    """
+    for command in (APLAY_COMMAND, SOX_PLAY_COMMAND, FFPLAY_COMMAND):
+        if shutil.which(command[0]):
+            return PipePlayerSink(command)
+    if sys.platform == "darwin":
+        return AfplaySink()
+    return NullSink()
+
+
+__all__ = [
+    "AudioSink",
+    "as_pcm",
+    "write_wav",
+    "PipePlayerSink",
+    "RawPcmSink",
+    "NullSink",
+    "WavCaptureSink",
+    "AfplaySink",
+    "default_audio_sink",
+]
@@ -0,0 +1,44 @@
+"""
+Afplay Sink - macOS fallback when no raw-PCM player is installed.
+"""
+import asyncio
+import logging
+import os
+import tempfile
+
+import numpy as np
+
+from src.infrastructure.audio.sinks.audio_sink import AudioSink, write_wav
+
+logger = logging.getLogger(__name__)
+
+
+class AfplaySink(AudioSink):
+    """
+    Plays each buffer through a temporary WAV file and `afplay`.
+    Costs a process and a file per phrase; prefer PipePlayerSink when sox or ffmpeg is available.
+    """
+    
+    async def play(self, audio: np.ndarray, sample_rate: int) -> None:
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tf:
+            tmp_path = tf.name
+        try:
+            write_wav(tmp_path, audio, sample_rate)
+            process = await asyncio.create_subprocess_exec(
+                "afplay", tmp_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                _, stderr = await process.communicate()
+            except asyncio.CancelledError:
+                # Preempted by a more important phrase: stop playback now
+                process.kill()
+                raise
+            if process.returncode != 0:
+                logger.error(f"Error playing audio: {stderr.decode()}")
+        finally:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,78 @@
+"""
+Audio Sink - where synthesized speech is played.
+Sinks receive numpy buffers directly; no temp file or process is created per phrase.
+"""
+import time
+import wave
+import asyncio
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class AudioSink(ABC):
+    """
+    Destination for synthesized audio (speakers, a pipe, a file, nothing).
+    play() returns once the buffer has been played (or written), and may be
+    cancelled to interrupt playback.
+    """
+    
+    @abstractmethod
+    async def play(self, audio: np.ndarray, sample_rate: int) -> None:
+        """
+        Play a mono buffer.
+        
+        Args:
+            audio: Mono samples in [-1, 1]
+            sample_rate: Sample rate of the buffer in Hz
+        """
+        pass
+    
+    async def close(self) -> None:
+        """Release the sink's resources (player process, files)."""
+        pass
+
+
+def as_pcm(audio: np.ndarray) -> memoryview:
+    """
+    Raw little-endian float32 PCM bytes of a buffer.
+    Zero-copy when the buffer already is contiguous float32 (Kokoro's output).
+    """
+    samples = np.ascontiguousarray(audio, dtype="<f4")
+    return memoryview(samples).cast("B")
+
+
+def write_wav(path: str, audio: np.ndarray, sample_rate: int) -> None:
+    """Write a mono buffer as a 16-bit PCM WAV file."""
+    samples = (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2")
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(samples.tobytes())
+
+
+async def feed_pcm(
+    write,
+    pcm: memoryview,
+    sample_rate: int,
+    realtime: bool = True,
+    chunk_ms: int = 50,
+    lead_ms: int = 150
+) -> None:
+    """
+    Write float32 PCM in chunks through `write(bytes_like)`.
+    With realtime, writing stays at most lead_ms ahead of playback and returns when
+    the last sample has played, so cancelling stops the sound within ~lead_ms.
+    """
+    bytes_per_second = sample_rate * 4
+    chunk = max(int(bytes_per_second * chunk_ms / 1000) // 4 * 4, 4)
+    start = time.monotonic()
+    for offset in range(0, len(pcm), chunk):
+        write(pcm[offset:offset + chunk])
+        if not realtime:
+            continue
+        ahead = start + (offset + chunk) / bytes_per_second - time.monotonic() - lead_ms / 1000
+        await asyncio.sleep(max(ahead, 0))
+    if realtime:
+        await asyncio.sleep(max(start + len(pcm) / bytes_per_second - time.monotonic(), 0))
@@ -0,0 +1,55 @@
+"""
+Capture Sinks - for Linux boxes without audio, CI and tests.
+"""
+import asyncio
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.infrastructure.audio.sinks.audio_sink import AudioSink, write_wav
+
+
+class NullSink(AudioSink):
+    """Discards audio, optionally taking as long as playback would."""
+    
+    def __init__(self, realtime: bool = False):
+        self.realtime = realtime
+        self.played = 0
+        self.seconds = 0.0
+    
+    async def play(self, audio: np.ndarray, sample_rate: int) -> None:
+        duration = len(audio) / sample_rate
+        self.played += 1
+        self.seconds += duration
+        if self.realtime:
+            await asyncio.sleep(duration)
+
+
+class WavCaptureSink(AudioSink):
+    """
+    Keeps every played buffer (by reference, no copy) and optionally writes
+    them as one WAV file on close.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the sink.
+        
+        Args:
+            path: WAV file written on close(); None keeps the capture in memory only
+        """
+        self.path = path
+        self.buffers: List[Tuple[np.ndarray, int]] = []
+    
+    async def play(self, audio: np.ndarray, sample_rate: int) -> None:
+        self.buffers.append((audio, sample_rate))
+    
+    def audio(self) -> np.ndarray:
+        """Everything played so far, concatenated."""
+        if not self.buffers:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate([buffer for buffer, _ in self.buffers])
+    
+    async def close(self) -> None:
+        if self.path and self.buffers:
+            write_wav(self.path, self.audio(), self.buffers[-1][1])
@@ -0,0 +1,78 @@
+"""
+Pipe Player Sink - feeds raw PCM to one long-lived player process.
+"""
+import logging
+import subprocess
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.infrastructure.audio.sinks.audio_sink import AudioSink, as_pcm, feed_pcm
+
+logger = logging.getLogger(__name__)
+
+# Players reading mono float32 PCM on stdin; {rate} is replaced by the sample rate.
+APLAY_COMMAND = ["aplay", "-q", "-t", "raw", "-f", "FLOAT_LE", "-c", "1", "-r", "{rate}"]
+SOX_PLAY_COMMAND = ["play", "-q", "-t", "raw", "-e", "floating-point", "-b", "32", "-c", "1", "-r", "{rate}", "-"]
+FFPLAY_COMMAND = [
+    "ffplay", "-nodisp", "-loglevel", "quiet", "-fflags", "nobuffer",
+    "-f", "f32le", "-ac", "1", "-ar", "{rate}", "-i", "-"
+]
+
+
+class PipePlayerSink(AudioSink):
+    """
+    Plays buffers by writing them to the stdin of a player process.
+    The process is started once and reused for every phrase (it is only restarted
+    if it exits or the sample rate changes), so a phrase costs a pipe write,
+    not a fork/exec and a temp file.
+    """
+    
+    def __init__(self, command: Sequence[str] = APLAY_COMMAND, chunk_ms: int = 50, lead_ms: int = 150):
+        """
+        Initialize the sink.
+        
+        Args:
+            command: Player command line; "{rate}" is replaced by the sample rate
+            chunk_ms: Size of each pipe write
+            lead_ms: How far ahead of playback writes may go (bounds preemption latency)
+        """
+        self.command = list(command)
+        self.chunk_ms = chunk_ms
+        self.lead_ms = lead_ms
+        self._process: Optional[subprocess.Popen] = None
+        self._sample_rate: Optional[int] = None
+    
+    async def play(self, audio: np.ndarray, sample_rate: int) -> None:
+        process = self._ensure_process(sample_rate)
+        # Writes never block: the lead is far smaller than the pipe buffer (64 KiB ~ 0.7s)
+        await feed_pcm(process.stdin.write, as_pcm(audio), sample_rate, True, self.chunk_ms, self.lead_ms)
+    
+    async def close(self) -> None:
+        self._stop_process()
+    
+    def _ensure_process(self, sample_rate: int) -> subprocess.Popen:
+        if self._process is not None and (self._process.poll() is not None or self._sample_rate != sample_rate):
+            self._stop_process()
+        if self._process is None:
+            command: List[str] = [arg.replace("{rate}", str(sample_rate)) for arg in self.command]
+            logger.info(f"Starting audio player: {' '.join(command)}")
+            self._process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
+            )
+            self._sample_rate = sample_rate
+        return self._process
+    
+    def _stop_process(self):
+        if self._process is None:
+            return
+        try:
+            self._process.stdin.close()
+            self._process.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+        self._process = None
@@ -0,0 +1,42 @@
+"""
+Raw PCM Sink - writes float32 PCM to a binary stream or file (e.g. a FIFO read by another program).
+"""
+from typing import BinaryIO, Optional
+
+import numpy as np
+
+from src.infrastructure.audio.sinks.audio_sink import AudioSink, as_pcm, feed_pcm
+
+
+class RawPcmSink(AudioSink):
+    """
+    Writes every buffer as raw little-endian float32 mono PCM.
+    With realtime, play() is paced like a real device; otherwise it returns immediately.
+    """
+    
+    def __init__(self, stream: Optional[BinaryIO] = None, path: Optional[str] = None, realtime: bool = False):
+        """
+        Initialize the sink.
+        
+        Args:
+            stream: Binary stream to write to
+            path: File (or FIFO) to append to, opened on first use, if no stream is given
+            realtime: Pace writes to the playback speed
+        """
+        if stream is None and path is None:
+            raise ValueError("RawPcmSink needs a stream or a path")
+        self.path = path
+        self.realtime = realtime
+        self._stream = stream
+        self._owns_stream = stream is None
+    
+    async def play(self, audio: np.ndarray, sample_rate: int) -> None:
+        if self._stream is None:
+            self._stream = open(self.path, "ab")
+        await feed_pcm(self._stream.write, as_pcm(audio), sample_rate, self.realtime)
+        self._stream.flush()
+    
+    async def close(self) -> None:
+        if self._owns_stream and self._stream is not None:
+            self._stream.close()
+            self._stream = None
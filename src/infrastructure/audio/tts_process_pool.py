@@ -0,0 +1,165 @@
+"""
+TTS Process Pool - Infrastructure implementation.
+Runs speech synthesis on several processes, each holding its own loaded model.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# (text, voice, speed) -> (numpy_audio or None, sample_rate)
+Synthesizer = Callable[[str, str, float], Tuple[Optional[np.ndarray], int]]
+
+# The synthesizer of the current worker process, built once by _init_worker
+_worker_synthesizer: Optional[Synthesizer] = None
+
+
+def load_kokoro_synthesizer(repo_id: str) -> Synthesizer:
+    """Load a Kokoro model (mlx_audio) and return a function synthesizing one phrase with it."""
+    from mlx_audio.tts import load
+    model = load(repo_id)
+
+    def synthesize(text: str, voice: str, speed: float):
+        segments = []
+        sample_rate = 24000
+        for result in model.generate(text, voice=voice, speed=speed):
+            segments.append(np.array(result.audio))
+            sample_rate = result.sample_rate
+        if not segments:
+            return None, sample_rate
+        return np.concatenate(segments, axis=0), sample_rate
+
+    return synthesize
+
+
+def _init_worker(factory: Callable[[str], Synthesizer], repo_id: str, loaded: "multiprocessing.Queue"):
+    global _worker_synthesizer
+    _worker_synthesizer = factory(repo_id)
+    # Reported once the model is loaded, so the pool knows which processes are ready
+    loaded.put(os.getpid())
+
+
+def _synthesize_in_worker(text: str, voice: str, speed: float):
+    return _worker_synthesizer(text, voice, speed)
+
+
+def _ping_worker() -> int:
+    return os.getpid()
+
+
+class TtsProcessPool:
+    """
+    Pool of synthesis processes fed through the executor's request queue.
+
+    Each process loads the model once (in its initializer) and then synthesizes
+    phrases submitted to the pool; callers get a future per phrase. Unlike threads,
+    the processes don't share the GIL or a single model instance, so throughput
+    scales with the number of cores when several sessions speak at once.
+
+    Processes are started with "spawn": model runtimes (MLX/Metal, torch) are not
+    safe to use after fork.
+    """
+
+    def __init__(
+        self,
+        repo_id: str = "prince-canuma/Kokoro-82M",
+        workers: Optional[int] = None,
+        synthesizer_factory: Callable[[str], Synthesizer] = load_kokoro_synthesizer
+    ):
+        """
+        Initialize the pool (processes are started by start() or the first request).
+
+        Args:
+            repo_id: Model passed to synthesizer_factory in every process
+            workers: Number of processes (defaults to the number of CPU cores)
+            synthesizer_factory: Picklable top-level function loading a synthesizer in a worker
+        """
+        self.repo_id = repo_id
+        self.workers = workers or os.cpu_count() or 1
+        self.synthesizer_factory = synthesizer_factory
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # PIDs of the processes that loaded their model, put by _init_worker
+        self._loaded: Optional["multiprocessing.Queue"] = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    @property
+    def is_ready(self) -> bool:
+        """True once every process has loaded its model."""
+        return self._ready.is_set()
+
+    def start(self) -> None:
+        """Start the processes and load their models in the background."""
+        executor = self._get_executor()
+        # The executor spawns processes on demand: one request per worker brings them all up
+        pings = [executor.submit(_ping_worker) for _ in range(self.workers)]
+        threading.Thread(
+            target=self._await_ready, args=(executor, self._loaded, pings), name="tts-pool-warm-up", daemon=True
+        ).start()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until every process has loaded its model. Returns False on timeout."""
+        return self._ready.wait(timeout)
+
+    def submit(self, text: str, voice: str, speed: float) -> "Future[Tuple[Optional[np.ndarray], int]]":
+        """Queue a phrase for synthesis; the future resolves to (numpy_audio, sample_rate)."""
+        return self._get_executor().submit(_synthesize_in_worker, text, voice, speed)
+
+    async def synthesize(self, text: str, voice: str, speed: float) -> Tuple[Optional[np.ndarray], int]:
+        """Synthesize a phrase on one of the processes."""
+        return await asyncio.wrap_future(self.submit(text, voice, speed))
+
+    async def synthesize_many(self, texts: List[str], voice: str, speed: float) -> List[Tuple[Optional[np.ndarray], int]]:
+        """Synthesize phrases concurrently across the processes, results in order."""
+        futures = [self.submit(text, voice, speed) for text in texts]
+        return list(await asyncio.gather(*(asyncio.wrap_future(future) for future in futures)))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the processes; queued requests are cancelled."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._ready.clear()
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.info("TTS process pool stopped")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context("spawn")
+                self._loaded = context.Queue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.synthesizer_factory, self.repo_id, self._loaded)
+                )
+                logger.info(f"TTS process pool started ({self.workers} processes)")
+            return self._executor
+
+    def _await_ready(self, executor: ProcessPoolExecutor, loaded: "multiprocessing.Queue", pings: List[Future]):
+        # A few fast processes may answer every ping: wait for `workers` distinct processes to load their model
+        pids = set()
+        try:
+            while len(pids) < self.workers:
+                try:
+                    pids.add(loaded.get(timeout=0.1))
+                except queue.Empty:
+                    if self._executor is not executor:
+                        return  # Shut down meanwhile
+                    for ping in pings:
+                        if ping.done() and not ping.cancelled() and ping.exception() is not None:
+                            raise ping.exception()
+            if self._executor is executor:
+                self._ready.set()
+                logger.info(f"TTS process pool ready ({len(pids)} processes loaded)")
+        except Exception as e:
+            logger.error(f"TTS process pool failed to start: {e}")
@@ -0,0 +1,42 @@
+"""
+Voice Profiles - Kokoro settings for each VoiceProfile.
+"""
+from typing import Dict, NamedTuple
+
+import numpy as np
+
+from src.domain.training.value_objects import VoiceProfile
+
+
+class KokoroVoice(NamedTuple):
+    """A Kokoro voice, its speech speed and a pitch shift in semitones."""
+    voice: str
+    speed: float = 1.0
+    pitch: float = 0.0
+
+
+# VoiceProfile.DEFAULT is the voice the service was created with
+KOKORO_VOICE_PROFILES: Dict[VoiceProfile, KokoroVoice] = {
+    VoiceProfile.GANDALF: KokoroVoice("bm_george", speed=0.85, pitch=-3.0),
+    VoiceProfile.DUMBLEDORE: KokoroVoice("bm_lewis", speed=0.9, pitch=-1.5),
+    VoiceProfile.APOLLO_CREED: KokoroVoice("am_michael", speed=1.15, pitch=0.0),
+    VoiceProfile.ROCKY: KokoroVoice("am_adam", speed=0.95, pitch=-2.0),
+}
+
+
+def pitch_ratio(semitones: float) -> float:
+    """Frequency ratio of a pitch shift."""
+    return 2.0 ** (semitones / 12.0)
+
+
+def shift_pitch(audio: np.ndarray, semitones: float) -> np.ndarray:
+    """
+    Raise (or lower) the pitch by resampling, which also shortens (or stretches)
+    the audio by the same ratio. Callers compensate by synthesizing at
+    speed / pitch_ratio(semitones), so the tempo ends up as requested.
+    """
+    if not semitones or not len(audio):
+        return audio
+    ratio = pitch_ratio(semitones)
+    positions = np.arange(0, len(audio) - 1, ratio)
+    return np.interp(positions, np.arange(len(audio)), audio).astype(audio.dtype, copy=False)
@@ -0,0 +1,180 @@
+"""
+Workout Audio Renderer - Infrastructure implementation.
+Renders the complete coached audio track of a workout to a file, without real-time ticking.
+"""
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.application.ports.i_audio_service import IAudioService
+from src.application.coaching_service.coaching_service import CoachingService
+from src.application.coaching_service.dtos import GetInstructionRequest
+from src.domain.training.session import TrainingSession, SessionStatus
+from src.domain.training.timeline import WorkoutTimeline
+from src.domain.training.workout import Workout
+from src.domain.training.events import AnnouncementTriggered, SessionTicked
+from src.infrastructure.audio.sinks import write_wav
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Cue:
+    """A phrase the session speaks `at` seconds into the workout."""
+    at: int
+    text: str
+    priority: int
+
+
+@dataclass
+class _Placement:
+    start: int
+    length: int
+    cue: Cue
+
+
+class WorkoutAudioRenderer:
+    """
+    Produces the audio a live session would play, as a single track.
+
+    The session is ticked in simulated time (one tick per simulated second, no sleeping)
+    and every announcement and coaching instruction is recorded as a Cue at its second.
+    All distinct phrases are synthesized in one synthesize_batch pass, then placed on
+    the track with numpy slice assignment, resolving overlaps like AudioDispatcher:
+    a higher priority phrase cuts the one playing, a lower one waits for it unless that
+    would delay it by more than max_delay, and repeats of the playing phrase are dropped.
+    """
+
+    def __init__(
+        self,
+        audio_service: IAudioService,
+        language: str = "fr",
+        voice: Optional[str] = None,
+        speed: Optional[float] = None,
+        max_delay: float = 1.0
+    ):
+        """
+        Initialize the renderer.
+
+        Args:
+            audio_service: Provider used to synthesize the phrases
+            language: Language of the coaching instructions
+            voice: Voice identifier (defaults to the provider's voice)
+            speed: Speech speed multiplier (defaults to the provider's speed)
+            max_delay: Seconds a phrase may wait for the previous one before being dropped
+        """
+        self.audio_service = audio_service
+        self.language = language
+        self.voice = voice
+        self.speed = speed
+        self.max_delay = max_delay
+
+    async def cues(self, workout: Workout) -> List[Cue]:
+        """Run a session of the workout in simulated time and list what it says, in order."""
+        elapsed = 0
+        coaching = CoachingService(clock=lambda: float(elapsed))
+        session_id = str(uuid.uuid4())
+        session = TrainingSession(workout=workout, id=session_id)
+        cues: List[Cue] = []
+        last_instruction = ""
+
+        session.start()
+        while True:
+            for event in session.collect_domain_events():
+                if isinstance(event, AnnouncementTriggered):
+                    # Same scale as AnnouncementListener: countdown 10, phase changes 5
+                    cues.append(Cue(elapsed, event.text, 10 if event.text.isdigit() else 5))
+                elif isinstance(event, SessionTicked):
+                    block = workout.blocks[event.current_block_index]
+                    response = await coaching.get_instruction(GetInstructionRequest(
+                        session_id=session_id,
+                        block_type=event.block_type,
+                        time_left=event.time_left,
+                        is_work_phase=event.is_work_phase,
+                        language=self.language,
+                        techniques=block.techniques or None,
+                        exercises=block.exercises or None
+                    ))
+                    # Like CoachingListener, only speak an instruction when it changes
+                    if response.text and response.text != last_instruction:
+                        cues.append(Cue(elapsed, response.text, response.priority))
+                        last_instruction = response.text
+            if session.status != SessionStatus.RUNNING:
+                return cues
+            session.tick()
+            elapsed += 1
+
+    async def render(self, workout: Workout) -> Tuple[np.ndarray, int]:
+        """Return the (mono float32 track, sample_rate) of the whole workout."""
+        cues = await self.cues(workout)
+        texts = list(dict.fromkeys(cue.text for cue in cues))
+        logger.info(f"Rendering {len(cues)} cues ({len(texts)} distinct phrases)")
+        results = await self.audio_service.synthesize_batch(texts, self.voice, self.speed)
+
+        rendered = [result for result in results if result is not None]
+        sample_rate = rendered[0].sample_rate if rendered else 24000
+        phrases: Dict[str, np.ndarray] = {}
+        for text, result in zip(texts, results):
+            if result is None:
+                logger.warning(f"No audio for '{text}', skipped")
+                continue
+            phrases[text] = self._resample(np.asarray(result.samples, dtype=np.float32), result.sample_rate, sample_rate)
+
+        placements = self._place(cues, phrases, sample_rate)
+        total_seconds = WorkoutTimeline.compile(workout).total_seconds
+        length = max([total_seconds * sample_rate] + [p.start + p.length for p in placements])
+        track = np.zeros(length, dtype=np.float32)
+        for p in placements:
+            track[p.start:p.start + p.length] = phrases[p.cue.text][:p.length]
+        return track, sample_rate
+
+    async def render_to_file(self, workout: Workout, path: str) -> float:
+        """
+        Render the workout to a .wav file (or .flac, which requires soundfile).
+        Returns the track duration in seconds.
+        """
+        track, sample_rate = await self.render(workout)
+        if path.lower().endswith(".flac"):
+            import soundfile
+            soundfile.write(path, track, sample_rate, format="FLAC")
+        else:
+            write_wav(path, track, sample_rate)
+        duration = len(track) / sample_rate
+        logger.info(f"Wrote {duration:.0f}s of audio to {path}")
+        return duration
+
+    def _place(self, cues: List[Cue], phrases: Dict[str, np.ndarray], sample_rate: int) -> List[_Placement]:
+        placements: List[_Placement] = []
+        max_delay = int(self.max_delay * sample_rate)
+        # Within a second, the most important phrase goes first
+        for cue in sorted(cues, key=lambda c: (c.at, -c.priority)):
+            audio = phrases.get(cue.text)
+            if audio is None or not len(audio):
+                continue
+            start = cue.at * sample_rate
+            current = placements[-1] if placements else None
+            if current is not None and start < current.start + current.length:
+                busy_until = current.start + current.length
+                if cue.text == current.cue.text:
+                    continue
+                if cue.priority > current.cue.priority:
+                    # Preempt: cut the phrase being played
+                    current.length = max(start - current.start, 0)
+                    if current.length == 0:
+                        placements.pop()
+                elif busy_until - start <= max_delay:
+                    start = busy_until
+                else:
+                    continue
+            placements.append(_Placement(start, len(audio), cue))
+        return placements
+
+    @staticmethod
+    def _resample(audio: np.ndarray, from_rate: int, to_rate: int) -> np.ndarray:
+        if from_rate == to_rate:
+            return audio
+        positions = np.arange(int(len(audio) * to_rate / from_rate)) * (from_rate / to_rate)
+        return np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
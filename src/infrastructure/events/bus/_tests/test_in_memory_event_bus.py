@@ -0,0 +1,307 @@
+import asyncio
+import pytest
+from src.domain._base.domain_event import DomainEvent
+from src.application.events.event_handler_registry import EventHandlerRegistry
+from src.infrastructure.events.bus.in_memory_event_bus import InMemoryEventBus, DispatchMode, OverflowPolicy
+from src.infrastructure.events.bus._fakes.in_memory_bus import InMemoryEventBus as FakeEventBus
+from src.infrastructure.events.bus.middleware import ErrorCaptureMiddleware, TimingMiddleware, TracingMiddleware
+
+@pytest.fixture
+def anyio_backend():
+    # Concurrent, detached and queued dispatch run on asyncio tasks
+    return "asyncio"
+
+class Pinged(DomainEvent):
+    n: int
+
+def _slow_handler(received, delay=0.05):
+    async def handler(event):
+        await asyncio.sleep(delay)
+        received.append(event.n)
+    return handler
+
+@pytest.mark.anyio
+async def test_concurrent_mode_runs_handlers_together_and_isolates_failures():
+    bus = InMemoryEventBus(mode=DispatchMode.CONCURRENT)
+    log = []
+
+    def _logging_handler(name, received):
+        async def handler(event):
+            log.append(f"{name} starts {event.n}")
+            await asyncio.sleep(0)
+            log.append(f"{name} ends {event.n}")
+            received.append(event.n)
+        return handler
+
+    first, second = [], []
+    bus.subscribe(Pinged, _logging_handler("first", first))
+    bus.subscribe(Pinged, _logging_handler("second", second))
+
+    async def failing(event):
+        raise ValueError(f"boom {event.n}")
+    bus.subscribe(Pinged, failing)
+
+    await bus.publish([Pinged(n=1), Pinged(n=2)])
+
+    # Handlers of an event overlap; the next event starts once they all finished
+    assert log == [
+        "first starts 1", "second starts 1", "first ends 1", "second ends 1",
+        "first starts 2", "second starts 2", "first ends 2", "second ends 2"
+    ]
+    assert first == second == [1, 2]
+    assert [(letter.event.n, str(letter.error)) for letter in bus.dead_letters] == [(1, "boom 1"), (2, "boom 2")]
+
+@pytest.mark.anyio
+async def test_sequential_mode_still_propagates_handler_errors():
+    bus = InMemoryEventBus()
+    async def failing(event):
+        raise ValueError("boom")
+    bus.subscribe(Pinged, failing)
+    with pytest.raises(ValueError):
+        await bus.publish([Pinged(n=1)])
+
+@pytest.mark.anyio
+async def test_detached_mode_returns_immediately_and_keeps_per_subscriber_order():
+    bus = InMemoryEventBus(mode=DispatchMode.DETACHED)
+    started, slow, fast = [], [], []
+
+    async def gate(event):
+        started.append(event.n)
+    bus.subscribe(Pinged, gate)
+    bus.subscribe(Pinged, _slow_handler(slow, delay=0.02))
+    bus.subscribe(Pinged, _slow_handler(fast, delay=0))
+
+    await bus.publish([Pinged(n=i) for i in range(5)])
+    await bus.publish([Pinged(n=5)])
+    # Both publishes returned before any handler ran
+    assert started == slow == fast == []
+
+    await bus.drain()
+    assert started == slow == fast == list(range(6))
+    await bus.close()
+
+def test_detached_mode_carries_undelivered_events_over_to_the_next_event_loop():
+    bus = InMemoryEventBus(mode=DispatchMode.DETACHED)
+    received = []
+    bus.subscribe(Pinged, _slow_handler(received, delay=0))
+
+    async def publish_only(n):
+        await bus.publish([Pinged(n=n)])
+
+    async def publish_and_drain(n):
+        await bus.publish([Pinged(n=n)])
+        await bus.drain()
+
+    # The first loop ends before its worker ran (like a UI action's asyncio.run)
+    asyncio.run(publish_only(1))
+    asyncio.run(publish_and_drain(2))
+    assert received == [1, 2]
+
+class Ticked(DomainEvent):
+    session_id: str
+    time_left: int
+
+class Paused(DomainEvent):
+    session_id: str
+
+def _gated_handler(received, gate):
+    async def handler(event):
+        await gate.wait()
+        received.append((event.session_id, event.time_left))
+    return handler
+
+@pytest.mark.anyio
+async def test_coalescing_subscription_only_sees_the_latest_event_per_session():
+    bus = InMemoryEventBus(mode=DispatchMode.CONCURRENT)
+    gate = asyncio.Event()
+    received = []
+    bus.subscribe(Ticked, _gated_handler(received, gate), overflow=OverflowPolicy.COALESCE)
+
+    await bus.publish([Ticked(session_id="a", time_left=10)])
+    await asyncio.sleep(0)  # "a"/10 is now being handled
+    await bus.publish([Ticked(session_id=s, time_left=t) for t in (9, 8, 7) for s in ("a", "b")])
+    gate.set()
+    await bus.drain()
+
+    assert received == [("a", 10), ("a", 7), ("b", 7)]
+    [stats] = bus.subscription_stats()
+    assert (stats.event_type, stats.depth, stats.delivered, stats.coalesced) == ("Ticked", 0, 3, 4)
+
+@pytest.mark.anyio
+async def test_coalescing_keeps_event_types_apart_and_never_merges_events_without_a_key():
+    bus = InMemoryEventBus(mode=DispatchMode.CONCURRENT)
+    gate = asyncio.Event()
+    received = []
+
+    async def handler(event):
+        await gate.wait()
+        received.append(event)
+    # A base-class subscription sees several event types
+    bus.subscribe(DomainEvent, handler, overflow=OverflowPolicy.COALESCE)
+
+    ping0, ping1, ping2 = Pinged(n=0), Pinged(n=1), Pinged(n=2)
+    tick2, tick1, pause = Ticked(session_id="a", time_left=2), Ticked(session_id="a", time_left=1), Paused(session_id="a")
+    await bus.publish([ping0])
+    await asyncio.sleep(0)  # ping0 is now being handled
+    await bus.publish([tick2, ping1, ping2, tick1, pause])
+    gate.set()
+    await bus.drain()
+
+    # The second tick replaced the first; the pause and the session-less pings are all kept
+    assert [id(e) for e in received] == [id(e) for e in (ping0, tick1, ping1, ping2, pause)]
+    assert bus.subscription_stats()[0].coalesced == 1
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("policy, expected, dropped", [
+    (OverflowPolicy.DROP_OLDEST, [0, 3, 4], 2),
+    (OverflowPolicy.DROP_NEWEST, [0, 1, 2], 2),
+])
+async def test_full_queue_drops_by_policy(policy, expected, dropped):
+    bus = InMemoryEventBus()
+    gate = asyncio.Event()
+    received = []
+    bus.subscribe(Ticked, _gated_handler(received, gate), max_queue=2, overflow=policy)
+
+    await bus.publish([Ticked(session_id="a", time_left=0)])
+    await asyncio.sleep(0)
+    await bus.publish([Ticked(session_id="a", time_left=t) for t in range(1, 5)])
+    assert bus.subscription_stats()[0].max_depth == 2
+    gate.set()
+    await bus.drain()
+
+    assert [t for _, t in received] == expected
+    assert bus.subscription_stats()[0].dropped == dropped
+
+@pytest.mark.anyio
+async def test_blocking_queue_applies_backpressure_to_the_publisher():
+    bus = InMemoryEventBus()
+    gate = asyncio.Event()
+    received = []
+    bus.subscribe(Ticked, _gated_handler(received, gate), max_queue=2)
+
+    publisher = asyncio.create_task(bus.publish([Ticked(session_id="a", time_left=t) for t in range(5)]))
+    await asyncio.sleep(0.02)
+    assert not publisher.done()
+    assert bus.subscription_stats()[0].depth == 2
+
+    gate.set()
+    await publisher
+    await bus.drain()
+    assert [t for _, t in received] == list(range(5))
+
+def test_drop_policies_require_a_bound():
+    with pytest.raises(ValueError):
+        InMemoryEventBus().subscribe(Ticked, _slow_handler([]), overflow=OverflowPolicy.DROP_OLDEST)
+
+@pytest.mark.anyio
+async def test_catch_all_subscribers_and_unsubscribe():
+    bus = InMemoryEventBus()
+    audit, ticks = [], []
+
+    async def audit_log(event):
+        audit.append(type(event).__name__)
+
+    async def on_tick(event):
+        ticks.append(event.time_left)
+
+    bus.subscribe(DomainEvent, audit_log)
+    bus.subscribe(Ticked, on_tick)
+    await bus.publish([Ticked(session_id="a", time_left=3), Pinged(n=1)])
+    assert audit == ["Ticked", "Pinged"]
+    assert ticks == [3]
+
+    assert bus.unsubscribe(DomainEvent, audit_log) is True
+    assert bus.unsubscribe(DomainEvent, audit_log) is False
+    await bus.publish([Ticked(session_id="a", time_left=2)])
+    assert audit == ["Ticked", "Pinged"]
+    assert ticks == [3, 2]
+
+@pytest.mark.anyio
+async def test_sync_and_async_handlers_from_a_shared_registry():
+    registry = EventHandlerRegistry()
+    received = []
+    registry.subscribe(Pinged, lambda event: received.append(("registry", event.n)))
+    bus = InMemoryEventBus(registry=registry)
+
+    async def on_ping(event):
+        received.append(("async", event.n))
+    bus.subscribe(Pinged, on_ping)
+    bus.subscribe(DomainEvent, lambda event: received.append(("sync", event.n)))
+
+    await bus.publish([Pinged(n=1)])
+    assert received == [("registry", 1), ("async", 1), ("sync", 1)]
+
+    assert bus.unsubscribe(Pinged, on_ping)
+    registry.subscribe(Pinged, lambda event: received.append(("late", event.n)))
+    received.clear()
+    await bus.publish([Pinged(n=2)])
+    assert received == [("registry", 2), ("late", 2), ("sync", 2)]
+
+@pytest.mark.anyio
+async def test_shared_registry_holds_the_handlers_subscribed_through_the_bus():
+    registry = EventHandlerRegistry()
+    bus = InMemoryEventBus(registry=registry)
+    received = []
+
+    def direct(event):
+        received.append(("direct", event.n))
+    async def queued(event):
+        received.append(("queued", event.n))
+    bus.subscribe(Pinged, direct)
+    bus.subscribe(Pinged, queued, max_queue=4)
+    assert registry.get_handlers(Pinged) == (direct, queued)
+
+    await bus.publish([Pinged(n=1)])
+    await bus.drain()
+    assert received == [("direct", 1), ("queued", 1)]
+
+    # Unsubscribing on the registry unsubscribes from the bus, queue included
+    assert registry.unsubscribe(Pinged, queued)
+    assert bus.subscription_stats() == []
+    assert not bus.unsubscribe(Pinged, queued)
+    received.clear()
+    await bus.publish([Pinged(n=2)])
+    await bus.drain()
+    assert received == [("direct", 2)]
+    await bus.close()
+
+@pytest.mark.anyio
+async def test_middleware_times_traces_and_captures_errors():
+    timing, tracing, errors = TimingMiddleware(), TracingMiddleware(), ErrorCaptureMiddleware()
+    bus = InMemoryEventBus(middleware=[timing, tracing, errors])
+    received = []
+
+    def failing(event):
+        raise ValueError("boom")
+    bus.subscribe(Pinged, failing)
+    bus.subscribe(Pinged, lambda event: received.append(event.n))
+
+    await bus.publish([Pinged(n=1), Pinged(n=2)])
+
+    # The failure is captured innermost, so the next handler still runs
+    assert received == [1, 2]
+    assert [str(letter.error) for letter in errors.errors] == ["boom", "boom"]
+    assert [span.handler.rsplit(".", 1)[-1] for span in tracing.spans] == ["failing", "<lambda>"] * 2
+    assert [span.error for span in tracing.spans] == [None] * 4
+    assert {t.calls for t in timing.timings.values()} == {2}
+
+@pytest.mark.anyio
+async def test_fake_bus_takes_its_registry_first():
+    registry = EventHandlerRegistry()
+    received = []
+    registry.subscribe(Pinged, lambda event: received.append(event.n))
+    bus = FakeEventBus(registry)
+    await bus.publish([Pinged(n=1)])
+    assert received == [1]
+
+@pytest.mark.anyio
+async def test_handler_unsubscribed_during_publish_misses_the_next_events():
+    bus = InMemoryEventBus()
+    received = []
+
+    async def once(event):
+        received.append(event.n)
+        bus.unsubscribe(Pinged, once)
+    bus.subscribe(Pinged, once)
+    await bus.publish([Pinged(n=1), Pinged(n=2)])
+    assert received == [1]
@@ -1,21 +1,442 @@
-from typing import List, Callable, Dict, Type
+import asyncio
+import inspect
+import logging
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Tuple, Type
 from src.domain._base.domain_event import DomainEvent
 from src.domain._base.event_bus import EventBus
+from src.application.events.event_handler_registry import EventHandlerRegistry
+
+logger = logging.getLogger(__name__)
+
+class DispatchMode(str, Enum):
+    SEQUENTIAL = "sequential"  # publish awaits each handler in turn; errors propagate
+    CONCURRENT = "concurrent"  # publish awaits all handlers of an event at once
+    DETACHED = "detached"      # publish only enqueues; each subscription drains its own queue
+
+class OverflowPolicy(str, Enum):
+    """What a subscription queue does with a new event when it is full."""
+    BLOCK = "block"              # publish waits for room
+    DROP_OLDEST = "dropOldest"   # the oldest queued event is discarded
+    DROP_NEWEST = "dropNewest"   # the new event is discarded
+    COALESCE = "coalesce"        # a queued event with the same (non-None) key is replaced (even when not full)
+
+@dataclass(frozen=True)
+class DeadLetter:
+    """An event a handler failed to process."""
+    event: DomainEvent
+    handler: Callable
+    error: BaseException
+
+@dataclass(frozen=True)
+class SubscriptionStats:
+    """Queue metrics of a subscription."""
+    event_type: str
+    handler: str
+    depth: int
+    max_depth: int
+    delivered: int
+    dropped: int
+    coalesced: int
+
+# async middleware(event, handler, call_next): runs around every delivery, call_next() delivers
+Middleware = Callable[[DomainEvent, Callable, Callable[[], Awaitable[None]]], Awaitable[None]]
+
+def session_key(event: DomainEvent) -> Any:
+    """
+    Default coalescing key: one queued event per event type and session, so a
+    subscription to a base class doesn't replace one type with another.
+    Events without a session_id have no key and are never coalesced.
+    """
+    session_id = getattr(event, "session_id", None)
+    return None if session_id is None else (type(event), session_id)
+
+def handler_name(handler: Callable) -> str:
+    return getattr(handler, "__qualname__", None) or repr(handler)
+
+def is_async_handler(handler: Callable) -> bool:
+    """True for coroutine functions, bound async methods and objects with an async __call__."""
+    return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(getattr(handler, "__call__", None))
+
+class _Subscription:
+    """A handler subscribed to an event type, with its queue and worker task when queued."""
+    __slots__ = (
+        "event_type", "handler", "queued", "max_queue", "overflow", "coalesce_key", "is_async", "active",
+        "pending", "in_flight", "task", "delivered", "dropped", "coalesced", "max_depth", "wakeup", "idle", "room"
+    )
+
+    def __init__(
+        self,
+        event_type: Type[DomainEvent],
+        handler: Callable,
+        queued: bool,
+        max_queue: Optional[int],
+        overflow: OverflowPolicy,
+        coalesce_key: Callable[[DomainEvent], Any]
+    ):
+        self.event_type = event_type
+        self.handler = handler
+        self.queued = queued
+        self.max_queue = max_queue
+        self.overflow = OverflowPolicy(overflow)
+        self.coalesce_key = coalesce_key
+        # Classified once here rather than on every delivery
+        self.is_async = is_async_handler(handler)
+        self.active = True
+        # An event leaves the queue once handled, so an interrupted delivery is retried
+        self.pending: Deque[DomainEvent] = deque()
+        self.in_flight = False
+        self.task: Optional[asyncio.Task] = None
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self._new_events()
+
+    def _new_events(self):
+        # asyncio.Event binds to the loop that first waits on it
+        self.wakeup = asyncio.Event()
+        self.idle = asyncio.Event()
+        self.room = asyncio.Event()
+
+    def restart(self, loop: asyncio.AbstractEventLoop, worker):
+        """Run the worker on `loop`, taking over what a previous loop did not deliver."""
+        if self.task is not None and not self.task.get_loop().is_closed():
+            self.task.get_loop().call_soon_threadsafe(self.task.cancel)
+        self.in_flight = False
+        self._new_events()
+        self.task = loop.create_task(worker(self))
+        if self.pending:
+            self.wakeup.set()
+
+    @property
+    def waiting(self) -> int:
+        """Queued events not being delivered yet (what max_queue bounds)."""
+        return len(self.pending) - (1 if self.in_flight else 0)
+
+    def offer(self, event: DomainEvent) -> bool:
+        """Queue an event according to the overflow policy. Returns False if it must wait for room."""
+        # The head is not touched while it is being delivered
+        first = 1 if self.in_flight else 0
+        key = self.coalesce_key(event) if self.overflow == OverflowPolicy.COALESCE else None
+        if key is not None:
+            for i in range(first, len(self.pending)):
+                if self.coalesce_key(self.pending[i]) == key:
+                    self.pending[i] = event
+                    self.coalesced += 1
+                    return True
+        if self.max_queue is not None and self.waiting >= self.max_queue:
+            if self.overflow == OverflowPolicy.BLOCK:
+                return False
+            if self.overflow == OverflowPolicy.DROP_NEWEST or len(self.pending) <= first:
+                self.dropped += 1
+                return True
+            # DROP_OLDEST, and COALESCE without a queued event to replace
+            del self.pending[first]
+            self.dropped += 1
+        self.pending.append(event)
+        self.max_depth = max(self.max_depth, self.waiting)
+        self.idle.clear()
+        self.wakeup.set()
+        return True
+
+    def stats(self) -> SubscriptionStats:
+        return SubscriptionStats(
+            event_type=self.event_type.__name__,
+            handler=handler_name(self.handler),
+            depth=self.waiting,
+            max_depth=self.max_depth,
+            delivered=self.delivered,
+            dropped=self.dropped,
+            coalesced=self.coalesced
+        )
 
 class InMemoryEventBus(EventBus):
-    def __init__(self):
-        self._subscribers: Dict[Type[DomainEvent], List[Callable]] = {}
+    """
+    Delivers published events to the handlers subscribed to their type or one of its
+    base classes (subscribing to DomainEvent receives everything). Handlers live in an
+    EventHandlerRegistry, which may be shared: handlers registered on it directly are
+    delivered too, and removing a handler from it unsubscribes it. The bus keeps the
+    options of each subscription (queue, overflow policy...) on its side. The subscriptions of each concrete event type are resolved once
+    along its MRO, most specific class first, and cached until the registry changes.
+
+    Handlers may be sync or async; each is classified once, when subscribed.
+    Middleware (see middleware.py) wraps every delivery; the chain is composed when
+    middleware is added, and skipped entirely when there is none.
+
+    In CONCURRENT and DETACHED modes a failing handler doesn't affect the others
+    (or the publisher): the failure is logged and kept in dead_letters.
+    Events are always delivered to a given subscription in the order they were published.
+
+    Queued subscriptions (every subscription in DETACHED mode, and those subscribed
+    with a max_queue or COALESCE) decouple publishers from slow subscribers: each has
+    its own queue, drained by a task on the publishing event loop, and an
+    OverflowPolicy for when it is full. Events a loop could not deliver before ending
+    are delivered on the next loop that publishes; a delivery interrupted that way is
+    retried (at-least-once). drain() waits for the queues, subscription_stats() reports them.
+    """
+    def __init__(
+        self,
+        mode: DispatchMode = DispatchMode.SEQUENTIAL,
+        max_concurrency: Optional[int] = None,
+        max_dead_letters: int = 1000,
+        registry: Optional[EventHandlerRegistry] = None,
+        middleware: Sequence[Middleware] = ()
+    ):
+        self.mode = DispatchMode(mode)
+        # CONCURRENT: bounds how many handlers of an event run at once
+        self.max_concurrency = max_concurrency
+        self.registry = registry if registry is not None else EventHandlerRegistry()
+        # event type -> (direct subscriptions, their handlers, which handlers are async, queued subscriptions,
+        # whether every handler is async and nothing is queued), dropped whenever the registry changes
+        self._dispatch: Dict[Type[DomainEvent], Tuple[
+            Tuple[_Subscription, ...], Tuple[Callable, ...], Tuple[bool, ...], Tuple[_Subscription, ...], bool
+        ]] = {}
+        self.registry.on_change(self._registry_changed)
+        # The registry holds the handlers themselves; their options (queue, overflow...) live here.
+        # Handlers registered on the registry directly get a default subscription when first resolved.
+        self._by_handler: Dict[Tuple[Type[DomainEvent], Callable], _Subscription] = {}
+        self._subscriptions: List[_Subscription] = []
+        self._middleware: List[Middleware] = []
+        self._pipeline: Optional[Callable[[_Subscription, DomainEvent], Awaitable[None]]] = None
+        # SEQUENTIAL without middleware: publish calls the handlers directly
+        self._inline = self.mode is DispatchMode.SEQUENTIAL
+        self._dead_letters: Deque[DeadLetter] = deque(maxlen=max_dead_letters)
+        # Loop running the queue workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        for m in middleware:
+            self.add_middleware(m)
+
+    @property
+    def dead_letters(self) -> List[DeadLetter]:
+        return list(self._dead_letters)
+
+    def subscribe(
+        self,
+        event_type: Type[DomainEvent],
+        handler: Callable,
+        max_queue: Optional[int] = None,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        coalesce_key: Callable[[DomainEvent], Any] = session_key
+    ):
+        """
+        Subscribe a handler to an event type.
 
-    def subscribe(self, event_type: Type[DomainEvent], handler: Callable):
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(handler)
+        Args:
+            max_queue: Feed the handler from its own queue of at most this many events
+            overflow: What happens to a new event when the queue is full
+            coalesce_key: With COALESCE, events with the same key replace each other
+                          in the queue (by default, one event per type and session);
+                          events whose key is None are queued as is
+        """
+        overflow = OverflowPolicy(overflow)
+        if max_queue is None and overflow in (OverflowPolicy.DROP_OLDEST, OverflowPolicy.DROP_NEWEST):
+            raise ValueError(f"Overflow policy {overflow.value} requires max_queue")
+        queued = max_queue is not None or overflow == OverflowPolicy.COALESCE or self.mode == DispatchMode.DETACHED
+        previous = self._by_handler.get((event_type, handler))
+        if previous is not None:
+            # Subscribed again: the registry delivers it once more, with the new options
+            self._drop(previous)
+        subscription = _Subscription(event_type, handler, queued, max_queue, overflow, coalesce_key)
+        self._by_handler[(event_type, handler)] = subscription
+        self._subscriptions.append(subscription)
+        self.registry.subscribe(event_type, handler)
+
+    def unsubscribe(self, event_type: Type[DomainEvent], handler: Callable) -> bool:
+        """
+        Remove a handler subscribed to an event type; its queued events are dropped.
+        During a publish, it takes effect from the next event. Returns False if it was not subscribed.
+        """
+        return self.registry.unsubscribe(event_type, handler)
+
+    def add_middleware(self, middleware: Middleware):
+        """Wrap every delivery in `middleware`; the first added is the outermost."""
+        self._middleware.append(middleware)
+        pipeline = self._call
+        for m in reversed(self._middleware):
+            pipeline = _chain(m, pipeline)
+        self._pipeline = pipeline
+        self._inline = False
+
+    def subscription_stats(self) -> List[SubscriptionStats]:
+        return [s.stats() for s in self._queued_subscriptions()]
 
     async def publish(self, events: List[DomainEvent]):
+        if not self._inline:
+            await self._publish_dispatched(events)
+            return
+        # The per-event hot path: no middleware, so handlers are called directly
+        dispatch = self._dispatch
         for event in events:
-            event_type = type(event)
-            if event_type in self._subscribers:
-                for handler in self._subscribers[event_type]:
-                    # Execute handler. If handlers are async, await them.
-                    # Assuming async handlers for now.
+            _, handlers, kinds, queued, all_async = dispatch.get(type(event)) or self._resolve(type(event))
+            if all_async:
+                for handler in handlers:
                     await handler(event)
+                continue
+            if queued:
+                await self._enqueue_all(queued, event)
+            for handler, is_async in zip(handlers, kinds):
+                if is_async:
+                    await handler(event)
+                else:
+                    result = handler(event)
+                    if result is not None and inspect.isawaitable(result):
+                        await result
+
+    async def _publish_dispatched(self, events: List[DomainEvent]):
+        """publish() through the middleware pipeline, or with the handlers of an event run concurrently."""
+        semaphore = None
+        pipeline = self._pipeline
+        concurrent = self.mode is DispatchMode.CONCURRENT
+        for event in events:
+            direct, _, _, queued, _ = self._dispatch.get(type(event)) or self._resolve(type(event))
+            if queued:
+                await self._enqueue_all(queued, event)
+            if concurrent:
+                if semaphore is None and self.max_concurrency:
+                    semaphore = asyncio.Semaphore(self.max_concurrency)
+                # All handlers of an event finish before the next event, which keeps per-handler order
+                await asyncio.gather(*(self._deliver(s, event, semaphore) for s in direct))
+            else:
+                for subscription in direct:
+                    await pipeline(subscription, event)
+
+    async def redeliver(self, event: DomainEvent, handler: Callable) -> bool:
+        """
+        Deliver an event again to one of its handlers only (e.g. the handler of a dead letter),
+        through the middleware. Returns False if it failed again (a new dead letter is kept);
+        a handler no longer subscribed has nothing left to deliver.
+        """
+        direct, _, _, queued, _ = self._dispatch.get(type(event)) or self._resolve(type(event))
+        for subscription in direct + queued:
+            if subscription.handler == handler:
+                return await self._deliver(subscription, event)
+        return True
+
+    async def drain(self):
+        """Wait until every queued event has been handled."""
+        self._bind_loop()
+        for subscription in self._queued_subscriptions():
+            if subscription.pending and subscription.task is not None:
+                await subscription.idle.wait()
+
+    async def close(self):
+        """Stop the queue workers; events still queued are dropped."""
+        tasks = []
+        for subscription in self._queued_subscriptions():
+            subscription.pending.clear()
+            if subscription.task is not None:
+                subscription.task.cancel()
+                tasks.append(subscription.task)
+                subscription.task = None
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = None
+
+    def _registry_changed(self):
+        self._dispatch.clear()
+        # Handlers unsubscribed (from the bus or the registry) lose their subscription and its queue
+        for key, subscription in list(self._by_handler.items()):
+            if key[1] not in self.registry.registered(key[0]):
+                self._drop(subscription)
+
+    def _drop(self, subscription: _Subscription):
+        self._by_handler.pop((subscription.event_type, subscription.handler), None)
+        self._subscriptions.remove(subscription)
+        subscription.active = False
+        subscription.pending.clear()
+        if subscription.task is not None and not subscription.task.get_loop().is_closed():
+            subscription.task.get_loop().call_soon_threadsafe(subscription.task.cancel)
+        subscription.task = None
+
+    def _resolve(self, event_type: Type[DomainEvent]):
+        subscriptions = [
+            self._subscription(cls, h) for cls in event_type.__mro__ for h in self.registry.registered(cls)
+        ]
+        direct = tuple(s for s in subscriptions if not s.queued)
+        queued = tuple(s for s in subscriptions if s.queued)
+        kinds = tuple(s.is_async for s in direct)
+        resolved = (direct, tuple(s.handler for s in direct), kinds, queued, not queued and all(kinds))
+        self._dispatch[event_type] = resolved
+        return resolved
+
+    def _subscription(self, event_type: Type[DomainEvent], handler: Callable) -> _Subscription:
+        subscription = self._by_handler.get((event_type, handler))
+        if subscription is None:
+            subscription = _Subscription(
+                event_type, handler, self.mode == DispatchMode.DETACHED, None, OverflowPolicy.BLOCK, session_key
+            )
+            self._by_handler[(event_type, handler)] = subscription
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def _queued_subscriptions(self) -> List[_Subscription]:
+        return [s for s in self._subscriptions if s.queued]
+
+    @staticmethod
+    async def _call(subscription: _Subscription, event: DomainEvent):
+        if subscription.is_async:
+            await subscription.handler(event)
+        else:
+            result = subscription.handler(event)
+            if result is not None and inspect.isawaitable(result):
+                await result
+
+    async def _deliver(self, subscription: _Subscription, event: DomainEvent, semaphore: Optional[asyncio.Semaphore] = None) -> bool:
+        deliver = self._pipeline or self._call
+        try:
+            if semaphore:
+                async with semaphore:
+                    await deliver(subscription, event)
+            else:
+                await deliver(subscription, event)
+            return True
+        except Exception as e:
+            logger.error(f"Handler {handler_name(subscription.handler)} failed on {type(event).__name__}: {e}")
+            self._dead_letters.append(DeadLetter(event, subscription.handler, e))
+            return False
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Callers may publish from successive event loops (e.g. one asyncio.run per UI action):
+            # workers of a previous loop are gone, so restart them here with what they had not handled.
+            self._loop = loop
+            for queued in self._queued_subscriptions():
+                if queued.task is not None:
+                    queued.restart(loop, self._drain_subscription)
+        return loop
+
+    async def _enqueue_all(self, queued: Tuple[_Subscription, ...], event: DomainEvent):
+        for subscription in queued:
+            if subscription.active:  # May be unsubscribed while this publish is running
+                await self._enqueue(subscription, event)
+
+    async def _enqueue(self, subscription: _Subscription, event: DomainEvent):
+        loop = self._bind_loop()
+        if subscription.task is None:
+            subscription.restart(loop, self._drain_subscription)
+        while not subscription.offer(event):
+            # BLOCK: backpressure on the publisher until the worker makes room
+            subscription.room.clear()
+            await subscription.room.wait()
+
+    async def _drain_subscription(self, subscription: _Subscription):
+        while True:
+            if not subscription.pending:
+                subscription.idle.set()
+                subscription.wakeup.clear()
+                await subscription.wakeup.wait()
+                continue
+            subscription.in_flight = True
+            subscription.room.set()
+            if await self._deliver(subscription, subscription.pending[0]):
+                subscription.delivered += 1
+            subscription.in_flight = False
+            subscription.pending.popleft()
+
+def _chain(middleware: Middleware, call_next):
+    async def invoke(subscription: _Subscription, event: DomainEvent):
+        await middleware(event, subscription.handler, lambda: call_next(subscription, event))
+    return invoke
@@ -0,0 +1,115 @@
+"""
+Event Bus Middleware - wrappers around every handler delivery of InMemoryEventBus.
+A middleware is `async (event, handler, call_next)`; awaiting call_next() runs the handler.
+"""
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Dict, List, Optional
+
+from src.domain._base.domain_event import DomainEvent
+from src.infrastructure.events.bus.in_memory_event_bus import DeadLetter, handler_name
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HandlerTiming:
+    """Cumulated run time of a handler, in seconds."""
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+class TimingMiddleware:
+    """Measures how long each handler takes, failed deliveries included."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self.timings: Dict[str, HandlerTiming] = {}
+
+    async def __call__(self, event: DomainEvent, handler: Callable, call_next: Callable[[], Awaitable[None]]):
+        started = self._clock()
+        try:
+            await call_next()
+        finally:
+            elapsed = self._clock() - started
+            name = handler_name(handler)
+            timing = self.timings.get(name)
+            if timing is None:
+                timing = self.timings[name] = HandlerTiming()
+            timing.calls += 1
+            timing.total += elapsed
+            timing.max = max(timing.max, elapsed)
+
+
+@dataclass(frozen=True)
+class TraceSpan:
+    """One delivery of an event to a handler."""
+    event_id: str
+    event_type: str
+    handler: str
+    started_at: float
+    duration: float
+    error: Optional[str] = None
+
+
+class TracingMiddleware:
+    """Records a TraceSpan per delivery, keeping the latest ones and passing each to `sink`."""
+
+    def __init__(self, sink: Optional[Callable[[TraceSpan], None]] = None, max_spans: int = 1000):
+        self.sink = sink
+        self._spans: Deque[TraceSpan] = deque(maxlen=max_spans)
+
+    @property
+    def spans(self) -> List[TraceSpan]:
+        return list(self._spans)
+
+    async def __call__(self, event: DomainEvent, handler: Callable, call_next: Callable[[], Awaitable[None]]):
+        started_at = time.time()
+        started = time.perf_counter()
+        error = None
+        try:
+            await call_next()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span = TraceSpan(
+                event_id=str(event.event_id),
+                event_type=type(event).__name__,
+                handler=handler_name(handler),
+                started_at=started_at,
+                duration=time.perf_counter() - started,
+                error=error
+            )
+            self._spans.append(span)
+            if self.sink is not None:
+                self.sink(span)
+
+
+class ErrorCaptureMiddleware:
+    """
+    Keeps handler failures as DeadLetters instead of raising them, so a failing
+    handler doesn't stop the others even in SEQUENTIAL mode.
+    Add it after middleware that should still see the error (e.g. tracing).
+    """
+
+    def __init__(self, max_errors: int = 1000):
+        self._errors: Deque[DeadLetter] = deque(maxlen=max_errors)
+
+    @property
+    def errors(self) -> List[DeadLetter]:
+        return list(self._errors)
+
+    async def __call__(self, event: DomainEvent, handler: Callable, call_next: Callable[[], Awaitable[None]]):
+        try:
+            await call_next()
+        except Exception as e:
+            logger.error(f"Handler {handler_name(handler)} failed on {type(event).__name__}: {e}")
+            self._errors.append(DeadLetter(event, handler, e))
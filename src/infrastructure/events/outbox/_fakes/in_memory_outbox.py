@@ -1,18 +1,20 @@
 from typing import List
 from src.domain._base.domain_event import DomainEvent
-from src.infrastructure.events.outbox.outbox import Outbox
-from src.infrastructure.events.bus.event_bus import EventBus
+from src.infrastructure.events.outbox.outbox import Outbox, OutboxMessage
 
 class InMemoryOutbox(Outbox):
-    def __init__(self, event_bus: EventBus):
-        self._queue: List[DomainEvent] = []
-        self._event_bus = event_bus
+    def __init__(self):
+        self._messages: List[OutboxMessage] = []
+        self._position = 0
 
     async def save(self, events: List[DomainEvent]):
-        self._queue.extend(events)
+        for event in events:
+            self._position += 1
+            self._messages.append(OutboxMessage(self._position, event))
 
-    async def publish_pending(self):
-        if self._queue:
-            # Publish all pending events
-            await self._event_bus.publish(self._queue)
-            self._queue.clear()
+    async def pending(self, limit: int = 100) -> List[OutboxMessage]:
+        return self._messages[:limit]
+
+    async def mark_delivered(self, positions: List[int]) -> None:
+        delivered = set(positions)
+        self._messages = [m for m in self._messages if m.position not in delivered]
@@ -0,0 +1,228 @@
+import os
+import shutil
+import threading
+import pytest
+from uuid import uuid4
+from src.domain.training.events import AnnouncementTriggered, SessionTicked
+from src.domain.training.session import TrainingSession
+from src.domain.training.workout import Workout
+from src.domain.training.value_objects import Block, BlockType
+from src.infrastructure._common.resilience.policies import RetryPolicy
+from src.infrastructure.events.bus.in_memory_event_bus import DispatchMode, InMemoryEventBus
+from src.infrastructure.events.outbox.event_log_outbox import EventLogOutbox
+from src.infrastructure.events.outbox.outbox_relay import OutboxRelay, shared_relay
+from src.infrastructure.events.outbox.sqlite_outbox import SQLiteOutbox
+from src.infrastructure.events.store.osu_event_store import OsuFileEventStore
+from src.infrastructure.events.store.sqlite_event_store import SQLiteEventStore
+from src.infrastructure.training.repositories.osu_session_repository import OsuSessionRepository
+
+TEST_DIR = ".osu_test_outbox"
+
+@pytest.fixture
+def anyio_backend():
+    # The relay and its RetryPolicy run on asyncio
+    return "asyncio"
+
+@pytest.fixture
+def test_dir():
+    if os.path.exists(TEST_DIR):
+        shutil.rmtree(TEST_DIR)
+    yield TEST_DIR
+    shutil.rmtree(TEST_DIR)
+
+class RecordingBus(InMemoryEventBus):
+    def __init__(self, failures=0, error=ValueError):
+        super().__init__()
+        self.batches = []
+        self.threads = []
+        self.failures = failures
+        self.error = error
+
+    async def publish(self, events):
+        if self.failures:
+            self.failures -= 1
+            raise self.error("bus down")
+        self.batches.append([_name(e) for e in events])
+        self.threads.append(threading.current_thread().name)
+
+def _name(event):
+    return getattr(event, "text", type(event).__name__)
+
+def _announcements(agg_id, start, stop):
+    return [AnnouncementTriggered(session_id=str(agg_id), text=str(v)) for v in range(start, stop)]
+
+def _session(session_id="s1"):
+    workout = Workout(name="Outbox", id="w1", blocks=[Block(type=BlockType.HEAVY_BAG, work_time=3, rest_time=2, rounds=1)])
+    return TrainingSession(workout=workout, id=session_id)
+
+@pytest.mark.anyio
+async def test_events_stored_before_a_failed_publish_are_relayed_after_restart(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    # History from before the outbox existed is not republished
+    await store.append("old", _announcements("old", 1, 3), 0)
+    checkpoint = os.path.join(test_dir, "outbox.checkpoint")
+
+    crashing_bus = RecordingBus(failures=1)
+    repo = OsuSessionRepository(
+        event_store=store,
+        base_path=os.path.join(test_dir, "sessions"),
+        event_bus=crashing_bus,
+        outbox_relay=OutboxRelay(EventLogOutbox(store, checkpoint), crashing_bus)
+    )
+    session = _session()
+    session.start()
+    with pytest.raises(ValueError):
+        await repo.save(session)
+    assert crashing_bus.batches == []
+
+    # Next process: same store and checkpoint, the relay catches up
+    bus = RecordingBus()
+    relay = OutboxRelay(EventLogOutbox(store, checkpoint), bus)
+    stored = [_name(e) for e in await store.get("s1")]
+    assert await relay.publish_pending() == len(stored)
+    assert await relay.publish_pending() == 0
+    assert bus.batches == [stored]
+
+@pytest.mark.anyio
+async def test_sqlite_outbox_relays_in_batches_and_retries(test_dir):
+    store = SQLiteEventStore(db_path=os.path.join(test_dir, "events.db"))
+    outbox = SQLiteOutbox(store)
+    agg_id = uuid4()
+    await store.append(agg_id, _announcements(agg_id, 1, 6), 0)
+
+    # Transient failures are retried by the RetryPolicy
+    bus = RecordingBus(failures=2, error=ConnectionError)
+    relay = OutboxRelay(outbox, bus, batch_size=2, retry_policy=RetryPolicy(max_retries=2, base_delay=0.001))
+    assert await relay.publish_pending() == 5
+    assert bus.batches == [["1", "2"], ["3", "4"], ["5"]]
+    assert await outbox.pending() == []
+    assert await outbox.purge_delivered() == 5
+    outbox.close()
+    store.close()
+
+@pytest.mark.anyio
+async def test_handler_failures_kept_as_dead_letters_are_retried(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    outbox = EventLogOutbox(store, os.path.join(test_dir, "outbox.checkpoint"))
+    await outbox.open()
+    await store.append("a", _announcements("a", 1, 3), 0)
+
+    # A CONCURRENT bus doesn't raise handler failures: the relay finds them in the dead letters
+    bus = InMemoryEventBus(mode=DispatchMode.CONCURRENT)
+    received, failures = [], [3]
+    async def flaky(event):
+        if failures[0]:
+            failures[0] -= 1
+            raise RuntimeError("speaker unplugged")
+        received.append(event.text)
+    bus.subscribe(AnnouncementTriggered, flaky)
+
+    relay = OutboxRelay(outbox, bus, retry_policy=RetryPolicy(max_retries=1, base_delay=0.001))
+    assert await relay.publish_pending() == 2
+    # Each event went back to the handler that failed on it, until its retry got through
+    assert received == ["1", "2"]
+    assert len(bus.dead_letters) == 3
+    assert relay.parked == []
+    assert await outbox.pending() == []
+
+@pytest.mark.anyio
+async def test_a_handler_that_always_fails_does_not_hold_the_outbox_up(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    outbox = EventLogOutbox(store, os.path.join(test_dir, "outbox.checkpoint"))
+    await outbox.open()
+    await store.append("a", _announcements("a", 1, 4), 0)
+
+    bus = InMemoryEventBus(mode=DispatchMode.CONCURRENT)
+    received, broken = [], []
+    async def speaker(event):
+        received.append(event.text)
+    async def poisoned(event):
+        broken.append(event.text)
+        if event.text == "2":
+            raise RuntimeError("cannot render")
+    bus.subscribe(AnnouncementTriggered, speaker)
+    bus.subscribe(AnnouncementTriggered, poisoned)
+
+    relay = OutboxRelay(outbox, bus, retry_policy=RetryPolicy(max_retries=2, base_delay=0.001))
+    assert await relay.publish_pending() == 3
+    # Only the failing handler got "2" again (once per try of the RetryPolicy), then it was parked
+    assert received == ["1", "2", "3"]
+    assert broken == ["1", "2", "3", "2", "2", "2"]
+    assert [(p.event.text, p.handler) for p in relay.parked] == [("2", poisoned)]
+
+    # Later events are delivered, the parked one isn't tried again
+    await store.append("a", _announcements("a", 4, 5), 3)
+    assert await relay.publish_pending() == 1
+    assert received == ["1", "2", "3", "4"]
+    assert len(relay.parked) == 1
+
+@pytest.mark.anyio
+async def test_a_bus_that_keeps_raising_parks_only_the_failing_events(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    outbox = EventLogOutbox(store, os.path.join(test_dir, "outbox.checkpoint"))
+    await outbox.open()
+    await store.append("a", _announcements("a", 1, 4), 0)
+
+    # SEQUENTIAL: handler failures are raised, and fail the whole batch
+    bus = InMemoryEventBus()
+    received = []
+    async def speaker(event):
+        if event.text == "2":
+            raise ValueError("cannot render")
+        received.append(event.text)
+    bus.subscribe(AnnouncementTriggered, speaker)
+
+    relay = OutboxRelay(outbox, bus, retry_policy=RetryPolicy(max_retries=0), max_attempts=2)
+    with pytest.raises(ValueError):
+        await relay.publish_pending()
+    assert len(await outbox.pending()) == 3
+    # The last attempt publishes the events one at a time
+    assert await relay.publish_pending() == 3
+    assert [(p.event.text, p.handler) for p in relay.parked] == [("2", None)]
+    assert received == ["1", "1", "3"]
+    assert await outbox.pending() == []
+
+@pytest.mark.anyio
+async def test_services_sharing_a_store_each_get_the_events_of_their_sessions(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    checkpoint = os.path.join(test_dir, "outbox.checkpoint")
+    buses = [RecordingBus(), RecordingBus()]
+    repos = []
+    for bus in buses:
+        # Each service asks for the relay of its store, and gets the same one
+        relay = shared_relay(checkpoint, lambda: OutboxRelay(EventLogOutbox(store, checkpoint), bus))
+        repos.append(OsuSessionRepository(
+            event_store=store, base_path=os.path.join(test_dir, "sessions"), event_bus=bus, outbox_relay=relay
+        ))
+    assert repos[0].outbox_relay is repos[1].outbox_relay
+
+    for session_id, repo in zip(["s1", "s2"], repos):
+        session = _session(session_id)
+        session.start()
+        await repo.save(session)
+
+    assert buses[0].batches == [[_name(e) for e in await store.get("s1")]]
+    assert buses[1].batches == [[_name(e) for e in await store.get("s2")]]
+    assert await relay.publish_pending() == 0
+
+@pytest.mark.anyio
+async def test_running_relay_takes_publishing_off_the_save_path(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    bus = RecordingBus()
+    relay = OutboxRelay(EventLogOutbox(store, os.path.join(test_dir, "outbox.checkpoint")), bus, interval=10)
+    repo = OsuSessionRepository(
+        event_store=store, base_path=os.path.join(test_dir, "sessions"), event_bus=bus, outbox_relay=relay
+    )
+    relay.start()
+
+    session = _session()
+    session.start()
+    session.tick()
+    await repo.save(session)
+    # The last stop() waits for a final round
+    relay.stop()
+
+    # Everything is published by the relay's thread: the stored events in one batch, then the ephemeral tick
+    assert bus.batches == [[_name(e) for e in await store.get("s1")], [SessionTicked.__name__]]
+    assert bus.threads == ["outbox-relay", "outbox-relay"]
+    assert not relay.is_running
@@ -0,0 +1,66 @@
+import os
+from typing import List, Optional
+
+from src.infrastructure.events.outbox.outbox import Outbox, OutboxMessage
+from src.infrastructure.events.store.event_store import EventStore
+from src.infrastructure._common.storage.atomic_file import atomic_write
+
+class EventLogOutbox(Outbox):
+    """
+    Outbox over the global log of an event store (read_all).
+
+    The log is append-only and every stored event has a position in it, so the
+    events themselves are the outbox rows: they are written by the same append,
+    with no second write that a crash could separate from it. Delivery is tracked
+    as a single checkpoint, the last delivered position, kept in a small file.
+    The checkpoint is replaced atomically but not fsynced: after a crash it may lag,
+    and the events after it are published again (at-least-once).
+    The checkpoint covers the whole log, so a process reads it through a single
+    relay (shared_relay), whatever the number of services writing to the store.
+
+    When the checkpoint file doesn't exist yet, open() starts it at the end of the log,
+    so enabling the outbox on an existing store doesn't republish its history.
+    """
+    def __init__(self, event_store: EventStore, checkpoint_path: str = ".osu/outbox.checkpoint"):
+        self.event_store = event_store
+        self.checkpoint_path = checkpoint_path
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._delivered: Optional[int] = None
+
+    async def open(self) -> None:
+        await self._checkpoint()
+
+    async def pending(self, limit: int = 100) -> List[OutboxMessage]:
+        messages: List[OutboxMessage] = []
+        records = self.event_store.read_all(from_position=await self._checkpoint(), batch_size=limit)
+        try:
+            async for position, event in records:
+                messages.append(OutboxMessage(position, event))
+                if len(messages) >= limit:
+                    break
+        finally:
+            await records.aclose()
+        return messages
+
+    async def mark_delivered(self, positions: List[int]) -> None:
+        if not positions:
+            return
+        delivered = max(positions)
+        if delivered > await self._checkpoint():
+            await atomic_write(self.checkpoint_path, str(delivered))
+            self._delivered = delivered
+
+    async def _checkpoint(self) -> int:
+        if self._delivered is None:
+            try:
+                with open(self.checkpoint_path, "r") as f:
+                    self._delivered = int(f.read().strip() or 0)
+            except FileNotFoundError:
+                last = 0
+                async for position, _ in self.event_store.read_all():
+                    last = position
+                await atomic_write(self.checkpoint_path, str(last))
+                self._delivered = last
+        return self._delivered
@@ -1,18 +1,29 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, NamedTuple
 from src.domain._base.domain_event import DomainEvent
 
+class OutboxMessage(NamedTuple):
+    """A stored event waiting to be published, with its global position in the store."""
+    position: int
+    event: DomainEvent
+
 class Outbox(ABC):
     """
     Interface for the Outbox pattern.
-    Ensures that events are published eventually even if the app crashes after local commit.
+    Ensures that events are published eventually even if the app crashes after local commit:
+    outbox entries are written in the same commit as the events themselves, and stay
+    pending until a relay has published them and marked them delivered.
     """
+    async def open(self) -> None:
+        """Prepare the outbox; called before events are appended to the store."""
+        pass
+
     @abstractmethod
-    async def save(self, events: List[DomainEvent]):
-        """Persist events to the outbox storage."""
+    async def pending(self, limit: int = 100) -> List[OutboxMessage]:
+        """Return up to `limit` undelivered messages, oldest first."""
         pass
 
     @abstractmethod
-    async def publish_pending(self):
-        """Publish pending events from the outbox."""
+    async def mark_delivered(self, positions: List[int]) -> None:
+        """Mark messages as published. Messages are delivered in order, oldest first."""
         pass
@@ -0,0 +1,332 @@
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from src.domain._base.domain_event import DomainEvent
+from src.domain._base.event_bus import EventBus
+from src.infrastructure.events.bus.in_memory_event_bus import DeadLetter, handler_name
+from src.infrastructure.events.outbox.outbox import Outbox, OutboxMessage
+from src.infrastructure._common.resilience.errors import TransientError
+from src.infrastructure._common.resilience.policies import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+_relays_guard = threading.Lock()
+_relays: Dict[str, "OutboxRelay"] = {}
+
+def shared_relay(key: str, factory: Callable[[], "OutboxRelay"]) -> "OutboxRelay":
+    """
+    Process-wide relay of the outbox stored at `key` (its checkpoint or database path),
+    made by factory() on first use. Services writing to the same store share it, so
+    their events are read and delivered once, on the bus each service routed them to.
+    """
+    key = os.path.abspath(key)
+    with _relays_guard:
+        relay = _relays.get(key)
+        if relay is None:
+            relay = _relays[key] = factory()
+        return relay
+
+class DeliveryError(TransientError):
+    """A handler failed again on a relayed event without raising it (the bus kept it as a dead letter)."""
+    pass
+
+@dataclass(frozen=True)
+class ParkedDelivery:
+    """A stored event the relay gave up delivering, to `handler` (None: to the whole bus)."""
+    position: int
+    event: DomainEvent
+    handler: Optional[Callable]
+    error: BaseException
+
+class OutboxRelay:
+    """
+    Publishes the pending events of an Outbox on the bus, in batches.
+
+    Each batch is one publish of up to `batch_size` events, retried with the
+    RetryPolicy, then marked delivered. A bus that keeps handler failures as dead
+    letters instead of raising them (InMemoryEventBus in CONCURRENT mode) only gets
+    the failed deliveries again: each event goes back to the handler that failed on
+    it, with the RetryPolicy. A delivery still failing is parked (see `parked`) and
+    the batch moves on, so one broken handler can't hold the outbox up.
+
+    A bus that raises fails the whole batch: it stays pending and stops the round,
+    so events are never published out of order, and the next round publishes it
+    again (at-least-once: a partly delivered batch is published again). After
+    `max_attempts` rounds, its events are published one at a time and those still
+    failing are parked.
+
+    The events of a session go to the bus route() registered for it, the others
+    (e.g. left pending by a previous run) to `event_bus`.
+
+    Started, the relay runs on its own thread and event loop, so it outlives the UI's
+    short-lived loops (Streamlit runs each action in its own asyncio.run). It wakes up
+    on notify() or every `interval` seconds, so events saved in the meantime share one round.
+    Events that are not stored are handed to it with submit(), so every bus it serves is
+    only driven from its thread. Ordering: the events stored before a submit() are
+    published before the submitted ones, and submitted events keep their order.
+    """
+    def __init__(
+        self,
+        outbox: Outbox,
+        event_bus: EventBus,
+        batch_size: int = 100,
+        interval: float = 1.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_routes: int = 1024,
+        max_attempts: int = 5,
+        max_parked: int = 1000
+    ):
+        self.outbox = outbox
+        self.event_bus = event_bus
+        self.batch_size = batch_size
+        self.interval = interval
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=3, base_delay=0.1, max_delay=2.0)
+        self.max_routes = max_routes
+        self.max_attempts = max_attempts
+        self._opened = False
+        # Rounds that failed so far on the batch starting at this position
+        self._attempts: Dict[int, int] = {}
+        self._parked: Deque[ParkedDelivery] = deque(maxlen=max_parked)
+        # Events that are not stored, to publish on the relay's thread after the stored ones
+        self._submitted: Deque[Tuple[EventBus, List[DomainEvent]]] = deque()
+        # session_id -> bus, least recently routed first
+        self._routes: "OrderedDict[str, EventBus]" = OrderedDict()
+        self._lock = threading.Lock()
+        # One round at a time, whatever thread asks for it; a round asked for meanwhile runs right after
+        self._in_round = False
+        self._again = False
+        self._users = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def is_running(self) -> bool:
+        """True while the background thread runs."""
+        return self._thread is not None
+
+    @property
+    def parked(self) -> List[ParkedDelivery]:
+        """Deliveries given up on, oldest first (bounded)."""
+        return list(self._parked)
+
+    async def open(self):
+        """Prepare the outbox (once), before the first events are appended."""
+        if not self._opened:
+            await self.outbox.open()
+            self._opened = True
+
+    def route(self, session_id: str, event_bus: EventBus):
+        """Publish the stored events of a session on `event_bus`. Thread-safe."""
+        key = str(session_id)
+        with self._lock:
+            self._routes[key] = event_bus
+            self._routes.move_to_end(key)
+            while len(self._routes) > self.max_routes:
+                self._routes.popitem(last=False)
+
+    def notify(self):
+        """Wake the background thread up: events were just saved. Thread-safe."""
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                pass  # Stopped in the meantime; its last round publishes them
+
+    def submit(self, event_bus: EventBus, events: List[DomainEvent]) -> bool:
+        """
+        Publish events that are not stored (e.g. ephemeral ticks) on the relay's thread, after
+        the stored events saved before them. Thread-safe. Returns False, publishing nothing,
+        if the relay isn't running: the caller publishes them itself.
+        """
+        with self._lock:
+            if not self._running:
+                return False
+            self._submitted.append((event_bus, list(events)))
+        self.notify()
+        return True
+
+    async def publish_pending(self) -> int:
+        """
+        Publish every pending event now, on the calling event loop. Returns how many were
+        published. If another round is running, it publishes them instead and this returns 0.
+        """
+        with self._lock:
+            if self._in_round:
+                self._again = True
+                return 0
+            self._in_round = True
+        published = 0
+        try:
+            while True:
+                self._again = False
+                published += await self._round()
+                with self._lock:
+                    if not self._again:
+                        self._in_round = False
+                        return published
+        except BaseException:
+            with self._lock:
+                self._in_round = False
+            raise
+
+    def start(self):
+        """
+        Start the background thread; events left pending by a previous run are published first.
+        Each start() is matched by a stop(): the thread runs until the last one.
+        """
+        with self._lock:
+            self._users += 1
+            if self._running:
+                return
+            self._running = True
+            ready = threading.Event()
+            self._thread = threading.Thread(target=self._thread_main, args=(ready,), name="outbox-relay", daemon=True)
+            self._thread.start()
+            ready.wait()
+        logger.info("Outbox relay started")
+
+    def stop(self, timeout: Optional[float] = None):
+        """Release the relay; the last user stops the thread, after a round publishing what is still pending."""
+        with self._lock:
+            if not self._running:
+                return
+            self._users -= 1
+            if self._users:
+                return
+            self._running = False
+            thread, self._thread = self._thread, None
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        thread.join(timeout)
+        logger.info("Outbox relay stopped")
+
+    async def close(self):
+        """Stop the relay if it was started, else publish what is still pending."""
+        if self.is_running:
+            self.stop()
+        else:
+            await self.publish_pending()
+
+    async def _round(self) -> int:
+        await self.open()
+        published = 0
+        while True:
+            messages = await self.outbox.pending(self.batch_size)
+            if not messages:
+                return published
+            for event_bus, batch in self._by_bus(messages):
+                await self._deliver(event_bus, batch)
+                await self.outbox.mark_delivered([m.position for m in batch])
+                published += len(batch)
+            if len(messages) < self.batch_size:
+                return published
+
+    def _by_bus(self, messages: List[OutboxMessage]) -> List[Tuple[EventBus, List[OutboxMessage]]]:
+        """Split messages into runs going to the same bus, keeping their order."""
+        runs: List[Tuple[EventBus, List[OutboxMessage]]] = []
+        with self._lock:
+            for message in messages:
+                session_id = getattr(message.event, "session_id", None)
+                event_bus = self._routes.get(str(session_id), self.event_bus) if session_id is not None else self.event_bus
+                if runs and runs[-1][0] is event_bus:
+                    runs[-1][1].append(message)
+                else:
+                    runs.append((event_bus, [message]))
+        return runs
+
+    async def _deliver(self, event_bus: EventBus, batch: List[OutboxMessage]):
+        """Publish a batch; raises if it has to stay pending, parks the deliveries given up on."""
+        first = batch[0].position
+        attempts = self._attempts.pop(first, 0) + 1
+        if attempts < self.max_attempts:
+            try:
+                await self._deliver_batch(event_bus, batch)
+            except Exception:
+                self._attempts[first] = attempts
+                raise
+            return
+        # Last attempt: one event at a time, so only those still failing are parked
+        for message in batch:
+            try:
+                await self._deliver_batch(event_bus, [message])
+            except Exception as e:
+                self._park(message.position, message.event, None, e)
+
+    async def _deliver_batch(self, event_bus: EventBus, batch: List[OutboxMessage]):
+        failed = await self.retry_policy.execute(self._publish, event_bus, [m.event for m in batch])
+        positions = {id(m.event): m.position for m in batch}
+        for dead_letter in failed:
+            # Only the handler that failed gets the event again
+            try:
+                await self.retry_policy.execute(self._redeliver, event_bus, dead_letter)
+            except Exception as e:
+                self._park(positions[id(dead_letter.event)], dead_letter.event, dead_letter.handler, e)
+
+    def _park(self, position: int, event: DomainEvent, handler: Optional[Callable], error: BaseException):
+        self._parked.append(ParkedDelivery(position, event, handler, error))
+        target = handler_name(handler) if handler else "the bus"
+        logger.error(f"Outbox relay gave up delivering {type(event).__name__} #{position} to {target}: {error}")
+
+    @staticmethod
+    async def _publish(event_bus: EventBus, events: List[DomainEvent]) -> List[DeadLetter]:
+        """Publish events; returns the dead letters the bus kept for them."""
+        # Dead letters kept before the publish stay referenced here, so a new one can't reuse their id
+        before = getattr(event_bus, "dead_letters", None)
+        await event_bus.publish(events)
+        if before is None:
+            return []
+        known = {id(d) for d in before}
+        batch = {id(e) for e in events}
+        return [d for d in event_bus.dead_letters if id(d) not in known and id(d.event) in batch]
+
+    @staticmethod
+    async def _redeliver(event_bus, dead_letter: DeadLetter):
+        if not await event_bus.redeliver(dead_letter.event, dead_letter.handler):
+            raise DeliveryError(f"{handler_name(dead_letter.handler)} failed again on {type(dead_letter.event).__name__}")
+
+    @staticmethod
+    async def _publish_submitted(submitted: List[Tuple[EventBus, List[DomainEvent]]]):
+        for event_bus, events in submitted:
+            try:
+                await event_bus.publish(events)
+            except Exception as e:
+                logger.error(f"Outbox relay failed to publish {len(events)} submitted events: {e}")
+
+    def _thread_main(self, ready: threading.Event):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        ready.set()
+        try:
+            self._loop.run_until_complete(self._run())
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            running = self._running
+            # Taken before reading the outbox, which then holds the events stored before them
+            with self._lock:
+                submitted = list(self._submitted)
+                self._submitted.clear()
+            try:
+                await self.publish_pending()
+            except Exception as e:
+                logger.error(f"Outbox relay error: {e}")
+            await self._publish_submitted(submitted)
+            if not running:
+                return
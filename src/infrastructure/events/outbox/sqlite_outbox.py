@@ -0,0 +1,54 @@
+import sqlite3
+from datetime import datetime
+from typing import List
+
+from src.infrastructure.events.outbox.outbox import Outbox, OutboxMessage
+from src.infrastructure.events.store.sqlite_event_store import SQLiteEventStore
+
+class SQLiteOutbox(Outbox):
+    """
+    Outbox table of a SQLiteEventStore, in the same database.
+    The store inserts one row per event in the append transaction, so an event
+    is committed together with its outbox row or not at all. Delivered rows are
+    kept with their delivery time until purge_delivered().
+    The outbox has its own connection: a relay may run on another thread than the
+    store's writers, and must not end up inside their transactions.
+    """
+    def __init__(self, event_store: SQLiteEventStore):
+        self.event_store = event_store
+        event_store.enable_outbox()
+        self._conn = sqlite3.connect(event_store.db_path, isolation_level=None, check_same_thread=False)
+
+    def close(self):
+        self._conn.close()
+
+    async def pending(self, limit: int = 100) -> List[OutboxMessage]:
+        rows = self._conn.execute(
+            "SELECT o.position, e.event_type, e.event_data FROM outbox o "
+            "JOIN events e ON e.position = o.position "
+            "WHERE o.delivered_on IS NULL ORDER BY o.position LIMIT ?",
+            (limit,)
+        ).fetchall()
+        messages, unknown = [], []
+        for position, event_type, event_data in rows:
+            event = self.event_store._deserialize_row(event_type, event_data)
+            if event is None:
+                unknown.append(position)
+            else:
+                messages.append(OutboxMessage(position, event))
+        # Unknown event types can't be published: don't return them again
+        await self.mark_delivered(unknown)
+        return messages
+
+    async def mark_delivered(self, positions: List[int]) -> None:
+        if not positions:
+            return
+        placeholders = ", ".join("?" * len(positions))
+        self._conn.execute(
+            f"UPDATE outbox SET delivered_on = ? WHERE position IN ({placeholders})",
+            (datetime.now().isoformat(), *positions)
+        )
+
+    async def purge_delivered(self) -> int:
+        """Delete delivered rows. Returns how many were deleted."""
+        return self._conn.execute("DELETE FROM outbox WHERE delivered_on IS NOT NULL").rowcount
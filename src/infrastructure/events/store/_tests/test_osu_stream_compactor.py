@@ -0,0 +1,109 @@
+import pytest
+import os
+import json
+import shutil
+from datetime import datetime
+from uuid import uuid4
+from src.domain.training.events import SessionStarted, SessionTicked, RestStarted, SessionCompleted
+from src.domain.training.value_objects import BlockType
+from src.infrastructure.events.store.osu_event_store import OsuFileEventStore
+from src.infrastructure.events.store.osu_stream_compactor import OsuStreamCompactor
+
+TEST_DIR = ".osu_test_compactor"
+
+@pytest.fixture
+def test_dir():
+    if os.path.exists(TEST_DIR):
+        shutil.rmtree(TEST_DIR)
+    yield TEST_DIR
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+
+def _ticks(session_id, time_lefts, is_work_phase=True):
+    return [
+        SessionTicked(
+            session_id=session_id, current_block_index=0, block_type=BlockType.HEAVY_BAG,
+            current_round=1, time_left=t, is_work_phase=is_work_phase
+        )
+        for t in time_lefts
+    ]
+
+@pytest.mark.anyio
+async def test_compactor_collapses_tick_runs(test_dir):
+    store = OsuFileEventStore(base_path=TEST_DIR)
+    agg_id = uuid4()
+    sid = str(agg_id)
+    events = (
+        [SessionStarted(session_id=sid, workout_id="w1", started_at=datetime.now())]
+        + _ticks(sid, [4, 3, 2, 1, 0])
+        + [RestStarted(session_id=sid, duration=3)]
+        + _ticks(sid, [2, 1, 0], is_work_phase=False)
+        + [SessionCompleted(session_id=sid, completed_at=datetime.now())]
+    )
+    await store.append(agg_id, events, 0)
+
+    compactor = OsuStreamCompactor(base_path=TEST_DIR, min_idle_seconds=0)
+    assert compactor.compact_all() == 6
+    # Already compacted streams are left alone
+    assert compactor.compact_all() == 0
+
+    with open(os.path.join(TEST_DIR, f"{agg_id}.jsonl")) as f:
+        records = [json.loads(line) for line in f]
+    # Versions are kept, not renumbered
+    assert [r["aggregate_version"] for r in records] == [1, 6, 7, 10, 11]
+    assert [r.get("run_length") for r in records] == [None, 5, None, 3, None]
+
+    # Each run keeps its latest state; the live store picks up the rewritten file
+    replayed = await store.get(agg_id)
+    assert [type(e).__name__ for e in replayed] == [
+        "SessionStarted", "SessionTicked", "RestStarted", "SessionTicked", "SessionCompleted"
+    ]
+    assert replayed[1].time_left == 0
+    assert await store.get_version(agg_id) == 11
+    assert [type(e).__name__ async for e in store.read_stream(agg_id, from_version=6, to_version=10)] == [
+        "RestStarted", "SessionTicked"
+    ]
+
+    # Appends continue after the last original version
+    await store.append(agg_id, [RestStarted(session_id=sid, duration=3)], 11)
+    assert await store.get_version(agg_id) == 12
+
+    # The global log keeps every original record
+    assert len([e async for e in store.read_all()]) == 12
+
+@pytest.mark.anyio
+async def test_compacted_stream_range_reads_across_checkpoints(test_dir):
+    store = OsuFileEventStore(base_path=TEST_DIR)
+    agg_id = uuid4()
+    sid = str(agg_id)
+    rests = lambda n: [RestStarted(session_id=sid, duration=d) for d in range(n)]
+    # Versions 1-100 rests, 101-300 ticks, 301-400 rests
+    await store.append(agg_id, rests(100) + _ticks(sid, range(200)) + rests(100), 0)
+    assert OsuStreamCompactor(base_path=TEST_DIR, min_idle_seconds=0).compact_all() == 199
+
+    # A cold store rebuilds its index from the gapped file
+    cold = OsuFileEventStore(base_path=TEST_DIR)
+    assert await cold.get_version(agg_id) == 400
+    tail = [e async for e in cold.read_stream(agg_id, from_version=250)]
+    assert [type(e).__name__ for e in tail] == ["SessionTicked"] + ["RestStarted"] * 100
+    window = [e async for e in cold.read_stream(agg_id, from_version=95, to_version=305, batch_size=2)]
+    assert [getattr(e, "duration", None) for e in window] == [95, 96, 97, 98, 99, None, 0, 1, 2, 3, 4]
+
+@pytest.mark.anyio
+async def test_other_stores_notice_a_compacted_stream_that_grew_back(test_dir):
+    reader, writer = OsuFileEventStore(base_path=TEST_DIR), OsuFileEventStore(base_path=TEST_DIR)
+    agg_id = uuid4()
+    sid = str(agg_id)
+    await reader.append(agg_id, [RestStarted(session_id=sid, duration=1)] + _ticks(sid, range(200)), 0)
+    indexed_size = os.path.getsize(os.path.join(TEST_DIR, f"{agg_id}.jsonl"))
+
+    assert OsuStreamCompactor(base_path=TEST_DIR, min_idle_seconds=0).compact_all() == 199
+    # Appended to by another store until the file is larger than the reader's index says
+    rests = [RestStarted(session_id=sid, duration=d) for d in range(300)]
+    await writer.append(agg_id, rests, 201)
+    assert os.path.getsize(os.path.join(TEST_DIR, f"{agg_id}.jsonl")) > indexed_size
+
+    assert await reader.get_version(agg_id) == 501
+    assert [e.duration async for e in reader.read_stream(agg_id, from_version=250, to_version=255)] == [49, 50, 51, 52, 53]
+    assert [type(e).__name__ for e in await reader.get(agg_id)] == (
+        ["RestStarted", "SessionTicked"] + ["RestStarted"] * 300
+    )
@@ -0,0 +1,52 @@
+import pytest
+import os
+import shutil
+from src.domain.training.session import TrainingSession, SessionStatus
+from src.domain.training.workout import Workout
+from src.domain.training.value_objects import Block, BlockType
+from src.infrastructure.events.store.file_snapshot_store import FileSnapshotStore
+from src.infrastructure.events.store.sqlite_snapshot_store import SQLiteSnapshotStore
+from src.infrastructure.events.store.snapshot_policy import SnapshotPolicy
+
+TEST_DIR = ".osu_test_snapshots"
+
+@pytest.fixture(params=["file", "sqlite"])
+def snapshot_store(request):
+    if os.path.exists(TEST_DIR):
+        shutil.rmtree(TEST_DIR)
+    if request.param == "file":
+        store = FileSnapshotStore(TrainingSession, base_path=TEST_DIR)
+    else:
+        store = SQLiteSnapshotStore(TrainingSession, db_path=os.path.join(TEST_DIR, "events.db"))
+    yield store
+    if request.param == "sqlite":
+        store.close()
+    shutil.rmtree(TEST_DIR)
+
+def _session():
+    workout = Workout(name="Snapshot", id="w1", blocks=[Block(type=BlockType.HEAVY_BAG, work_time=5)])
+    session = TrainingSession(workout=workout, id="s1")
+    session.start()
+    return session
+
+@pytest.mark.anyio
+async def test_snapshot_store_keeps_latest_snapshot(snapshot_store):
+    assert await snapshot_store.get("s1") is None
+
+    session = _session()
+    await snapshot_store.save(session, 3)
+    session.tick()
+    await snapshot_store.save(session, 4)
+
+    snapshot = await snapshot_store.get("s1")
+    assert snapshot.version == 4
+    assert snapshot.aggregate.status == SessionStatus.RUNNING
+    assert snapshot.aggregate.time_left == 4
+    assert snapshot.aggregate.workout.name == "Snapshot"
+
+def test_snapshot_policy_cadence():
+    policy = SnapshotPolicy(every_events=10, every_seconds=30)
+    assert not policy.is_due(events_since=9, seconds_since=29)
+    assert policy.is_due(events_since=10, seconds_since=0)
+    assert policy.is_due(events_since=0, seconds_since=30)
+    assert not SnapshotPolicy(every_events=None).is_due(events_since=1000, seconds_since=1000)
@@ -0,0 +1,65 @@
+import pytest
+import os
+import shutil
+import sqlite3
+from uuid import uuid4
+from src.infrastructure.events.store.sqlite_event_store import SQLiteEventStore
+from src.infrastructure.events.store.event_store import ConcurrencyError
+from src.domain.training.events import AnnouncementTriggered
+
+TEST_DIR = ".osu_test_sqlite"
+
+@pytest.fixture
+def store():
+    if os.path.exists(TEST_DIR):
+        shutil.rmtree(TEST_DIR)
+    store = SQLiteEventStore(db_path=os.path.join(TEST_DIR, "events.db"))
+    yield store
+    store.close()
+    shutil.rmtree(TEST_DIR)
+
+def _announcements(agg_id, start, stop):
+    return [AnnouncementTriggered(session_id=str(agg_id), text=str(v)) for v in range(start, stop)]
+
+@pytest.mark.anyio
+async def test_sqlite_event_store_append_and_get(store):
+    agg_id = uuid4()
+    assert await store.get_version(agg_id) == 0
+
+    await store.append(agg_id, _announcements(agg_id, 1, 4), 0)
+    await store.append(agg_id, _announcements(agg_id, 4, 6), 3)
+
+    assert await store.get_version(agg_id) == 5
+    assert [e.text for e in await store.get(agg_id)] == ["1", "2", "3", "4", "5"]
+
+    mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+@pytest.mark.anyio
+async def test_sqlite_event_store_rejects_stale_expected_version(store):
+    agg_id = uuid4()
+    await store.append(agg_id, _announcements(agg_id, 1, 2), 0)
+
+    with pytest.raises(ConcurrencyError):
+        await store.append(agg_id, _announcements(agg_id, 2, 4), 0)
+
+    # The failed batch is rolled back as a whole
+    assert await store.get_version(agg_id) == 1
+
+@pytest.mark.anyio
+async def test_sqlite_event_store_read_stream_and_global_position(store):
+    first, second = uuid4(), uuid4()
+    await store.append(first, _announcements(first, 1, 251), 0)
+    await store.append(second, _announcements(second, 1, 3), 0)
+    await store.append(first, _announcements(first, 251, 253), 250)
+
+    tail = [e.text async for e in store.read_stream(first, from_version=240, to_version=251, batch_size=4)]
+    assert tail == [str(v) for v in range(241, 252)]
+
+    # Positions are global and interleave streams in commit order
+    conn = sqlite3.connect(store.db_path)
+    rows = conn.execute(
+        "SELECT aggregate_id, aggregate_version FROM events WHERE position > 250 ORDER BY position"
+    ).fetchall()
+    conn.close()
+    assert rows == [(str(second), 1), (str(second), 2), (str(first), 251), (str(first), 252)]
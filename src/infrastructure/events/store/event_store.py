@@ -1,7 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 from src.domain._base.domain_event import DomainEvent
+from src.infrastructure._common.resilience.errors import AppError
+
+class ConcurrencyError(AppError):
+    """
+    Raised when an append is made against a stale stream version (optimistic locking).
+    The caller should reload the aggregate and retry the command.
+    """
+    def __init__(self, aggregate_id: UUID, expected_version: int, actual_version: int):
+        super().__init__(
+            f"Concurrency conflict on stream {aggregate_id}: "
+            f"expected version {expected_version}, actual version {actual_version}"
+        )
+        self.aggregate_id = aggregate_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
 
 class EventStore(ABC):
     """
@@ -9,10 +24,45 @@ class EventStore(ABC):
     """
     @abstractmethod
     async def append(self, aggregate_id: UUID, events: List[DomainEvent], expected_version: int) -> None:
-        """Append events to the stream."""
+        """
+        Append events to the stream.
+        Raises ConcurrencyError if the stream is not at `expected_version`.
+        """
         pass
 
     @abstractmethod
     async def get(self, aggregate_id: UUID) -> List[DomainEvent]:
         """Retrieve all events for an aggregate."""
         pass
+
+    @abstractmethod
+    async def get_version(self, aggregate_id: UUID) -> int:
+        """
+        Return the current version of a stream (the aggregate_version of its last event),
+        0 if it does not exist. Compaction can leave gaps, so it may exceed the number of stored events.
+        """
+        pass
+
+    @abstractmethod
+    def read_stream(
+        self,
+        aggregate_id: UUID,
+        from_version: int = 0,
+        to_version: Optional[int] = None,
+        batch_size: int = 100
+    ) -> AsyncIterator[DomainEvent]:
+        """
+        Stream the events of an aggregate with from_version < version <= to_version.
+        Versions are 1-based, so from_version=0 starts at the first event and
+        from_version=N yields the tail after a snapshot taken at version N.
+        Implementations read at most `batch_size` events at a time.
+        """
+        pass
+
+    @abstractmethod
+    def read_all(self, from_position: int = 0, batch_size: int = 100) -> AsyncIterator[Tuple[int, DomainEvent]]:
+        """
+        Stream (position, event) pairs across all aggregates, in global append order,
+        for every event with position > from_position. Positions are 1-based.
+        """
+        pass
@@ -0,0 +1,49 @@
+import os
+import json
+from datetime import datetime
+from typing import Optional, Type
+from uuid import UUID
+
+from src.domain._base.aggregate_root import AggregateRoot
+from src.infrastructure._common.storage.atomic_file import atomic_write
+from src.infrastructure._common.storage.fsync_policy import FsyncPolicy
+from src.infrastructure.events.store.snapshot_store import Snapshot, SnapshotStore
+
+class FileSnapshotStore(SnapshotStore):
+    """
+    One compact JSON file per aggregate: {"version", "taken_at", "state"}.
+    Files are replaced atomically (write temp + rename).
+    """
+    def __init__(
+        self,
+        aggregate_type: Type[AggregateRoot],
+        base_path: str = ".osu/persistence/snapshots",
+        fsync_policy: Optional[FsyncPolicy] = None
+    ):
+        self.aggregate_type = aggregate_type
+        self.base_path = base_path
+        self.fsync_policy = fsync_policy or FsyncPolicy()
+        os.makedirs(self.base_path, exist_ok=True)
+
+    def _path(self, aggregate_id: UUID) -> str:
+        return os.path.join(self.base_path, f"{aggregate_id}.json")
+
+    async def save(self, aggregate: AggregateRoot, version: int) -> None:
+        file_path = self._path(aggregate.id)
+        document = (
+            f'{{"version":{version},"taken_at":"{datetime.now().isoformat()}",'
+            f'"state":{aggregate.model_dump_json()}}}'
+        )
+        await atomic_write(file_path, document, self.fsync_policy)
+
+    async def get(self, aggregate_id: UUID) -> Optional[Snapshot]:
+        file_path = self._path(aggregate_id)
+        if not os.path.exists(file_path):
+            return None
+        with open(file_path, "r") as f:
+            data = json.load(f)
+        return Snapshot(
+            aggregate=self.aggregate_type(**data["state"]),
+            version=data["version"],
+            taken_at=datetime.fromisoformat(data["taken_at"])
+        )
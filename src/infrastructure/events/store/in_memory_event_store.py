@@ -1,19 +1,49 @@
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+import anyio
+from itertools import islice
 from uuid import UUID
-from src.infrastructure.events.store.event_store import EventStore
+from src.infrastructure.events.store.event_store import EventStore, ConcurrencyError
 from src.domain._base.domain_event import DomainEvent
 
 class InMemoryEventStore(EventStore):
     def __init__(self):
         self._store: Dict[UUID, List[DomainEvent]] = {}
+        # Global log across all aggregates; position = index + 1
+        self._log: List[DomainEvent] = []
 
-    async def append(self, aggregate_id: UUID, events: List[DomainEvent], expected_version: int = None) -> None:
+    async def append(self, aggregate_id: UUID, events: List[DomainEvent], expected_version: int) -> None:
         if aggregate_id not in self._store:
             self._store[aggregate_id] = []
         
-        # Concurrency check could be mocked here using expected_version vs len(self._store[aggregate_id])
+        current_version = len(self._store[aggregate_id])
+        if current_version != expected_version:
+            raise ConcurrencyError(aggregate_id, expected_version, current_version)
         
         self._store[aggregate_id].extend(events)
+        self._log.extend(events)
 
     async def get(self, aggregate_id: UUID) -> List[DomainEvent]:
         return self._store.get(aggregate_id, [])
+
+    async def get_version(self, aggregate_id: UUID) -> int:
+        return len(self._store.get(aggregate_id, []))
+
+    async def read_stream(
+        self,
+        aggregate_id: UUID,
+        from_version: int = 0,
+        to_version: Optional[int] = None,
+        batch_size: int = 100
+    ) -> AsyncIterator[DomainEvent]:
+        stream = self._store.get(aggregate_id, [])
+        # islice walks the list in place instead of copying a slice
+        for count, event in enumerate(islice(stream, from_version, to_version), start=1):
+            yield event
+            if count % batch_size == 0:
+                await anyio.sleep(0)
+
+    async def read_all(self, from_position: int = 0, batch_size: int = 100) -> AsyncIterator[Tuple[int, DomainEvent]]:
+        for position, event in enumerate(islice(self._log, from_position, None), start=from_position + 1):
+            yield position, event
+            if (position - from_position) % batch_size == 0:
+                await anyio.sleep(0)
@@ -1,30 +1,217 @@
 import os
 import json
-from typing import List
+import anyio
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
-from src.infrastructure.events.store.event_store import EventStore
+from src.infrastructure.events.store.event_store import EventStore, ConcurrencyError
 from src.infrastructure.events.store.stored_event import StoredEvent
 from src.domain._base.domain_event import DomainEvent
 from src.infrastructure._common.serialization.event_serializer import EventSerializer
+from src.infrastructure._common.storage.fsync_policy import FsyncPolicy
+
+# One byte-offset checkpoint is kept every INDEX_STRIDE records.
+INDEX_STRIDE = 64
+# Global log holding every record of every stream in append order.
+# Its version doubles as the global position.
+ALL_STREAM = "_all"
+
+_locks_guard = threading.Lock()
+_stream_locks: Dict[str, threading.RLock] = {}
+
+def stream_lock(file_path: str) -> threading.RLock:
+    """
+    Process-wide lock of a stream file, held while records are appended to it
+    or its index is refreshed. Anything rewriting a stream in place
+    (OsuStreamCompactor) takes it too.
+    """
+    key = os.path.abspath(file_path)
+    with _locks_guard:
+        lock = _stream_locks.get(key)
+        if lock is None:
+            lock = _stream_locks[key] = threading.RLock()
+        return lock
+
+@dataclass
+class _StreamIndex:
+    """
+    In-memory index of a JSONL stream.
+    `size` is the file size the index was built against, which lets us detect
+    external writes without re-reading the stream, and `inode` the file it was
+    built from: a rewrite (OsuStreamCompactor) replaces the file, whatever its size.
+    `version` is the version of the last record; compacted streams have gaps,
+    so it can be larger than `count`.
+    """
+    version: int = 0
+    count: int = 0
+    size: int = 0
+    inode: Tuple[int, int] = (0, 0)
+    # checkpoints[i] is (version of the previous record, byte offset) of record i * INDEX_STRIDE
+    checkpoints: List[Tuple[int, int]] = field(default_factory=list)
+
+    def record(self, offset: int):
+        """Register the record starting at `offset`; `version` is still the previous record's."""
+        if self.count % INDEX_STRIDE == 0:
+            self.checkpoints.append((self.version, offset))
+        self.count += 1
+
+    def append(self, length: int, version: int):
+        """Register a record of `length` bytes written at the end of the file."""
+        self.record(self.size)
+        self.size += length
+        self.version = version
 
 class OsuFileEventStore(EventStore):
-    def __init__(self, base_path: str = ".osu"):
+    def __init__(self, base_path: str = ".osu", fsync_policy: Optional[FsyncPolicy] = None):
         self.base_path = base_path
         if not os.path.exists(self.base_path):
             os.makedirs(self.base_path)
         self.serializer = EventSerializer()
+        self.fsync_policy = fsync_policy or FsyncPolicy()
+        self._indexes: Dict[UUID | str, _StreamIndex] = {}
+
+    def _stream_path(self, aggregate_id: UUID | str) -> str:
+        return os.path.join(self.base_path, f"{aggregate_id}.jsonl")
+
+    @staticmethod
+    def _version_key(aggregate_id: UUID | str) -> str:
+        return "position" if aggregate_id == ALL_STREAM else "aggregate_version"
+
+    def _refresh_index(self, aggregate_id: UUID | str) -> _StreamIndex:
+        """
+        Bring the stream index up to date.
+        O(1) while the file size matches the cached one; otherwise only the
+        bytes written since the cached offset are scanned, up to the last complete
+        record (another thread may be writing the next one).
+        """
+        file_path = self._stream_path(aggregate_id)
+        with stream_lock(file_path):
+            return self._refresh_index_locked(aggregate_id, file_path)
+
+    def _refresh_index_locked(self, aggregate_id: UUID | str, file_path: str) -> _StreamIndex:
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            self._indexes.pop(aggregate_id, None)
+            return _StreamIndex()
+        size, inode = stat.st_size, (stat.st_dev, stat.st_ino)
+
+        index = self._indexes.get(aggregate_id)
+        if index is None or index.inode != inode or index.size > size:
+            # Unknown stream, or file replaced/truncated behind our back: rebuild from scratch.
+            index = _StreamIndex(inode=inode)
+
+        if index.size < size:
+            key = self._version_key(aggregate_id)
+            last: Optional[bytes] = None
+            with open(file_path, "rb") as f:
+                f.seek(index.size)
+                offset = index.size
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    if line.strip():
+                        # Only the records right before a checkpoint and the last one are parsed
+                        if index.count % INDEX_STRIDE == 0 and last is not None:
+                            index.version = json.loads(last)[key]
+                        index.record(offset)
+                        last = line
+                    offset += len(line)
+            if last is not None:
+                index.version = json.loads(last)[key]
+            index.size = offset
+
+        self._indexes[aggregate_id] = index
+        return index
+
+    def _deserialize(self, stored_data: dict) -> Optional[DomainEvent]:
+        # Deserialize the inner event_data
+        try:
+            return self.serializer.deserialize(
+                stored_data["event_data"],
+                event_type=stored_data["event_type"]
+            )
+        except ValueError as e:
+            print(f"Skipping unknown event type: {e}")
+            return None
+
+    async def _scan(
+        self,
+        stream: str,
+        from_version: int,
+        to_version: Optional[int],
+        batch_size: int
+    ) -> AsyncIterator[List[dict]]:
+        """Yield batches of records with from_version < version <= to_version."""
+        index = self._refresh_index(stream)
+        last_version = index.version if to_version is None else min(to_version, index.version)
+        if from_version >= last_version:
+            return
+
+        # Seek to the nearest checkpoint at or before the first requested record.
+        # Versions can have gaps, so records are matched on their own version, not counted.
+        key = self._version_key(stream)
+        checkpoint = bisect_right(index.checkpoints, (from_version, float("inf"))) - 1
+
+        with open(self._stream_path(stream), "rb") as f:
+            f.seek(index.checkpoints[checkpoint][1])
+            batch: List[dict] = []
+            for line in f:
+                if not line.strip(): continue
+                record = json.loads(line)
+                version = record[key]
+                if version > last_version: break
+                if version <= from_version: continue
+                batch.append(record)
+                if len(batch) >= batch_size or version == last_version:
+                    yield batch
+                    batch = []
+                    # Let other tasks run between batches of a long replay
+                    await anyio.sleep(0)
+                if version == last_version:
+                    break
+            if batch:
+                yield batch
+
+    async def get_version(self, aggregate_id: UUID) -> int:
+        return self._refresh_index(aggregate_id).version
 
     async def append(self, aggregate_id: UUID, events: List[DomainEvent], expected_version: int) -> None:
-        file_path = os.path.join(self.base_path, f"{aggregate_id}.jsonl")
-        
-        # In a real file store, we would check versions (optimistic locking) by reading the file line count.
-        # For this prototype, we just append.
-        
+        file_path = self._stream_path(aggregate_id)
+        log_path = self._stream_path(ALL_STREAM)
+
+        # The locks keep the version check and the writes atomic with respect to
+        # a compactor rewriting the stream, and the positions unique across stores
+        # appending to the same log, from other threads.
+        with stream_lock(file_path), stream_lock(log_path):
+            self._append_locked(aggregate_id, events, expected_version, file_path, log_path)
+
+        # The index is already up to date; this only waits for durability
+        await self.fsync_policy.sync(file_path, log_path)
+
+    def _append_locked(
+        self,
+        aggregate_id: UUID,
+        events: List[DomainEvent],
+        expected_version: int,
+        file_path: str,
+        log_path: str
+    ):
+        index = self._refresh_index(aggregate_id)
+        if index.version != expected_version:
+            raise ConcurrencyError(aggregate_id, expected_version, index.version)
+
         new_version = expected_version
-        
-        with open(file_path, "a") as f:
+        log_index = self._refresh_index(ALL_STREAM)
+
+        # Each record goes to its own stream and to the global log, with the
+        # same bytes. The stream file is closed (flushed) first: a crash in between
+        # can leave a record missing from the global log, never a phantom one.
+        with open(log_path, "ab") as log, open(file_path, "ab") as f:
             for event in events:
                 new_version += 1
                 stored = StoredEvent(
@@ -34,9 +221,10 @@ class OsuFileEventStore(EventStore):
                     event_type=event.__class__.__name__,
                     event_data=event.model_dump_json() if hasattr(event, "model_dump_json") else self.serializer.serialize(event),
                     occurred_on=datetime.now(), # Or event.occurred_on if available? DomainEvent usually expects us to track store time.
-                    correlation_id=None
+                    correlation_id=None,
+                    position=log_index.version + 1
                 )
-                
+
                 # We store the StoredEvent as a JSON line
                 # We need to serialize StoredEvent (dataclass) to dict
                 data = {
@@ -46,32 +234,37 @@ class OsuFileEventStore(EventStore):
                     "event_type": stored.event_type,
                     "event_data": stored.event_data,
                     "occurred_on": stored.occurred_on.isoformat(),
-                    "correlation_id": stored.correlation_id
+                    "correlation_id": stored.correlation_id,
+                    "position": stored.position
                 }
-                f.write(json.dumps(data) + "\n")
+                line = (json.dumps(data) + "\n").encode("utf-8")
+                f.write(line)
+                index.append(len(line), stored.aggregate_version)
+                log.write(line)
+                log_index.append(len(line), stored.position)
+
+        self._indexes[aggregate_id] = index
+        self._indexes[ALL_STREAM] = log_index
 
     async def get(self, aggregate_id: UUID) -> List[DomainEvent]:
-        file_path = os.path.join(self.base_path, f"{aggregate_id}.jsonl")
-        if not os.path.exists(file_path):
-            return []
-            
-        events = []
-        with open(file_path, "r") as f:
-            for line in f:
-                if not line.strip(): continue
-                
-                # StoredEvent JSON
-                stored_data = json.loads(line)
-                
-                # Deserialize the inner event_data
-                try:
-                    domain_event = self.serializer.deserialize(
-                        stored_data["event_data"], 
-                        event_type=stored_data["event_type"]
-                    )
-                    events.append(domain_event)
-                except ValueError as e:
-                    print(f"Skipping unknown event type: {e}")
-                    continue
-                    
-        return events
+        return [event async for event in self.read_stream(aggregate_id)]
+
+    async def read_stream(
+        self,
+        aggregate_id: UUID,
+        from_version: int = 0,
+        to_version: Optional[int] = None,
+        batch_size: int = 100
+    ) -> AsyncIterator[DomainEvent]:
+        async for batch in self._scan(aggregate_id, from_version, to_version, batch_size):
+            for stored_data in batch:
+                event = self._deserialize(stored_data)
+                if event is not None:
+                    yield event
+
+    async def read_all(self, from_position: int = 0, batch_size: int = 100) -> AsyncIterator[Tuple[int, DomainEvent]]:
+        async for batch in self._scan(ALL_STREAM, from_position, None, batch_size):
+            for stored_data in batch:
+                event = self._deserialize(stored_data)
+                if event is not None:
+                    yield stored_data["position"], event
@@ -0,0 +1,133 @@
+import os
+import json
+import time
+import asyncio
+import logging
+from typing import Iterable, List, Optional
+
+from src.infrastructure.events.store.osu_event_store import ALL_STREAM, stream_lock
+from src.infrastructure._common.storage.fsync_policy import FsyncMode, fsync_path
+
+logger = logging.getLogger(__name__)
+
+class OsuStreamCompactor:
+    """
+    Background job that collapses runs of transient events in existing .osu JSONL streams.
+
+    Each run of consecutive records of a compactable type becomes a single record:
+    the last event of the run (which carries the latest state), tagged with
+    "run_length". Records keep their original aggregate_version, so the stream
+    has gaps afterwards but snapshot versions, loaded session versions and the
+    global log stay valid. Only streams idle for at least `min_idle_seconds` are
+    touched. The global log is left as-is: its positions are referenced by
+    subscription checkpoints and must stay stable.
+
+    The rewritten file replaces the stream under the same lock the store appends
+    under, so an append can't land in between (within one process). Stores notice
+    the new file (a new inode) and rebuild their index of it.
+    """
+    def __init__(
+        self,
+        base_path: str = ".osu",
+        event_types: Iterable[str] = ("SessionTicked",),
+        min_idle_seconds: float = 300.0,
+        interval: float = 600.0,
+        fsync_mode: FsyncMode = FsyncMode.ALWAYS
+    ):
+        self.base_path = base_path
+        self.event_types = set(event_types)
+        self.min_idle_seconds = min_idle_seconds
+        self.interval = interval
+        self.fsync_mode = FsyncMode(fsync_mode)
+        self._running = False
+        self._task = None
+
+    def compact_stream(self, file_path: str) -> int:
+        """Compact one stream file in place. Returns the number of records removed."""
+        size = os.path.getsize(file_path)
+        if time.time() - os.path.getmtime(file_path) < self.min_idle_seconds:
+            return 0
+
+        with open(file_path, "rb") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+
+        compacted: List[dict] = []
+        run: Optional[dict] = None
+        run_length = 0
+
+        def flush_run():
+            # Single-record runs are kept verbatim
+            compacted.append({**run, "run_length": run_length} if run_length > 1 else run)
+
+        for record in records:
+            if record["event_type"] in self.event_types:
+                run = record
+                run_length += record.get("run_length", 1)
+                continue
+            if run is not None:
+                flush_run()
+                run, run_length = None, 0
+            compacted.append(record)
+        if run is not None:
+            flush_run()
+
+        removed = len(records) - len(compacted)
+        if removed == 0:
+            return 0
+
+        tmp_path = file_path + ".compact"
+        with open(tmp_path, "wb") as f:
+            for record in compacted:
+                f.write((json.dumps(record) + "\n").encode("utf-8"))
+
+        # Compaction runs off the hot path, so it syncs directly instead of batching
+        if self.fsync_mode != FsyncMode.NEVER:
+            fsync_path(tmp_path)
+
+        with stream_lock(file_path):
+            # Abort if the stream was appended to while we were compacting it
+            if os.path.getsize(file_path) != size:
+                os.remove(tmp_path)
+                return 0
+            os.replace(tmp_path, file_path)
+        if self.fsync_mode != FsyncMode.NEVER:
+            fsync_path(self.base_path)
+        logger.info(f"Compacted {file_path}: {len(records)} -> {len(compacted)} records")
+        return removed
+
+    def compact_all(self) -> int:
+        """Compact every idle stream under base_path. Returns the total number of records removed."""
+        removed = 0
+        for filename in os.listdir(self.base_path):
+            if not filename.endswith(".jsonl") or filename == f"{ALL_STREAM}.jsonl":
+                continue
+            try:
+                removed += self.compact_stream(os.path.join(self.base_path, filename))
+            except (OSError, ValueError, KeyError) as e:
+                logger.error(f"Failed to compact {filename}: {e}")
+        return removed
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"Stream compactor started for {self.base_path}")
+
+    async def stop(self):
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Stream compactor stopped")
+
+    async def _loop(self):
+        while self._running:
+            try:
+                await asyncio.to_thread(self.compact_all)
+            except Exception as e:
+                logger.error(f"Compactor error: {e}")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,24 @@
+from typing import Iterable, List, Type
+from src.domain._base.domain_event import DomainEvent
+
+class EventPersistencePolicy:
+    """
+    Decides which events are written to the event store.
+    Ephemeral events are still published on the bus, but never stored:
+    they carry no information that later events or snapshots don't already hold.
+    """
+    def __init__(self, ephemeral_types: Iterable[Type[DomainEvent]] = ()):
+        self.ephemeral_types = tuple(ephemeral_types)
+
+    @classmethod
+    def persist_all(cls) -> "EventPersistencePolicy":
+        return cls()
+
+    def is_ephemeral(self, event: DomainEvent) -> bool:
+        return isinstance(event, self.ephemeral_types)
+
+    def to_store(self, events: List[DomainEvent]) -> List[DomainEvent]:
+        """Return the subset of `events` that should be persisted."""
+        if not self.ephemeral_types:
+            return events
+        return [event for event in events if not self.is_ephemeral(event)]
@@ -0,0 +1,18 @@
+from typing import Optional
+
+class SnapshotPolicy:
+    """
+    Snapshot cadence: take a snapshot once `every_events` events were raised
+    or `every_seconds` elapsed since the previous one, whichever comes first.
+    A disabled criterion is None. The first save of an aggregate always snapshots.
+    """
+    def __init__(self, every_events: Optional[int] = 1, every_seconds: Optional[float] = None):
+        self.every_events = every_events
+        self.every_seconds = every_seconds
+
+    def is_due(self, events_since: int, seconds_since: float) -> bool:
+        if self.every_events is not None and events_since >= self.every_events:
+            return True
+        if self.every_seconds is not None and seconds_since >= self.every_seconds:
+            return True
+        return False
@@ -1,16 +1,31 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 from typing import Optional
 from src.domain._base.aggregate_root import AggregateRoot
 
+@dataclass
+class Snapshot:
+    """
+    An aggregate's state as of a given stream version.
+    Loading = restore the snapshot, then apply events with version > `version`.
+    """
+    aggregate: AggregateRoot
+    version: int
+    taken_at: datetime
+
 class SnapshotStore(ABC):
     """
     Interface for storing and retrieving aggregate snapshots.
+    Only the latest snapshot of each aggregate is kept.
     """
     @abstractmethod
-    def save(self, aggregate: AggregateRoot):
+    async def save(self, aggregate: AggregateRoot, version: int) -> None:
+        """Store `aggregate` as the snapshot at stream `version`, replacing any older one."""
         pass
 
     @abstractmethod
-    def get(self, aggregate_id: UUID) -> Optional[AggregateRoot]:
+    async def get(self, aggregate_id: UUID) -> Optional[Snapshot]:
+        """Return the latest snapshot, or None if the aggregate was never snapshotted."""
         pass
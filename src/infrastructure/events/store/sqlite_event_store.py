@@ -0,0 +1,177 @@
+import os
+import sys
+import logging
+import sqlite3
+import anyio
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import UUID
+
+from src.infrastructure.events.store.event_store import EventStore, ConcurrencyError
+from src.domain._base.domain_event import DomainEvent
+from src.infrastructure._common.serialization.event_serializer import EventSerializer
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    aggregate_id TEXT NOT NULL,
+    aggregate_version INTEGER NOT NULL,
+    position INTEGER NOT NULL UNIQUE,
+    event_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    event_data TEXT NOT NULL,
+    occurred_on TEXT NOT NULL,
+    correlation_id TEXT,
+    PRIMARY KEY (aggregate_id, aggregate_version)
+)
+"""
+
+OUTBOX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    position INTEGER PRIMARY KEY,
+    delivered_on TEXT
+)
+"""
+
+# Keeps the relay's scan for undelivered rows short however many delivered rows are kept
+OUTBOX_INDEX = "CREATE INDEX IF NOT EXISTS outbox_pending ON outbox (position) WHERE delivered_on IS NULL"
+
+class SQLiteEventStore(EventStore):
+    """
+    Event store backed by a single SQLite database in WAL mode.
+    All streams share one table; (aggregate_id, aggregate_version) is the primary key,
+    so a concurrent writer racing on the same version is rejected by the database itself.
+    `position` is a global, gap-free sequence across all streams.
+    """
+    def __init__(self, db_path: str = ".osu/events.db"):
+        self.db_path = db_path
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.serializer = EventSerializer()
+
+        # One long-lived connection, reused for every call.
+        # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE.
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(SCHEMA)
+        self._outbox = False
+
+    def close(self):
+        self._conn.close()
+
+    def enable_outbox(self):
+        """From now on, every append also adds an outbox row per event, in the same transaction."""
+        self._conn.execute(OUTBOX_SCHEMA)
+        self._conn.execute(OUTBOX_INDEX)
+        self._outbox = True
+
+    def _deserialize_row(self, event_type: str, event_data: str) -> Optional[DomainEvent]:
+        try:
+            return self.serializer.deserialize(event_data, event_type=event_type)
+        except ValueError as e:
+            logger.warning(f"Skipping unknown event type: {e}")
+            return None
+
+    def _current_version(self, aggregate_id: UUID) -> int:
+        row = self._conn.execute(
+            "SELECT MAX(aggregate_version) FROM events WHERE aggregate_id = ?",
+            (str(aggregate_id),)
+        ).fetchone()
+        return row[0] or 0
+
+    async def get_version(self, aggregate_id: UUID) -> int:
+        return self._current_version(aggregate_id)
+
+    async def append(self, aggregate_id: UUID, events: List[DomainEvent], expected_version: int) -> None:
+        if not events:
+            return
+
+        # BEGIN IMMEDIATE takes the write lock up front, so the version check,
+        # the position allocation and the insert happen atomically.
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            current_version = self._current_version(aggregate_id)
+            if current_version != expected_version:
+                raise ConcurrencyError(aggregate_id, expected_version, current_version)
+
+            last_position = self._conn.execute("SELECT COALESCE(MAX(position), 0) FROM events").fetchone()[0]
+            rows = [
+                (
+                    str(aggregate_id),
+                    expected_version + offset,
+                    last_position + offset,
+                    str(event.event_id),
+                    event.__class__.__name__,
+                    event.model_dump_json(),
+                    event.occurred_on.isoformat(),
+                    event.correlation_id
+                )
+                for offset, event in enumerate(events, start=1)
+            ]
+            self._conn.executemany(
+                "INSERT INTO events (aggregate_id, aggregate_version, position, event_id, "
+                "event_type, event_data, occurred_on, correlation_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            if self._outbox:
+                self._conn.executemany("INSERT INTO outbox (position) VALUES (?)", [(row[2],) for row in rows])
+            self._conn.execute("COMMIT")
+        except sqlite3.IntegrityError:
+            # Another connection (e.g. another process) won the race for this version
+            self._conn.execute("ROLLBACK")
+            raise ConcurrencyError(aggregate_id, expected_version, self._current_version(aggregate_id))
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    async def get(self, aggregate_id: UUID) -> List[DomainEvent]:
+        return [event async for event in self.read_stream(aggregate_id)]
+
+    async def read_stream(
+        self,
+        aggregate_id: UUID,
+        from_version: int = 0,
+        to_version: Optional[int] = None,
+        batch_size: int = 100
+    ) -> AsyncIterator[DomainEvent]:
+        # Keyset pagination: each batch is its own short query, so no cursor
+        # (and no read transaction) is held open while the consumer awaits.
+        last_version = to_version if to_version is not None else sys.maxsize
+        while True:
+            rows = self._conn.execute(
+                "SELECT aggregate_version, event_type, event_data FROM events "
+                "WHERE aggregate_id = ? AND aggregate_version > ? AND aggregate_version <= ? "
+                "ORDER BY aggregate_version LIMIT ?",
+                (str(aggregate_id), from_version, last_version, batch_size)
+            ).fetchall()
+            if not rows:
+                break
+            for version, event_type, event_data in rows:
+                event = self._deserialize_row(event_type, event_data)
+                if event is not None:
+                    yield event
+            from_version = rows[-1][0]
+            if len(rows) < batch_size:
+                break
+            # Let other tasks run between batches of a long replay
+            await anyio.sleep(0)
+
+    async def read_all(self, from_position: int = 0, batch_size: int = 100) -> AsyncIterator[Tuple[int, DomainEvent]]:
+        while True:
+            rows = self._conn.execute(
+                "SELECT position, event_type, event_data FROM events "
+                "WHERE position > ? ORDER BY position LIMIT ?",
+                (from_position, batch_size)
+            ).fetchall()
+            if not rows:
+                break
+            for position, event_type, event_data in rows:
+                event = self._deserialize_row(event_type, event_data)
+                if event is not None:
+                    yield position, event
+            from_position = rows[-1][0]
+            if len(rows) < batch_size:
+                break
+            await anyio.sleep(0)
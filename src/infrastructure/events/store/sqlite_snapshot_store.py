@@ -0,0 +1,59 @@
+import os
+import json
+import sqlite3
+from datetime import datetime
+from typing import Optional, Type
+from uuid import UUID
+
+from src.domain._base.aggregate_root import AggregateRoot
+from src.infrastructure.events.store.snapshot_store import Snapshot, SnapshotStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    aggregate_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    taken_at TEXT NOT NULL,
+    state TEXT NOT NULL
+)
+"""
+
+class SQLiteSnapshotStore(SnapshotStore):
+    """
+    Snapshots in a SQLite table keyed by aggregate_id (latest only).
+    Can share its database file with SQLiteEventStore.
+    """
+    def __init__(self, aggregate_type: Type[AggregateRoot], db_path: str = ".osu/events.db"):
+        self.aggregate_type = aggregate_type
+        self.db_path = db_path
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # One long-lived connection, reused for every call.
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    async def save(self, aggregate: AggregateRoot, version: int) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO snapshots (aggregate_id, version, taken_at, state) VALUES (?, ?, ?, ?)",
+            (str(aggregate.id), version, datetime.now().isoformat(), aggregate.model_dump_json())
+        )
+
+    async def get(self, aggregate_id: UUID) -> Optional[Snapshot]:
+        row = self._conn.execute(
+            "SELECT version, taken_at, state FROM snapshots WHERE aggregate_id = ?",
+            (str(aggregate_id),)
+        ).fetchone()
+        if row is None:
+            return None
+        version, taken_at, state = row
+        return Snapshot(
+            aggregate=self.aggregate_type(**json.loads(state)),
+            version=version,
+            taken_at=datetime.fromisoformat(taken_at)
+        )
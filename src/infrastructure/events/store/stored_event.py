@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 @dataclass
@@ -15,3 +16,5 @@ class StoredEvent:
     event_data: str  # Serialized JSON
     occurred_on: datetime
     correlation_id: str = None
+    # Global, store-wide sequence number across all aggregates
+    position: Optional[int] = None
@@ -0,0 +1,12 @@
+from typing import Dict
+from src.infrastructure.events.subscriptions.checkpoint_store import CheckpointStore
+
+class InMemoryCheckpointStore(CheckpointStore):
+    def __init__(self):
+        self._positions: Dict[str, int] = {}
+
+    async def load(self, name: str) -> int:
+        return self._positions.get(name, 0)
+
+    async def save(self, name: str, position: int) -> None:
+        self._positions[name] = position
@@ -0,0 +1,75 @@
+import pytest
+import os
+import shutil
+from uuid import uuid4
+from src.application.projections.projection_base import Projection
+from src.domain.training.events import AnnouncementTriggered
+from src.infrastructure.events.store.osu_event_store import OsuFileEventStore
+from src.infrastructure.events.subscriptions.catch_up_subscription import CatchUpSubscription
+from src.infrastructure.events.subscriptions.file_checkpoint_store import FileCheckpointStore
+
+TEST_DIR = ".osu_test_subscriptions"
+
+class AnnouncementLog(Projection):
+    def __init__(self):
+        self.texts = []
+
+    def handle(self, event):
+        if isinstance(event, AnnouncementTriggered):
+            self.texts.append(event.text)
+
+    def clear(self):
+        self.texts.clear()
+
+@pytest.fixture
+def test_dir():
+    if os.path.exists(TEST_DIR):
+        shutil.rmtree(TEST_DIR)
+    yield TEST_DIR
+    shutil.rmtree(TEST_DIR)
+
+def _announce(agg_id, *texts):
+    return [AnnouncementTriggered(session_id=str(agg_id), text=t) for t in texts]
+
+@pytest.mark.anyio
+async def test_read_all_interleaves_streams_in_append_order(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    first, second = uuid4(), uuid4()
+
+    await store.append(first, _announce(first, "a1", "a2"), 0)
+    await store.append(second, _announce(second, "b1"), 0)
+    await store.append(first, _announce(first, "a3"), 2)
+
+    records = [(position, e.text) async for position, e in store.read_all()]
+    assert records == [(1, "a1"), (2, "a2"), (3, "b1"), (4, "a3")]
+
+    tail = [(position, e.text) async for position, e in store.read_all(from_position=2)]
+    assert tail == [(3, "b1"), (4, "a3")]
+
+@pytest.mark.anyio
+async def test_subscription_resumes_from_persisted_checkpoint(test_dir):
+    store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    checkpoints = FileCheckpointStore(base_path=os.path.join(test_dir, "checkpoints"))
+    first, second = uuid4(), uuid4()
+
+    await store.append(first, _announce(first, "a1", "a2"), 0)
+    await store.append(second, _announce(second, "b1"), 0)
+
+    projection = AnnouncementLog()
+    subscription = CatchUpSubscription(store, projection, checkpoints)
+    assert await subscription.catch_up() == 3
+    assert projection.texts == ["a1", "a2", "b1"]
+
+    # Simulate a process restart: new store, new subscription, same checkpoint files
+    await store.append(first, _announce(first, "a3"), 2)
+    restarted_store = OsuFileEventStore(base_path=os.path.join(test_dir, "events"))
+    restarted = AnnouncementLog()
+    subscription = CatchUpSubscription(restarted_store, restarted, FileCheckpointStore(base_path=os.path.join(test_dir, "checkpoints")))
+
+    assert await subscription.catch_up() == 1
+    assert restarted.texts == ["a3"]
+    assert await checkpoints.load(restarted.name) == 4
+
+    # A full rebuild replays from position 0
+    assert await subscription.rebuild() == 4
+    assert restarted.texts == ["a1", "a2", "b1", "a3"]
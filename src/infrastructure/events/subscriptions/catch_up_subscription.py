@@ -0,0 +1,95 @@
+import asyncio
+import inspect
+import logging
+from typing import Optional
+
+from src.application.projections.projection_base import Projection
+from src.infrastructure.events.store.event_store import EventStore
+from src.infrastructure.events.subscriptions.checkpoint_store import CheckpointStore
+
+logger = logging.getLogger(__name__)
+
+class CatchUpSubscription:
+    """
+    Feeds a Projection from the global event log, starting after its last checkpoint.
+
+    On start it catches up on everything appended since the checkpoint, then keeps
+    polling for new events. The checkpoint is persisted every `checkpoint_every`
+    events and after each catch-up pass, so a restart resumes incrementally.
+    Delivery is at-least-once: after a crash, events since the last saved checkpoint
+    are handled again, so projection handlers should be idempotent. The projection
+    is responsible for persisting its own read model alongside the checkpoint.
+    """
+    def __init__(
+        self,
+        event_store: EventStore,
+        projection: Projection,
+        checkpoint_store: CheckpointStore,
+        batch_size: int = 100,
+        checkpoint_every: int = 100,
+        poll_interval: float = 1.0
+    ):
+        self.event_store = event_store
+        self.projection = projection
+        self.checkpoint_store = checkpoint_store
+        self.batch_size = batch_size
+        self.checkpoint_every = checkpoint_every
+        self.poll_interval = poll_interval
+        self.position: Optional[int] = None
+        self._is_async = inspect.iscoroutinefunction(projection.handle)
+        self._running = False
+        self._task = None
+
+    async def catch_up(self) -> int:
+        """Process every event appended since the checkpoint. Returns the number of events handled."""
+        if self.position is None:
+            self.position = await self.checkpoint_store.load(self.projection.name)
+
+        handled = 0
+        async for position, event in self.event_store.read_all(self.position, self.batch_size):
+            if self._is_async:
+                await self.projection.handle(event)
+            else:
+                self.projection.handle(event)
+            self.position = position
+            handled += 1
+            if handled % self.checkpoint_every == 0:
+                await self.checkpoint_store.save(self.projection.name, self.position)
+
+        if handled:
+            await self.checkpoint_store.save(self.projection.name, self.position)
+        return handled
+
+    async def rebuild(self) -> int:
+        """Clear the projection and replay the global log from the beginning."""
+        self.projection.clear()
+        self.position = 0
+        await self.checkpoint_store.save(self.projection.name, 0)
+        return await self.catch_up()
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"Subscription started for projection {self.projection.name}")
+
+    async def stop(self):
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self.position is not None:
+            await self.checkpoint_store.save(self.projection.name, self.position)
+        logger.info(f"Subscription stopped for projection {self.projection.name}")
+
+    async def _loop(self):
+        while self._running:
+            try:
+                await self.catch_up()
+            except Exception as e:
+                logger.error(f"Subscription error in {self.projection.name}: {e}")
+            await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+class CheckpointStore(ABC):
+    """
+    Interface for persisting how far a subscriber has read the global event log.
+    """
+    @abstractmethod
+    async def load(self, name: str) -> int:
+        """Return the last processed global position for `name`, 0 if none."""
+        pass
+
+    @abstractmethod
+    async def save(self, name: str, position: int) -> None:
+        """Record `position` as the last processed global position for `name`."""
+        pass
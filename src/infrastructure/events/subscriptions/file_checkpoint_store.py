@@ -0,0 +1,29 @@
+import os
+import json
+from typing import Optional
+from src.infrastructure._common.storage.atomic_file import atomic_write
+from src.infrastructure._common.storage.fsync_policy import FsyncPolicy
+from src.infrastructure.events.subscriptions.checkpoint_store import CheckpointStore
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    One small JSON file per subscriber.
+    Files are replaced atomically (write temp + rename) so a crash never leaves a torn checkpoint.
+    """
+    def __init__(self, base_path: str = ".osu/persistence/checkpoints", fsync_policy: Optional[FsyncPolicy] = None):
+        self.base_path = base_path
+        self.fsync_policy = fsync_policy or FsyncPolicy()
+        os.makedirs(self.base_path, exist_ok=True)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.base_path, f"{name}.json")
+
+    async def load(self, name: str) -> int:
+        file_path = self._path(name)
+        if not os.path.exists(file_path):
+            return 0
+        with open(file_path, "r") as f:
+            return json.load(f)["position"]
+
+    async def save(self, name: str, position: int) -> None:
+        await atomic_write(self._path(name), json.dumps({"position": position}), self.fsync_policy)
@@ -8,15 +8,21 @@ class InMemorySessionRepository(ISessionRepository):
     def __init__(self, event_store: EventStore):
         self.event_store = event_store
         self._store: Dict[str, TrainingSession] = {}
+        # Stream version each session was last saved at (0 for a new session): the
+        # expected_version of its next append, so a concurrent writer's append is rejected.
+        self._versions: Dict[str, int] = {}
 
     async def save(self, session: TrainingSession) -> None:
+        key = str(session.id)
         # 1. Event Log
         events = session.collect_domain_events()
         if events:
-            await self.event_store.append(session.id, events, expected_version=0)
+            expected_version = self._versions.get(key, 0)
+            await self.event_store.append(session.id, events, expected_version=expected_version)
+            self._versions[key] = expected_version + len(events)
             
         # 2. State Snapshot (In Memory)
-        self._store[str(session.id)] = session
+        self._store[key] = session
 
     async def get_by_id(self, session_id: str) -> Optional[TrainingSession]:
         return self._store.get(str(session_id))
@@ -1,55 +1,253 @@
-import os
-import json
-from typing import Optional
-from typing import Optional, List
-# from uuid import UUID # Not used in the modified code
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
 from src.domain._base.event_bus import EventBus
 from src.domain.training.repositories import ISessionRepository
-from src.domain.training.session import TrainingSession
+from src.domain.training.session import TrainingSession, SessionStatus
+from src.domain.training.events import SessionTicked
 from src.infrastructure.events.store.event_store import EventStore
+from src.infrastructure.events.store.persistence_policy import EventPersistencePolicy
+from src.infrastructure.events.store.snapshot_store import SnapshotStore
+from src.infrastructure.events.store.snapshot_policy import SnapshotPolicy
+from src.infrastructure.events.store.file_snapshot_store import FileSnapshotStore
+from src.infrastructure.events.outbox.outbox_relay import OutboxRelay
+from src.infrastructure._common.storage.fsync_policy import FsyncPolicy
+
+logger = logging.getLogger(__name__)
 
 class OsuSessionRepository(ISessionRepository):
-    def __init__(self, event_store: EventStore, base_path: str = ".osu/persistence/sessions", event_bus: Optional[EventBus] = None):
+    """
+    Sessions are stored as an event stream plus periodic snapshots.
+    Loading restores the latest snapshot and applies only the events stored after it.
+
+    With cache_sessions (the default), the repository is also an identity map:
+    get_by_id serves live sessions from memory and snapshots are written behind,
+    when the snapshot_policy is due, on pause and completion, on eviction, and on
+    close(). The other dirty sessions are flushed by the background flusher when it
+    runs (start()), and otherwise by the saves themselves, every every_seconds.
+    Boundary events (rounds, rests, pauses...) are always appended synchronously;
+    SessionTicked is ephemeral by default, so a crash loses at most the in-phase
+    countdown since the last snapshot (every_seconds of the policy, 5s by default).
+
+    At most `max_sessions` sessions are tracked in memory; the least recently used
+    ones are evicted, and paused or completed sessions are dropped once their
+    snapshot is written. A session saved after it was evicted appends at the
+    version of that snapshot.
+
+    With an outbox_relay, stored events reach the bus through the outbox, which the
+    store writes in the same commit as the events: a crash right after the append
+    delays their side effects instead of losing them. The relay may be shared with
+    other repositories on the same store: saving routes the session's events to this
+    repository's bus, then only wakes the relay up when it runs in the background,
+    and publishes the outbox itself otherwise.
+    Ephemeral events are not stored: they are handed to the running relay, which
+    publishes them after the stored events of the same save, or published directly
+    (after the outbox) when it doesn't run.
+    """
+    def __init__(
+        self,
+        event_store: EventStore,
+        base_path: str = ".osu/persistence/sessions",
+        event_bus: Optional[EventBus] = None,
+        persistence_policy: Optional[EventPersistencePolicy] = None,
+        snapshot_store: Optional[SnapshotStore] = None,
+        snapshot_policy: Optional[SnapshotPolicy] = None,
+        cache_sessions: bool = True,
+        fsync_policy: Optional[FsyncPolicy] = None,
+        outbox_relay: Optional[OutboxRelay] = None,
+        max_sessions: int = 256
+    ):
         self.event_store = event_store
         self.base_path = base_path
         self.event_bus = event_bus
-        os.makedirs(self.base_path, exist_ok=True)
+        self.outbox_relay = outbox_relay
+        self.persistence_policy = persistence_policy or EventPersistencePolicy(ephemeral_types=[SessionTicked])
+        self.snapshot_store = snapshot_store or FileSnapshotStore(
+            TrainingSession, base_path=self.base_path, fsync_policy=fsync_policy
+        )
+        self.cache_sessions = cache_sessions
+        # Without the cache, reads come from disk: snapshot on every save to keep them exact.
+        default_policy = SnapshotPolicy(every_events=None, every_seconds=5.0) if cache_sessions else SnapshotPolicy()
+        self.snapshot_policy = snapshot_policy or default_policy
+        self.max_sessions = max_sessions
+        # session_id -> (events raised since last snapshot, monotonic time of last snapshot)
+        self._since_snapshot: Dict[str, Tuple[int, float]] = {}
+        # Identity map of live sessions, and the state of those whose snapshot is behind, as saved (with its version)
+        self._cache: Dict[str, TrainingSession] = {}
+        self._dirty: Dict[str, Tuple[TrainingSession, int]] = {}
+        # Stream version each session was loaded or last saved at: the expected_version
+        # of its next append, so a concurrent writer's append is rejected, not overwritten.
+        # Kept in least recently used order; it decides which sessions are evicted.
+        self._versions: "OrderedDict[str, int]" = OrderedDict()
+        self._last_sweep = time.monotonic()
+        self._task = None
         # We also need to ensure event store path exists... handled by store itself.
 
     async def save(self, session: TrainingSession) -> None:
         # 1. Collect Events
         events = session.collect_domain_events()
-        
-        # 2. Append to Event Store
+
+        # 2. Append to Event Store (ephemeral events are skipped)
+        key = str(session.id)
+        version = await self._loaded_version(key)
         if events:
-            # Get current version from event store (count of existing events)
-            # For new aggregates, version starts at 0
-            existing_events = await self.event_store.get(session.id)
-            expected_version = len(existing_events)
-            
-            await self.event_store.append(session.id, events, expected_version)
-            
-            # 3. Publish to Bus (Side Effects)
-            if self.event_bus:
+            to_store = self.persistence_policy.to_store(events)
+            if to_store:
+                if self.outbox_relay:
+                    await self.outbox_relay.open()
+                    if self.event_bus:
+                        self.outbox_relay.route(key, self.event_bus)
+                await self.event_store.append(session.id, to_store, version)
+                version += len(to_store)
+
+            # 3. Publish to Bus (Side Effects): stored events first, then the ephemeral ones
+            if self.outbox_relay:
+                if to_store:
+                    if self.outbox_relay.is_running:
+                        self.outbox_relay.notify()
+                    else:
+                        await self.outbox_relay.publish_pending()
+                ephemeral = [event for event in events if self.persistence_policy.is_ephemeral(event)]
+                # A running relay publishes them on its thread too, so the bus is driven from one loop only
+                if ephemeral and self.event_bus and not self.outbox_relay.submit(self.event_bus, ephemeral):
+                    await self.event_bus.publish(ephemeral)
+            elif self.event_bus:
                 await self.event_bus.publish(events)
-        
-        # 4. Save Snapshot (Optimization/Recovery)
-        # We assume TrainingSession (and its sub-models) are Pydantic models
-        file_path = os.path.join(self.base_path, f"{session.id}.json")
-        with open(file_path, "w") as f:
-            f.write(session.model_dump_json(indent=2))
+
+        self._track(key, version)
+        if self.cache_sessions:
+            self._cache[key] = session
+
+        # 4. Save Snapshot according to the snapshot policy, or mark it dirty
+        finished = session.status in (SessionStatus.PAUSED, SessionStatus.COMPLETED)
+        if finished or self._is_snapshot_due(key, len(events)):
+            await self._snapshot(session, version)
+        else:
+            # A copy: the live session may change before the flush, and its snapshot must match `version`
+            self._dirty[key] = (session.model_copy(deep=True), version)
+
+        # Paused and completed sessions are reloaded from their snapshot if needed again
+        if finished:
+            self._forget(key)
+        await self._evict()
+        await self._sweep()
 
     async def get_by_id(self, session_id: str) -> Optional[TrainingSession]:
-        file_path = os.path.join(self.base_path, f"{session_id}.json")
-        if not os.path.exists(file_path):
-            return None
-            
+        key = str(session_id)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-                return TrainingSession(**data)
+            snapshot = await self.snapshot_store.get(session_id)
+            if snapshot is None:
+                return None
+
+            session = snapshot.aggregate
+            # Read up to the version seen now, which is the version the session is loaded at
+            version = await self.event_store.get_version(session_id)
+            async for event in self.event_store.read_stream(
+                session_id, from_version=snapshot.version, to_version=version
+            ):
+                session.apply(event)
         except Exception as e:
             print(f"Error loading session {session_id}: {e}")
             return None
- 
+
+        self._track(key, version)
+        if self.cache_sessions and session.status != SessionStatus.COMPLETED:
+            self._cache[key] = session
+        await self._evict()
+        return session
+
+    async def flush(self) -> int:
+        """Write snapshots of all dirty sessions. Returns how many were written."""
+        dirty = list(self._dirty.values())
+        for session, version in dirty:
+            await self._snapshot(session, version)
+        return len(dirty)
+
+    @property
+    def is_flushing(self) -> bool:
+        """True while the background flusher runs (it stops with its event loop)."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self, interval: Optional[float] = None):
+        """Start the background flusher (defaults to the policy's every_seconds)."""
+        if self.is_flushing:
+            return
+        self._task = asyncio.create_task(self._loop(interval or self._flush_interval()))
+
+    async def close(self) -> None:
+        """Stop the background flusher and write every pending snapshot."""
+        if self.is_flushing:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _loaded_version(self, key: str) -> int:
+        version = self._versions.get(key)
+        if version is None:
+            # Never loaded nor saved here: a new session (no snapshot, its stream must not
+            # exist yet), or one evicted after its snapshot was written at its version.
+            snapshot = await self.snapshot_store.get(key)
+            version = snapshot.version if snapshot is not None else 0
+        return version
+
+    def _track(self, key: str, version: int):
+        self._versions[key] = version
+        self._versions.move_to_end(key)
+
+    def _forget(self, key: str):
+        self._versions.pop(key, None)
+        self._cache.pop(key, None)
+        self._since_snapshot.pop(key, None)
+
+    async def _evict(self):
+        while len(self._versions) > self.max_sessions:
+            key = next(iter(self._versions))
+            dirty = self._dirty.get(key)
+            if dirty is not None:
+                await self._snapshot(*dirty)
+            self._forget(key)
+
+    async def _sweep(self):
+        # Without the background flusher (e.g. no long-lived event loop), saves flush
+        # the dirty sessions, so abandoned ones don't stay behind their events.
+        if self.is_flushing or time.monotonic() - self._last_sweep < self._flush_interval():
+            return
+        self._last_sweep = time.monotonic()
+        await self.flush()
+
+    def _flush_interval(self) -> float:
+        return self.snapshot_policy.every_seconds or 5.0
+
+    def _is_snapshot_due(self, key: str, event_count: int) -> bool:
+        # The first save of a session (in this process) always snapshots
+        if key not in self._since_snapshot:
+            return True
+        events_since, last_snapshot = self._since_snapshot[key]
+        events_since += event_count
+        self._since_snapshot[key] = (events_since, last_snapshot)
+        return self.snapshot_policy.is_due(events_since, time.monotonic() - last_snapshot)
+
+    async def _snapshot(self, session: TrainingSession, version: int):
+        key = str(session.id)
+        await self.snapshot_store.save(session, version)
+        self._since_snapshot[key] = (0, time.monotonic())
+        self._dirty.pop(key, None)
+
+    async def _loop(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Snapshot flush error: {e}")
@@ -3,17 +3,19 @@ import json
 from typing import List, Optional
 from src.domain.training.repositories import IWorkoutRepository
 from src.domain.training.workout import Workout
+from src.infrastructure._common.storage.atomic_file import atomic_write
+from src.infrastructure._common.storage.fsync_policy import FsyncPolicy
 
 class OsuWorkoutRepository(IWorkoutRepository):
-    def __init__(self, base_path: str = ".osu/persistence/workouts"):
+    def __init__(self, base_path: str = ".osu/persistence/workouts", fsync_policy: Optional[FsyncPolicy] = None):
         self.base_path = base_path
+        self.fsync_policy = fsync_policy or FsyncPolicy()
         if not os.path.exists(self.base_path):
             os.makedirs(self.base_path)
 
     async def save(self, workout: Workout) -> None:
         file_path = os.path.join(self.base_path, f"{workout.id}.json")
-        with open(file_path, "w") as f:
-            f.write(workout.model_dump_json(indent=2))
+        await atomic_write(file_path, workout.model_dump_json(indent=2), self.fsync_policy)
 
     async def get_by_id(self, workout_id: str) -> Optional[Workout]:
         file_path = os.path.join(self.base_path, f"{workout_id}.json")
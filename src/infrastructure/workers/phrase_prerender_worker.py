@@ -0,0 +1,129 @@
+import asyncio
+import itertools
+import logging
+import queue
+import threading
+import time
+from typing import Iterable, List, Optional, Set, Tuple
+
+from src.application.audio_service.i_api_audio_service import IApiAudioService
+from src.application.audio_service.dtos import PrefetchBatchRequest
+
+logger = logging.getLogger(__name__)
+
+_STOP = (float("inf"), 0, None, None)
+
+class PhrasePrerenderWorker:
+    """
+    Synthesizes phrases ahead of time on a small pool of threads, earliest first use first.
+
+    Phrases are ordered by their absolute first-use time (submission time + first_use),
+    so the vocabularies of several sessions interleave correctly. Threads are used
+    rather than asyncio tasks so pre-rendering keeps going between the UI's
+    short-lived event loops (Streamlit runs each action in its own asyncio.run).
+
+    Each thread takes up to `batch_size` queued phrases of the same language at once
+    and renders them in a single prefetch_batch call, so a workout's vocabulary is
+    synthesized in one pass instead of one cold call per phrase.
+    """
+    def __init__(self, audio_service: IApiAudioService, workers: int = 1, batch_size: int = 64):
+        self.audio_service = audio_service
+        self.workers = workers
+        self.batch_size = batch_size
+        self.rendered = 0
+        self._queue: "queue.PriorityQueue[Tuple[float, int, str, str]]" = queue.PriorityQueue()
+        self._seen: Set[Tuple[str, str]] = set()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    def submit(self, vocabulary: Iterable[Tuple[int, str]], language: str) -> int:
+        """Queue (first_use, text) phrases not rendered yet. Returns how many were queued."""
+        now = time.monotonic()
+        queued = 0
+        with self._lock:
+            for first_use, text in vocabulary:
+                if (text, language) in self._seen:
+                    continue
+                self._seen.add((text, language))
+                self._queue.put((now + first_use, next(self._seq), text, language))
+                queued += 1
+        return queued
+
+    def start(self):
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._loop, name=f"phrase-prerender-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Phrase pre-render worker started ({self.workers} threads)")
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop after the phrases being rendered; phrases still queued are dropped."""
+        with self._lock:
+            while True:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except queue.Empty:
+                    break
+            for _ in self._threads:
+                self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        logger.info("Phrase pre-render worker stopped")
+
+    def join(self):
+        """Block until every queued phrase has been rendered."""
+        self._queue.join()
+
+    def _forget(self, text: str, language: str):
+        # Let a later submit retry the phrase
+        with self._lock:
+            self._seen.discard((text, language))
+
+    def _take_batch(self) -> List[Tuple[float, int, str, str]]:
+        """Block for the next phrase, then add the following ones queued for the same language."""
+        batch = [self._queue.get()]
+        language = batch[0][3]
+        others = []
+        while batch[0][2] is not None and len(batch) < self.batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[2] is None or item[3] != language:
+                others.append(item)
+            else:
+                batch.append(item)
+        # Phrases of other languages (and stop markers) are left for the next batch
+        for item in others:
+            self._queue.put(item)
+            self._queue.task_done()
+        return batch
+
+    def _loop(self):
+        while True:
+            batch = self._take_batch()
+            texts = [text for _, _, text, _ in batch]
+            language = batch[0][3]
+            try:
+                if texts[0] is None:
+                    return
+                response = asyncio.run(self.audio_service.prefetch_batch(
+                    PrefetchBatchRequest(texts=texts, language=language)
+                ))
+                with self._lock:
+                    self.rendered += len(texts) - len(response.failed)
+                for text in response.failed:
+                    logger.warning(f"Failed to pre-render: {text} - {response.message}")
+                    self._forget(text, language)
+            except Exception as e:
+                logger.error(f"Pre-render error for {texts}: {e}")
+                for text in texts:
+                    self._forget(text, language)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
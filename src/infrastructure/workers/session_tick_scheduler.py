@@ -0,0 +1,164 @@
+import asyncio
+import heapq
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.application.training_service.i_api_training_service import ITrainingService
+from src.application.training_service.dtos.training_request_dtos import TickSessionRequest
+from src.domain.training.events import SessionCompleted, SessionPaused
+from src.domain.training.session import SessionStatus
+
+logger = logging.getLogger(__name__)
+
+class SessionTickScheduler:
+    """
+    Drives the ticks of many running sessions from a single asyncio task.
+
+    Deadlines live in a min-heap keyed on the monotonic clock. Each session's next
+    deadline is its previous deadline + interval (not "now + interval"), so the
+    time spent ticking never accumulates as drift. All sessions due at the same
+    time are ticked together, in batches of `batch_size` run concurrently.
+
+    A session falling behind by up to `max_catch_up` intervals gets its missed ticks
+    one by one; further behind (e.g. host suspended), all of them at once, through
+    a single tick of that many seconds (TrainingSession.advance_to).
+
+    Sessions are unregistered when their tick fails (e.g. unknown session) or
+    reports that the session is no longer running, and, when an event bus is given,
+    as soon as SessionCompleted or SessionPaused is published for them.
+    Resuming a session means registering it again.
+    """
+    def __init__(
+        self,
+        service: ITrainingService,
+        interval: float = 1.0,
+        event_bus=None,
+        batch_size: int = 256,
+        max_catch_up: int = 5
+    ):
+        self.service = service
+        self.interval = interval
+        self.batch_size = batch_size
+        # If the loop falls further behind than this many intervals, the missed ticks
+        # are applied in one step instead of being replayed one by one.
+        self.max_catch_up = max_catch_up
+        # (deadline, generation, session_id); entries whose generation no longer
+        # matches _sessions are stale and dropped when popped.
+        self._heap: List[Tuple[float, int, str]] = []
+        self._sessions: Dict[str, int] = {}
+        self._generation = 0
+        self._wakeup = asyncio.Event()
+        self._running = False
+        self._task = None
+
+        if event_bus is not None:
+            event_bus.subscribe(SessionCompleted, self._on_session_stopped)
+            event_bus.subscribe(SessionPaused, self._on_session_stopped)
+
+    def register(self, session_id: str, first_tick_in: Optional[float] = None):
+        """Schedule a session; its first tick happens one interval from now by default."""
+        self._generation += 1
+        self._sessions[session_id] = self._generation
+        delay = self.interval if first_tick_in is None else first_tick_in
+        heapq.heappush(self._heap, (time.monotonic() + delay, self._generation, session_id))
+        self._wakeup.set()
+
+    def unregister(self, session_id: str):
+        # The heap entry is left in place and skipped lazily
+        self._sessions.pop(session_id, None)
+
+    def is_registered(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    @property
+    def session_count(self) -> int:
+        return len(self._sessions)
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._loop())
+        logger.info("Session tick scheduler started")
+
+    async def stop(self):
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("Session tick scheduler stopped")
+
+    async def run_due(self, now: Optional[float] = None) -> int:
+        """Tick every session whose deadline has passed. Returns the number of ticks issued."""
+        now = time.monotonic() if now is None else now
+        ticked = 0
+        while True:
+            batch = self._pop_due(now)
+            if not batch:
+                return ticked
+            # Ticks due per session: 1, or every missed one once too far behind
+            seconds = [self._due_ticks(deadline, now) for deadline, _, _ in batch]
+            results = await asyncio.gather(
+                *(self._tick(session_id, n) for (_, _, session_id), n in zip(batch, seconds)),
+                return_exceptions=True
+            )
+            for (deadline, generation, session_id), n, ok in zip(batch, seconds, results):
+                if n > 1:
+                    logger.warning(f"Session {session_id} fell behind by {now - deadline:.1f}s, caught up {n} ticks at once")
+                if isinstance(ok, BaseException):
+                    logger.error(f"Tick error for session {session_id}: {ok}")
+                    ok = False
+                # Unregistered (or re-registered) while ticking: don't reschedule this entry
+                if self._sessions.get(session_id) != generation:
+                    continue
+                if not ok:
+                    self.unregister(session_id)
+                    continue
+                heapq.heappush(self._heap, (deadline + n * self.interval, generation, session_id))
+            ticked += len(batch)
+
+    def _pop_due(self, now: float) -> List[Tuple[float, int, str]]:
+        batch = []
+        while self._heap and self._heap[0][0] <= now and len(batch) < self.batch_size:
+            entry = heapq.heappop(self._heap)
+            if self._sessions.get(entry[2]) == entry[1]:
+                batch.append(entry)
+        return batch
+
+    def _due_ticks(self, deadline: float, now: float) -> int:
+        due = int((now - deadline) // self.interval) + 1
+        return due if due > self.max_catch_up else 1
+
+    async def _tick(self, session_id: str, seconds: int = 1) -> bool:
+        """Tick a session. Returns False if it should no longer be scheduled."""
+        result = await self.service.tick_session(TickSessionRequest(session_id=session_id, seconds=seconds))
+        # Without an event bus, the response is what tells that a session stopped
+        return result.success and getattr(result, "status", None) not in (SessionStatus.PAUSED, SessionStatus.COMPLETED)
+
+    async def _on_session_stopped(self, event):
+        self.unregister(event.session_id)
+
+    async def _loop(self):
+        while self._running:
+            # Drop stale entries so the head is the next real deadline
+            while self._heap and self._sessions.get(self._heap[0][2]) != self._heap[0][1]:
+                heapq.heappop(self._heap)
+
+            self._wakeup.clear()
+            timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self.run_due()
+            except Exception as e:
+                logger.error(f"Scheduler error: {e}")
@@ -1,71 +1,29 @@
-import asyncio
 import logging
-from typing import List
 from src.application.training_service.i_api_training_service import ITrainingService
-from src.application.training_service.dtos.training_request_dtos import TickSessionRequest, ListWorkoutsRequest
-# Note: We need a way to list *active sessions*. 
-# The current Service API has `list_workouts` but not `list_active_sessions`.
-# For MVP, we might assume the UI/User provides the Session ID to the worker, 
-# or the worker manages the *current* session ID.
-# Let's assume the Worker is started *for* a specific session, or monitors a shared state.
+from src.infrastructure.workers.session_tick_scheduler import SessionTickScheduler
 
-# Design: A SessionTicker that is instantiated with a Session ID.
-# Or a Global Worker that finds running sessions.
-# Given the "Osu" file repo, we can list files in `sessions/` and check status?
-# But logic should be in Service.
-
-# Let's add `list_active_sessions` to Service? 
-# Or simpler: The UI starts the worker when it starts a session.
-# User Request: "backend worker to deal with the ticking".
-
-# Approach: A class TickerWorker that runs a loop for a specific session_id.
+# Approach: A class TickerWorker that runs the ticks of a specific session_id.
+# It is a single-session front-end over SessionTickScheduler; servers hosting
+# many sessions should share one scheduler and register each session on it.
 
 logger = logging.getLogger(__name__)
 
 class SessionTickerWorker:
-    def __init__(self, service: ITrainingService, interval: float = 1.0):
+    def __init__(self, service: ITrainingService, interval: float = 1.0, event_bus=None):
         self.service = service
         self.interval = interval
+        self.scheduler = SessionTickScheduler(service, interval=interval, event_bus=event_bus)
         self._running = False
-        self._task = None
 
     async def start(self, session_id: str):
         if self._running:
             return
         self._running = True
-        self._task = asyncio.create_task(self._loop(session_id))
+        self.scheduler.register(session_id, first_tick_in=0)
+        await self.scheduler.start()
         logger.info(f"Ticker started for session {session_id}")
 
     async def stop(self):
         self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        await self.scheduler.stop()
         logger.info("Ticker stopped")
-
-    async def _loop(self, session_id: str):
-        while self._running:
-            try:
-                # 1. Tick
-                result = await self.service.tick_session(TickSessionRequest(session_id=session_id))
-                
-                # 2. Check result
-                if not result.success:
-                    # Session might be paused or finished?
-                    # The Service returns success=True/False. 
-                    # If finished, we should probably stop?
-                    # We need to query state to know WHY it failed or if it's done.
-                    pass
-                
-                # 3. Check Status to auto-stop?
-                # Optimization: GetSession request to ensure we stop if COMPLETED.
-                # state = await self.service.get_session(...)
-                # if state.status == COMPLETED: break
-                
-            except Exception as e:
-                logger.error(f"Ticker error: {e}")
-            
-            await asyncio.sleep(self.interval)
@@ -90,9 +90,9 @@ class TrainingPresenter(BasePresenter):
         state = await self.training_service.get_session(GetSessionRequest(session_id=self.session_id))
         self._cached_session_state = state
         
-        # Set coaching listener context if available
+        # Set coaching listener context (and pre-synthesize the vocabulary) if available
         if self.coaching_listener and self._cached_workout_detail:
-            self.coaching_listener.set_session_context(
+            await self.coaching_listener.prepare_session(
                 self.session_id,
                 self._cached_workout_detail
             )
@@ -0,0 +1,34 @@
+"""
+Render the coached audio track of a saved workout to a file.
+Usage: python -m src.scripts.render_workout_audio <workout_id> <output.wav|output.flac> [language] [voice]
+"""
+import asyncio
+import os
+import sys
+import time
+import logging
+from src.infrastructure.training.repositories.osu_workout_repository import OsuWorkoutRepository
+from src.infrastructure.audio.kokoro_audio_service import KokoroAudioService
+from src.infrastructure.audio.workout_audio_renderer import WorkoutAudioRenderer
+
+logging.basicConfig(level=logging.INFO)
+
+async def main(workout_id: str, output: str, language: str = "fr", voice: str = "ff_siwis"):
+    if sys.platform == "darwin":
+        os.environ["PHONEMIZER_ESPEAK_LIBRARY"] = "/opt/homebrew/lib/libespeak-ng.dylib"
+
+    workout = await OsuWorkoutRepository(base_path=".osu/persistence/workouts").get_by_id(workout_id)
+    if workout is None:
+        print(f"✗ Workout {workout_id} not found")
+        return
+
+    renderer = WorkoutAudioRenderer(KokoroAudioService(voice=voice), language=language, voice=voice)
+    started = time.perf_counter()
+    duration = await renderer.render_to_file(workout, output)
+    print(f"✓ Rendered {duration / 60:.1f} min of audio to {output} in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    asyncio.run(main(*sys.argv[1:5]))